@@ -0,0 +1,148 @@
+"""Throughput of the cipher-wheel and Morse codecs.
+
+Times the table-driven codecs in ``puzzles/codec.py`` against the obvious
+character-at-a-time versions on the same text (the streaming Morse decoder
+against splitting the whole signal at once), and how many enciphered
+intercepts - template, cipher and Morse - can be written per second, which
+is what a server pays per player per tick when it hands out transmissions.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_codec
+    python -m benchmarks.bench_codec --chars 1000000 --repeat 5 --intercepts 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import time
+from typing import Callable, Dict, List
+
+from emerald_shadows.puzzles.codec import (
+    ALPHABET, MORSE_CODE, MorseDecoder, decode_morse, encode_morse, intercept, wheel,
+)
+
+KEY = "ANGELS"
+_FROM_MORSE = {code: char for char, code in MORSE_CODE.items()}
+
+
+def per_char_vigenere(text: str, key: str, sign: int = 1) -> str:
+    """The straightforward cipher wheel: one modular shift per letter."""
+    shifts = [ALPHABET.index(letter) for letter in key.upper()]
+    out: List[str] = []
+    position = 0
+    for char in text:
+        if "A" <= char <= "Z" or "a" <= char <= "z":
+            base = ord("A") if char <= "Z" else ord("a")
+            shift = shifts[position % len(shifts)] * sign
+            out.append(chr((ord(char) - base + shift) % 26 + base))
+            position += 1
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+def per_char_morse(text: str) -> str:
+    return " / ".join(
+        " ".join(MORSE_CODE[char] for char in word.upper() if char in MORSE_CODE) for word in text.split()
+    )
+
+
+def split_decode_morse(signal: str) -> str:
+    """Decode by splitting on gaps and looking each letter up, all at once."""
+    return " ".join(
+        "".join(_FROM_MORSE.get(code, "?") for code in word.split()) for word in signal.split("/")
+    )
+
+
+def sample_text(chars: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    words = []
+    length = 0
+    while length < chars:
+        word = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(2, 9)))
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:chars]
+
+
+def _rate(func: Callable[[], object], units: int, repeat: int) -> float:
+    """Units processed per second, best of repeat."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return units / best
+
+
+def bench(chars: int, repeat: int, intercepts: int) -> Dict[str, Dict[str, float]]:
+    text = sample_text(chars)
+    cipher = wheel(KEY)
+    enciphered = cipher.encode(text)
+    signal = encode_morse(text)
+    assert cipher.decode(enciphered) == text == per_char_vigenere(enciphered, KEY, -1)
+    assert decode_morse(signal) == split_decode_morse(signal) == text.upper()
+
+    def streamed() -> str:
+        decoder = MorseDecoder()
+        pieces = [decoder.feed(signal[i:i + 1024]) for i in range(0, len(signal), 1024)]
+        return "".join(pieces) + decoder.finish()
+
+    rng = random.Random(1)
+    return {
+        "vigenere encode": {
+            "codec": _rate(lambda: cipher.encode(text), chars, repeat),
+            "baseline": _rate(lambda: per_char_vigenere(text, KEY), chars, repeat),
+        },
+        "vigenere decode": {
+            "codec": _rate(lambda: cipher.decode(enciphered), chars, repeat),
+            "baseline": _rate(lambda: per_char_vigenere(enciphered, KEY, -1), chars, repeat),
+        },
+        "morse encode": {
+            "codec": _rate(lambda: encode_morse(text), chars, repeat),
+            "baseline": _rate(lambda: per_char_morse(text), chars, repeat),
+        },
+        "morse decode": {
+            "codec": _rate(streamed, chars, repeat),
+            "baseline": _rate(lambda: split_decode_morse(signal), chars, repeat),
+        },
+        "intercepts": {
+            "codec": _rate(lambda: [intercept(KEY, 22, rng) for _ in range(intercepts)], intercepts, repeat),
+        },
+    }
+
+
+def report(chars: int, table: Dict[str, Dict[str, float]]) -> str:
+    lines = [f"{'operation':<18}{'codec':>16}{'baseline':>16}{'speedup':>10}"]
+    for name, rates in table.items():
+        baseline = rates.get("baseline")
+        lines.append(
+            f"{name:<18}{rates['codec']:>14,.0f}/s"
+            + (f"{baseline:>14,.0f}/s{rates['codec'] / baseline:>9.1f}x" if baseline else "")
+        )
+    lines.append("")
+    lines.append(
+        f"Rates are characters per second over {chars:,} characters of text, and intercepts "
+        "per second. Baselines: a modular shift per letter; a dict lookup per letter; "
+        "Morse split on gaps in one pass rather than streamed in 1 KB pieces."
+    )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chars", type=int, default=200_000, help="characters of text per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per timing; the best counts")
+    parser.add_argument("--intercepts", type=int, default=10_000, help="intercepts written per run")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    table = bench(args.chars, args.repeat, args.intercepts)
+    print(report(args.chars, table))
+
+
+if __name__ == "__main__":
+    main()
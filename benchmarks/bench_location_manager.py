@@ -0,0 +1,110 @@
+"""Scaling benchmark for LocationManager on synthetic worlds.
+
+Times the LocationManager code paths that run per session or per turn against
+generated worlds of increasing size, then reports how each one grows. A
+growth factor close to the size ratio means the path is linear in world size.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_location_manager
+    python -m benchmarks.bench_location_manager --sizes 1000 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import math
+import time
+from typing import Callable, Dict, List
+
+from emerald_shadows.content import build_content
+from emerald_shadows.location_manager import LocationManager
+from emerald_shadows.tools.worldgen import START_ROOM, generate_items, generate_world, room_name
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+def _time(func: Callable[[], object], repeat: int) -> float:
+    """Return the mean wall time of ``func`` in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def bench_size(rooms: int, repeat: int) -> Dict[str, float]:
+    """Time every benchmarked operation for one world size."""
+    results: Dict[str, float] = {}
+
+    start = time.perf_counter()
+    world = generate_world(rooms)
+    content = build_content(world, generate_items(rooms), start=START_ROOM)
+    results["build_content"] = (time.perf_counter() - start) * 1000
+    del world
+
+    results["init"] = _time(lambda: LocationManager(content), max(1, repeat // 10))
+    manager = LocationManager(content)
+    game_state: Dict[str, bool] = {}
+
+    def round_trip() -> None:
+        manager.move_to_location("east", game_state)
+        manager.move_to_location("west", game_state)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        results["move_to_location"] = _time(round_trip, repeat) / 2
+    results["get_location_description"] = _time(manager.get_location_description, repeat)
+
+    state = manager.get_state()
+    results["get_state"] = _time(manager.get_state, max(1, repeat // 10))
+    results["save_bytes_kb"] = len(json.dumps(state)) / 1024
+    results["restore_state"] = _time(lambda: manager.restore_state(state), max(1, repeat // 10))
+
+    far_corner = room_name(rooms - 1)
+    results["find_path"] = _time(lambda: manager.find_path(far_corner), max(1, repeat // 10))
+    return results
+
+
+def report(sizes: List[int], table: List[Dict[str, float]]) -> str:
+    """Format results with a growth column comparing the two largest sizes."""
+    lines = []
+    header = f"{'operation':<26}" + "".join(f"{size:>14,}" for size in sizes)
+    if len(sizes) > 1:
+        header += f"{'growth':>10}"
+    lines.append(header)
+    lines.append("-" * len(header))
+    for key in table[0]:
+        row = f"{key:<26}" + "".join(f"{results[key]:>14.3f}" for results in table)
+        if len(sizes) > 1 and table[-2][key] > 0:
+            growth = table[-1][key] / table[-2][key]
+            size_ratio = sizes[-1] / sizes[-2]
+            exponent = math.log(growth) / math.log(size_ratio) if growth > 0 else 0.0
+            marker = "  LINEAR" if exponent > 0.7 else ""
+            row += f"{growth:>9.1f}x{marker}"
+        lines.append(row)
+    lines.append("")
+    lines.append("Times are milliseconds per call; save_bytes_kb is the JSON save size.")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=200, help="calls per timed operation")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    sizes = sorted(args.sizes)
+    table = []
+    for rooms in sizes:
+        print(f"Benchmarking {rooms:,} rooms...", flush=True)
+        table.append(bench_size(rooms, args.repeat))
+    print()
+    print(report(sizes, table))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Bytes on the wire and CPU cost of MCCP compression for telnet sessions.
+
+Plays a scripted session through GameManager, captures each turn's output
+as the telnet front end would send it, then compresses it the way
+``TelnetSession`` does - one zlib stream per connection with a sync flush at
+every turn boundary - at several zlib levels. Reports bytes per session, the
+ratio to uncompressed output, what the per-turn flushes cost over compressing
+the whole session at once, and CPU time.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_mccp
+    python -m benchmarks.bench_mccp --turns 500 --levels 1 6 9 --sessions 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import logging
+import time
+import zlib
+from itertools import cycle, islice
+from typing import Dict, List
+
+from emerald_shadows.game_manager import GameManager
+
+DEFAULT_LEVELS = (1, 6, 9)
+
+# A player poking around the station: look, move, take, examine, repeat
+SESSION_SCRIPT = (
+    "look", "take badge", "examine badge", "take case_file", "examine case_file",
+    "inventory", "go upstairs", "look", "take photo", "examine photo",
+    "take cipher_wheel", "inventory", "go downstairs", "look", "exits",
+    "score", "help", "go upstairs", "look", "go downstairs",
+)
+
+
+def capture_turns(turns: int) -> List[bytes]:
+    """Each turn's output of a scripted session, encoded for the wire."""
+    game = GameManager()
+    outputs = []
+    for command in islice(cycle(SESSION_SCRIPT), turns):
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            game.handle_line(command)
+            # Keep the session going over and over the same rooms
+            game._last_location = None
+        outputs.append(buffer.getvalue().replace("\n", "\r\n").encode("utf-8") + b"\r\n> ")
+    return outputs
+
+
+def compress_session(outputs: List[bytes], level: int) -> int:
+    """Bytes sent for a session: one stream, sync-flushed after every turn."""
+    compressor = zlib.compressobj(level)
+    sent = 0
+    for output in outputs:
+        sent += len(compressor.compress(output)) + len(compressor.flush(zlib.Z_SYNC_FLUSH))
+    return sent + len(compressor.flush(zlib.Z_FINISH))
+
+
+def bench_level(outputs: List[bytes], level: int, sessions: int) -> Dict[str, float]:
+    raw = sum(len(output) for output in outputs)
+    start = time.process_time()
+    for _ in range(sessions):
+        sent = compress_session(outputs, level)
+    cpu = (time.process_time() - start) / sessions
+    whole = len(zlib.compress(b"".join(outputs), level))
+    return {
+        "bytes": sent,
+        "ratio": sent / raw,
+        "flush_overhead": sent / whole - 1,
+        "cpu_ms": cpu * 1000,
+        "cpu_us_per_turn": cpu * 1e6 / len(outputs),
+    }
+
+
+def report(raw: int, turns: int, table: Dict[int, Dict[str, float]]) -> str:
+    lines = [
+        f"{'level':<8}{'bytes/session':>16}{'of raw':>10}{'flush cost':>12}{'CPU ms':>10}{'CPU us/turn':>13}",
+        f"{'off':<8}{raw:>16,}{1:>10.1%}{'':>12}{'':>10}{'':>13}",
+    ]
+    for level, results in table.items():
+        lines.append(
+            f"{level:<8}{results['bytes']:>16,.0f}{results['ratio']:>10.1%}"
+            f"{results['flush_overhead']:>+12.1%}{results['cpu_ms']:>10.3f}{results['cpu_us_per_turn']:>13.1f}"
+        )
+    lines.append("")
+    lines.append(
+        f"{turns} turns per session. 'flush cost' is the size over compressing the whole "
+        "session at once; CPU is compression only, per session."
+    )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=200, help="turns per scripted session")
+    parser.add_argument("--levels", type=int, nargs="+", default=list(DEFAULT_LEVELS), help="zlib levels")
+    parser.add_argument("--sessions", type=int, default=20, help="sessions compressed per timing")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    print(f"Capturing a {args.turns}-turn session...", flush=True)
+    outputs = capture_turns(args.turns)
+    raw = sum(len(output) for output in outputs)
+    table = {level: bench_level(outputs, level, args.sessions) for level in args.levels}
+    print()
+    print(report(raw, args.turns, table))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Cost of tuning and scanning the simulated radio band.
+
+Times a full scan - every dial setting either side of the frequency, each
+rendered and metered - as one batched NumPy computation, the way the radio
+puzzle runs it, and what many players scanning at once cost. For scale, it
+also times the same mix computed sample by sample in Python on a sliver of
+the audio and extrapolates.
+
+Needs NumPy. Run from the repository root:
+
+    python -m benchmarks.bench_radio_band
+    python -m benchmarks.bench_radio_band --players 500 --span 2.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import math
+import sys
+import time
+from typing import Dict, List
+
+from emerald_shadows.config import RADIO_SAMPLE_RATE, RADIO_SCAN_SECONDS
+from emerald_shadows.puzzles import radio_band
+from emerald_shadows.puzzles.variants import generate_variant
+
+
+def per_sample_mix(band: "radio_band.BandSimulator", frequencies: List[float], samples: int) -> List[List[float]]:
+    """The band mixed one sample at a time, without NumPy's help."""
+    programmes = [programme.tolist() for programme in band._programmes]
+    rows = []
+    for frequency in frequencies:
+        gains = [
+            station.strength * math.exp(-((frequency - station.frequency) / radio_band.BANDWIDTH_MHZ) ** 2)
+            for station in band.stations
+        ]
+        row = []
+        for tick in range(samples):
+            value = 0.0
+            for gain, programme in zip(gains, programmes):
+                value += gain * programme[tick % len(programme)]
+            row.append(value)
+        rows.append(row)
+    return rows
+
+
+def bench(players: int, span: float, seconds: float) -> Dict[str, float]:
+    # Players spread over a handful of variants, as on a busy server
+    bands = [radio_band.simulator(generate_variant(seed)) for seed in range(8)]
+    start = time.perf_counter()
+    for band in bands:
+        band.scan([400.0], seconds)  # build each band's programmes outside the timing
+    warmup = time.perf_counter() - start
+
+    settings = [
+        radio_band.scan_frequencies(band.stations[0].frequency, span) for band in bands
+    ]
+    start = time.perf_counter()
+    for player in range(players):
+        band = bands[player % len(bands)]
+        band.scan(settings[player % len(bands)], seconds)
+    batched = (time.perf_counter() - start) / players
+
+    sliver = max(1, int(RADIO_SAMPLE_RATE * seconds) // 50)
+    start = time.perf_counter()
+    per_sample_mix(bands[0], settings[0], sliver)
+    looped = (time.perf_counter() - start) * int(RADIO_SAMPLE_RATE * seconds) / sliver
+
+    return {
+        "settings": len(settings[0]),
+        "samples": len(settings[0]) * int(RADIO_SAMPLE_RATE * seconds),
+        "warmup_ms": warmup * 1000,
+        "scan_ms": batched * 1000,
+        "scans_per_s": 1 / batched,
+        "loop_ms": looped * 1000,
+    }
+
+
+def report(players: int, results: Dict[str, float]) -> str:
+    return "\n".join([
+        f"One scan: {results['settings']:.0f} dial settings, {results['samples']:,.0f} samples",
+        f"  batched NumPy, rendered and metered   {results['scan_ms']:>10.2f} ms"
+        f"   ({results['scans_per_s']:,.0f} scans/s)",
+        f"  per-sample Python, mixing only (est.) {results['loop_ms']:>10.2f} ms"
+        f"   ({results['loop_ms'] / results['scan_ms']:,.0f}x slower)",
+        f"  {players} players scanning at once      {results['scan_ms'] * players:>10.1f} ms of CPU",
+        f"  programmes synthesized once per variant: {results['warmup_ms']:.1f} ms for 8 variants",
+    ])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=200, help="scans to time, one per player")
+    parser.add_argument("--span", type=float, default=1.0, help="MHz either side of the dial")
+    parser.add_argument("--seconds", type=float, default=RADIO_SCAN_SECONDS, help="audio per dial setting")
+    args = parser.parse_args()
+
+    if not radio_band.available():
+        sys.exit("The radio band simulator needs NumPy: pip install numpy")
+    logging.disable(logging.INFO)
+    print(report(args.players, bench(args.players, args.span, args.seconds)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Cost of tracing partial plates in the vehicle registry.
+
+Builds the synthetic registry at each size and times the traces players run
+- wildcard plates, makes and owners - answered from the prefix, suffix,
+trigram and per-position indexes, against the same traces answered by reading every
+registration. The index build is paid once per process; the traces are what
+every session pays.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_registry
+    python -m benchmarks.bench_registry --sizes 1000000 --players 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from emerald_shadows.config import REGISTRY_RESULTS
+from emerald_shadows.puzzles.vehicle_registry import VehicleRegistry
+
+# (plate, make, owner) as a player might phone them in
+TRACES: List[Tuple[str, Optional[str], Optional[str]]] = [
+    ("7?3-K*", None, None),
+    ("WA-44??", None, None),
+    ("*4471", None, None),
+    ("WA-4471", None, None),
+    ("?B-*9", None, None),
+    ("??3-?9?", None, None),
+    ("*-K*", None, None),
+    ("*", "Ford", "Sullivan"),
+    ("*K*", None, "Northwest"),
+    ("1*", "Hudson", None),
+]
+
+
+def _time(run, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    return (time.perf_counter() - start) / repeat
+
+
+def bench(size: int, repeat: int) -> Dict[str, float]:
+    registry = VehicleRegistry(size)
+    limit = REGISTRY_RESULTS + 1
+    indexed, scanned = [], []
+    for plate, make, owner in TRACES:
+        indexed.append(_time(lambda: registry.search(plate, make, owner, limit), repeat))
+        scanned.append(_time(lambda: registry.scan(plate, make, owner, limit), 1))
+    return {
+        "size": size,
+        "build_s": registry.build_seconds,
+        "indexed_ms": sum(indexed) / len(indexed) * 1000,
+        "worst_ms": max(indexed) * 1000,
+        "scan_ms": sum(scanned) / len(scanned) * 1000,
+    }
+
+
+def report(players: int, results: List[Dict[str, float]]) -> str:
+    lines = [
+        f"{'registrations':>13} {'build':>8} {'indexed':>10} {'worst':>9} {'full scan':>11} {'speedup':>8}"
+        f"   {players} players at once",
+    ]
+    for row in results:
+        lines.append(
+            f"{row['size']:>13,.0f} {row['build_s']:>7.2f}s {row['indexed_ms']:>8.3f}ms {row['worst_ms']:>7.3f}ms"
+            f" {row['scan_ms']:>9.1f}ms {row['scan_ms'] / row['indexed_ms']:>7,.0f}x"
+            f"   {row['indexed_ms'] * players:>7.1f}ms vs {row['scan_ms'] * players / 1000:,.1f}s"
+        )
+    lines.append(f"Averaged over {len(TRACES)} traces, {REGISTRY_RESULTS + 1} registrations read back at most.")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000],
+                        help="registry sizes to build")
+    parser.add_argument("--repeat", type=int, default=200, help="times each indexed trace is run")
+    parser.add_argument("--players", type=int, default=200, help="players tracing at once, for scale")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    print(report(args.players, [bench(size, args.repeat) for size in args.sizes]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Tab completion for the interactive prompt.
+
+Completions come from two prefix tries: one of verbs, built once, and one of
+the names in scope - the current location's exits, the items lying here and
+the items in hand. The scope trie is patched with just the names that came
+or went when the player moves, picks something up or drops it; a keypress
+only walks the trie.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .natural_commands import CHAIN_SEPARATORS
+from .vocabulary import surface_forms
+
+# Where the noun being completed starts: after the verb, or after a separator
+# between several combined items
+_NOUN_SEPARATORS = re.compile(r"(?:,\s*|\s(?:with|and|&|on|in|into)\s)")
+_ARTICLE = re.compile(r"(?:the|an?)\s+")
+
+
+class _Node:
+    __slots__ = ("children", "word")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_Node"] = {}
+        self.word: Optional[str] = None
+
+
+class PrefixTrie:
+    """A set of words supporting insertion, removal and prefix listing."""
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        self._root = _Node()
+        self._size = 0
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, word: object) -> bool:
+        node = self._find(word) if isinstance(word, str) else None
+        return node is not None and node.word is not None
+
+    def add(self, word: str) -> None:
+        node = self._root
+        for char in word:
+            node = node.children.setdefault(char, _Node())
+        if node.word is None:
+            node.word = word
+            self._size += 1
+
+    def discard(self, word: str) -> None:
+        """Remove a word if present, pruning branches left empty."""
+        path: List[Tuple[_Node, str]] = []
+        node = self._root
+        for char in word:
+            child = node.children.get(char)
+            if child is None:
+                return
+            path.append((node, char))
+            node = child
+        if node.word is None:
+            return
+        node.word = None
+        self._size -= 1
+        for parent, char in reversed(path):
+            child = parent.children[char]
+            if child.children or child.word is not None:
+                break
+            del parent.children[char]
+
+    def complete(self, prefix: str) -> List[str]:
+        """Every word starting with prefix, in sorted order."""
+        node = self._find(prefix)
+        return sorted(self._words(node)) if node is not None else []
+
+    def _find(self, prefix: str) -> Optional[_Node]:
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    @staticmethod
+    def _words(node: _Node) -> Iterator[str]:
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            if node.word is not None:
+                yield node.word
+            pending.extend(node.children.values())
+
+
+class TabCompleter:
+    """Readline completer for a running GameManager."""
+
+    def __init__(self, game: Any) -> None:
+        self.game = game
+        handler = game.command_handler
+        self.verbs = PrefixTrie([
+            *handler.single_word_aliases, *handler.verb_aliases,
+            *handler.trolley_commands,
+            *(word for word in handler.direction_aliases if len(word) > 1),
+        ])
+        self.nouns = PrefixTrie()
+        self._scope: Set[str] = set()
+        self._exits: Set[str] = set()
+        self._signature: Optional[Hashable] = None
+        self._matches: List[str] = []
+
+    def refresh(self) -> None:
+        """Bring the scope trie up to date if the player's surroundings changed."""
+        game = self.game
+        location_manager = game.location_manager
+        signature = (
+            location_manager.current_location,
+            game.item_manager.inventory.version,
+            len(location_manager.locations[location_manager.current_location].items),
+            game.content.generation,
+        )
+        if signature == self._signature:
+            return
+        self._signature = signature
+
+        exits = set(location_manager.get_valid_exits())
+        scope = set(exits)
+        for name in (*location_manager.get_available_items(), *game.item_manager.get_inventory()):
+            scope.update(surface_forms(name))
+        for word in self._scope - scope:
+            self.nouns.discard(word)
+        for word in scope - self._scope:
+            self.nouns.add(word)
+        self._scope = scope
+        self._exits = exits
+
+    def candidates(self, line: str) -> List[str]:
+        """Full-line completions for what has been typed so far."""
+        self.refresh()
+        # Chained commands: only the last one on the line is completed
+        chained = list(CHAIN_SEPARATORS.finditer(line))
+        head = line[:chained[-1].end()] if chained else ""
+        command = line[len(head):].lower()
+
+        if " " not in command:
+            words = self.verbs.complete(command)
+            words += [name for name in self.nouns.complete(command) if name in self._exits]
+            return [head + word for word in sorted(set(words))]
+
+        separators = list(_NOUN_SEPARATORS.finditer(command))
+        start = separators[-1].end() if separators else command.index(" ") + 1
+        article = _ARTICLE.match(command, start)
+        if article:
+            start = article.end()
+        prefix = command[start:]
+        return [head + command[:start] + word for word in self.nouns.complete(prefix)]
+
+    def complete(self, text: str, state: int) -> Optional[str]:
+        """The readline completer protocol: return the state-th match."""
+        try:
+            if state == 0:
+                self._matches = self.candidates(text)
+            return self._matches[state] if state < len(self._matches) else None
+        except Exception as e:
+            logging.error(f"Error completing '{text}': {e}")
+            return None
+
+
+def install_completion(game: Any) -> Optional[TabCompleter]:
+    """Register tab completion with readline, where readline is available."""
+    try:
+        import readline
+    except ImportError:
+        return None
+    completer = TabCompleter(game)
+    # Complete against the whole line so multi-word names ("cipher wheel") work
+    readline.set_completer_delims("")
+    readline.set_completer(completer.complete)
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+    return completer
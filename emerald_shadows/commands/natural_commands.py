@@ -2,10 +2,82 @@
 
 from __future__ import annotations
 
-from typing import Dict, Tuple
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from ..config import PARSE_CACHE_SIZE
+from .vocabulary import Vocabulary
 
 _ARTICLES = {"the", "a", "an"}
 
+# Separators between chained commands: "take all. go upstairs; take photo then examine it".
+# A full stop only ends a command before a space or the end of the line, so
+# "tune 415.6" keeps its decimal point.
+CHAIN_SEPARATORS = re.compile(r"\s*(?:[.;]*;[.;]*|\.+(?=\s|$)|\b(?:and\s+)?then\b)\s*")
+
+# Separators between the items of one combine command: "photo, manifest and minutes".
+COMBINE_SEPARATORS = re.compile(r"\s*,\s*|\s+(?:with|and|&)\s+")
+
+# Declarative verb grammar, compiled once into a dispatch table keyed by the
+# first word of the input.
+#   verbs         words that introduce the command
+#   particles     words that may follow the verb and are dropped ("pick up",
+#                 "go to"); each names the command it leads to, so "look at"
+#                 becomes examine
+#   prepositions  split the rest into an object and a target ("use badge on
+#                 bartender"); each maps to (command, joiner) where joiner
+#                 rebuilds the argument as object + joiner + target, or None
+#                 to pass the object alone
+COMMAND_GRAMMAR: Dict[str, Dict[str, Any]] = {
+    "go": {
+        "verbs": ["go", "move", "travel", "walk"],
+        "particles": {"to": "go"},
+    },
+    "take": {
+        "verbs": ["take", "grab", "get", "pick"],
+        "particles": {"up": "take"},
+        "prepositions": {"from": ("take", None), "off": ("take", None)},
+    },
+    "examine": {
+        "verbs": ["examine", "inspect", "read"],
+    },
+    "look": {
+        "verbs": ["look"],
+        "particles": {"at": "examine"},
+    },
+    "use": {
+        "verbs": ["use"],
+        "prepositions": {"on": ("use", None), "with": ("use", None), "in": ("use", None)},
+    },
+    "combine": {
+        "verbs": ["combine", "mix"],
+    },
+    "solve": {
+        "verbs": ["solve"],
+    },
+    "tune": {
+        "verbs": ["tune", "dial"],
+        "particles": {"to": "tune", "in": "tune"},
+        "prepositions": {"to": ("tune", " to ")},
+    },
+    "scan": {
+        "verbs": ["scan", "sweep"],
+    },
+    "trace": {
+        "verbs": ["trace", "lookup"],
+    },
+    "drop": {
+        "verbs": ["drop", "leave", "put", "discard"],
+        "particles": {"down": "drop"},
+        "prepositions": {
+            "in": ("combine", " with "),
+            "into": ("combine", " with "),
+            "inside": ("combine", " with "),
+        },
+    },
+}
+
 
 def _strip_articles(text: str) -> str:
     """Remove leading articles from a noun phrase: 'the note' -> 'note'."""
@@ -15,10 +87,55 @@ def _strip_articles(text: str) -> str:
     return " ".join(words)
 
 
-class NaturalCommandHandler:
-    """Translate player input into normalized commands the game understands."""
+class ParsedCommand(NamedTuple):
+    """Player input reduced to a command, its object and an optional target."""
+    command: str
+    argument: str = ""
+    preposition: str = ""
+    target: str = ""
+
+
+class VerbRule(NamedTuple):
+    """One compiled grammar entry."""
+    command: str
+    particles: Mapping[str, str]
+    prepositions: Mapping[str, Tuple[str, Optional[str]]]
+
+
+def compile_grammar(grammar: Mapping[str, Mapping[str, Any]]) -> Dict[str, VerbRule]:
+    """Compile a verb grammar into a dispatch table keyed by verb word.
+
+    Raises:
+        ValueError: if one word introduces two different commands.
+    """
+    table: Dict[str, VerbRule] = {}
+    for command, entry in grammar.items():
+        rule = VerbRule(
+            command,
+            dict(entry.get("particles", {})),
+            dict(entry.get("prepositions", {})),
+        )
+        for verb in entry["verbs"]:
+            if verb in table and table[verb].command != command:
+                raise ValueError(f"'{verb}' is both {table[verb].command} and {command}")
+            table[verb] = rule
+    return table
+
+
+class Grammar:
+    """Every table the parser reads: directions, single-word commands,
+    the compiled verb grammar, whole phrases and trolley commands.
+
+    Parses are cached by grammar and input, so a grammar's tables must not
+    change once it is in use; build a new Grammar instead.
+    """
 
-    def __init__(self) -> None:
+    __slots__ = (
+        "direction_aliases", "single_word_aliases", "rules", "verb_aliases",
+        "phrase_aliases", "trolley_commands",
+    )
+
+    def __init__(self, verbs: Mapping[str, Mapping[str, Any]] = COMMAND_GRAMMAR) -> None:
         self.direction_aliases: Dict[str, str] = {
             "n": "north",
             "s": "south",
@@ -53,71 +170,137 @@ class NaturalCommandHandler:
             "ways": "exits",
         }
 
-        self.verb_aliases: Dict[str, str] = {
-            "go": "go",
-            "move": "go",
-            "travel": "go",
-            "walk": "go",
-            "take": "take",
-            "grab": "take",
-            "get": "take",
-            "pick": "take",
-            "examine": "examine",
-            "inspect": "examine",
-            "read": "examine",
-            "look": "look",
-            "use": "use",
-            "combine": "combine",
-            "mix": "combine",
-            "solve": "solve",
-            "drop": "drop",
-            "leave": "drop",
-            "put": "drop",
-            "discard": "drop",
+        self.rules: Dict[str, VerbRule] = compile_grammar(verbs)
+        self.verb_aliases: Dict[str, str] = {verb: rule.command for verb, rule in self.rules.items()}
+
+        # Whole-phrase commands that don't follow the verb-first pattern
+        self.phrase_aliases: Dict[str, Tuple[str, str]] = {
+            "what goes together": ("combine", "all"),
+            "what fits together": ("combine", "all"),
         }
 
         self.trolley_commands = {"next", "off", "status", "history"}
 
-    def understand_command(self, raw_command: str) -> Tuple[str, str]:
-        """Return the normalized command type and argument string."""
-        if not raw_command:
-            return "", ""
 
-        command = raw_command.strip().lower()
-        if not command:
-            return "", ""
+DEFAULT_GRAMMAR = Grammar()
 
-        words = command.split()
-        first_word = words[0]
 
-        # Handle trolley commands directly
-        if first_word in self.trolley_commands:
-            return first_word, ""
+def _apply_rule(rule: VerbRule, words: List[str]) -> ParsedCommand:
+    """Match the words after the verb against a compiled grammar entry."""
+    command = rule.command
+    words = _strip_articles(" ".join(words)).split()
 
-        # "look at <item>" → examine <item>
-        if command.startswith("look at "):
-            noun = _strip_articles(command[len("look at "):].strip())
-            return "examine", noun
+    # A particle only counts when something follows it: "get up" is left alone
+    if len(words) > 1 and words[0] in rule.particles:
+        command = rule.particles[words[0]]
+        words = _strip_articles(" ".join(words[1:])).split()
 
-        # Single word commands (inventory, help, look, score, etc.)
-        if command in self.single_word_aliases:
-            return self.single_word_aliases[command], ""
+    for index, word in enumerate(words[1:], 1):
+        if word in rule.prepositions and index < len(words) - 1:
+            command, joiner = rule.prepositions[word]
+            obj = _strip_articles(" ".join(words[:index]))
+            target = _strip_articles(" ".join(words[index + 1:]))
+            argument = obj if joiner is None else obj + joiner + target
+            return ParsedCommand(command, argument, word, target)
 
-        # Direction-only commands ("north")
-        if first_word in self.direction_aliases and len(words) == 1:
-            return "go", self.direction_aliases[first_word]
+    return ParsedCommand(command, " ".join(words))
 
-        # Explicit "go" commands or direction synonyms
-        if first_word in self.direction_aliases:
-            return "go", self.direction_aliases[first_word]
 
-        verb = self.verb_aliases.get(first_word)
-        if not verb:
-            return "", ""
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_command(grammar: Grammar, command: str) -> ParsedCommand:
+    """Parse normalized (stripped, lower-case) input with a grammar.
 
-        argument = _strip_articles(command[len(first_word):].strip())
-        if verb == "go" and argument.startswith("to "):
-            argument = argument[3:].strip()
-        if verb == "take" and argument.startswith("up "):
-            argument = _strip_articles(argument[3:].strip())
-        return verb, argument
+    The parse depends only on the grammar and the text, so one cache serves
+    every handler, and every session, sharing a grammar.
+    """
+    phrase = grammar.phrase_aliases.get(command.rstrip("?!. "))
+    if phrase:
+        return ParsedCommand(*phrase)
+
+    words = command.split()
+    first_word = words[0]
+
+    # Handle trolley commands directly
+    if first_word in grammar.trolley_commands:
+        return ParsedCommand(first_word)
+
+    # Single word commands (inventory, help, look, score, etc.)
+    if command in grammar.single_word_aliases:
+        return ParsedCommand(grammar.single_word_aliases[command])
+
+    # Direction commands ("north", "n", "north side docks")
+    if first_word in grammar.direction_aliases:
+        return ParsedCommand("go", grammar.direction_aliases[first_word])
+
+    rule = grammar.rules.get(first_word)
+    if rule is None:
+        return ParsedCommand("")
+    return _apply_rule(rule, words[1:])
+
+
+class NaturalCommandHandler:
+    """Translate player input into normalized commands the game understands."""
+
+    def __init__(self, grammar: Grammar = DEFAULT_GRAMMAR) -> None:
+        self.grammar = grammar
+        self.direction_aliases = grammar.direction_aliases
+        self.single_word_aliases = grammar.single_word_aliases
+        self.verb_aliases = grammar.verb_aliases
+        self.phrase_aliases = grammar.phrase_aliases
+        self.trolley_commands = grammar.trolley_commands
+
+        self.vocabulary = Vocabulary(
+            verbs=[
+                *self.single_word_aliases, *self.verb_aliases,
+                *self.trolley_commands, *self.direction_aliases,
+            ],
+            nouns=set(self.direction_aliases.values()),
+        )
+
+    def split_commands(self, raw_input: str) -> List[str]:
+        """Split one line of input into the commands chained on it."""
+        return [part for part in CHAIN_SEPARATORS.split(raw_input.strip().lower()) if part]
+
+    def parse(self, raw_command: str) -> ParsedCommand:
+        """Parse player input, reusing the result for input seen recently."""
+        if not raw_command:
+            return ParsedCommand("")
+        command = raw_command.strip().lower()
+        if not command:
+            return ParsedCommand("")
+        return parse_command(self.grammar, command)
+
+    def understand_command(self, raw_command: str) -> Tuple[str, str]:
+        """Return the normalized command type and argument string."""
+        parsed = self.parse(raw_command)
+        return parsed.command, parsed.argument
+
+    def parse_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counts and hit rate of the parse cache every handler shares."""
+        info = parse_command.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+        }
+
+    def clear_parse_cache(self) -> None:
+        """Forget cached parses, for every handler."""
+        parse_command.cache_clear()
+
+    def understand_with_corrections(self, raw_command: str) -> Tuple[str, str]:
+        """Like understand_command, but forgiving a misspelt first word.
+
+        Only called once the exact parse has failed, so a correctly typed
+        command never pays for the fuzzy lookup.
+        """
+        words = raw_command.strip().lower().split()
+        if not words:
+            return "", ""
+        corrected = self.vocabulary.correct_verb(words[0])
+        if not corrected or corrected == words[0]:
+            return "", ""
+        return self.understand_command(" ".join([corrected, *words[1:]]))
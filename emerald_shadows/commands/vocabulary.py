@@ -0,0 +1,170 @@
+"""Typo-tolerant vocabulary lookup for Emerald Shadows.
+
+Verbs, item ids and exit names live in BK-trees (Burkhard-Keller trees) keyed
+by edit distance, so finding every word within one or two typos of the input
+visits a handful of nodes instead of comparing against the whole vocabulary.
+Item ids are indexed under both their snake_case id and the space-separated
+form players actually type ("cipher wheel" -> ``cipher_wheel``).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance between two strings."""
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        previous = current
+    return previous[-1]
+
+
+def max_typos(word: str) -> int:
+    """How many edits to forgive in a word of this length.
+
+    Short words are taken as typed: 'kick' is one edit from 'pick' but almost
+    certainly meant as written.
+    """
+    if len(word) <= 4:
+        return 0
+    if len(word) <= 6:
+        return 1
+    return 2
+
+
+def surface_forms(name: str) -> Tuple[str, ...]:
+    """The ways a player may type a name: 'cipher_wheel' -> ('cipher_wheel', 'cipher wheel')."""
+    spaced = name.replace("_", " ")
+    return (name,) if spaced == name else (name, spaced)
+
+
+class BKTree:
+    """Metric tree over words for bounded edit-distance search."""
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        # Each node is [word, {distance: child_node}]
+        self._root: Optional[list] = None
+        self._size = 0
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, word: str) -> None:
+        """Insert a word. Inserting a word already present is a no-op."""
+        if self._root is None:
+            self._root = [word, {}]
+            self._size = 1
+            return
+        node = self._root
+        while True:
+            distance = edit_distance(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [word, {}]
+                self._size += 1
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """Return (distance, word) pairs within max_distance, closest first."""
+        if self._root is None:
+            return []
+        found = []
+        pending = [self._root]
+        while pending:
+            node = pending.pop()
+            distance = edit_distance(word, node[0])
+            if distance <= max_distance:
+                found.append((distance, node[0]))
+            # Triangle inequality: only children in this band can be close enough
+            low, high = distance - max_distance, distance + max_distance
+            pending.extend(child for d, child in node[1].items() if low <= d <= high)
+        found.sort()
+        return found
+
+
+class Vocabulary:
+    """Corrects misspelt verbs and resolves noun phrases to in-scope names.
+
+    The verb tree is built once. The noun tree starts with whatever names are
+    passed in and grows as new items and exits come into scope, so a turn pays
+    only for names it has never seen before.
+    """
+
+    def __init__(self, verbs: Iterable[str] = (), nouns: Iterable[str] = ()) -> None:
+        self._verbs: Set[str] = set(verbs)
+        self._verb_tree = BKTree(self._verbs)
+        self._forms: Dict[str, Set[str]] = {}
+        self._noun_tree = BKTree()
+        self.add_nouns(nouns)
+
+    def add_nouns(self, names: Iterable[str]) -> None:
+        """Index names (item ids, exits) not seen before."""
+        for name in names:
+            for form in surface_forms(name):
+                owners = self._forms.setdefault(form, set())
+                if name not in owners:
+                    owners.add(name)
+                    self._noun_tree.add(form)
+
+    def correct_verb(self, word: str) -> Optional[str]:
+        """Return the known verb a misspelt word was meant to be, if unambiguous."""
+        found = self.verb_candidates(word)
+        return found[0] if len(found) == 1 else None
+
+    def resolve(self, phrase: str, scope: Iterable[str]) -> Optional[str]:
+        """Resolve what the player typed to one of the names in scope.
+
+        Exact spellings win. A correctly spelt name that simply isn't in scope
+        is never "corrected" into a different one ('east' is not 'west').
+        Returns None when nothing, or more than one name, is close enough.
+        """
+        found = self.candidates(phrase, scope)
+        return found[0] if len(found) == 1 else None
+
+    def candidates(self, phrase: str, scope: Iterable[str]) -> List[str]:
+        """All in-scope names tied for closest to what the player typed."""
+        scope = set(scope)
+        self.add_nouns(scope)
+        phrase = " ".join(phrase.lower().split())
+        exact = self._forms.get(phrase)
+        if exact:
+            return sorted(exact & scope)
+        matches = sorted(
+            (distance, name)
+            for distance, form in self._noun_tree.search(phrase, max_typos(phrase))
+            for name in self._forms[form] & scope
+        )
+        return self._best(matches)
+
+    def verb_candidates(self, word: str) -> List[str]:
+        """All known verbs tied for closest to a word."""
+        if word in self._verbs:
+            return [word]
+        return self._best(self._verb_tree.search(word, max_typos(word)))
+
+    @staticmethod
+    def _best(matches: List[Tuple[int, str]]) -> List[str]:
+        """Names at the smallest distance in sorted (distance, name) pairs."""
+        if not matches:
+            return []
+        best_distance = matches[0][0]
+        return sorted({name for distance, name in matches if distance == best_distance})
@@ -83,7 +83,50 @@ REQUIRED_STATES: Final[Set[str]] = frozenset({
 # Game Settings
 STARTING_LOCATION: Final[str] = "police_station"
 AUTO_SAVE_INTERVAL: Final[int] = 300  # 5 minutes in seconds
-INVENTORY_LIMIT: Final[int] = 10
+# Carrying limit. Must cover every item a full playthrough holds at once (19
+# in the base world); content packs with more loose items are held to it.
+INVENTORY_LIMIT: Final[int] = 20
+
+# Content Hot-Reload Settings
+CONTENT_RELOAD_ENV: Final[str] = "EMERALD_HOT_RELOAD"  # set to 1 to watch content files
+CONTENT_RELOAD_INTERVAL: Final[float] = 2.0  # seconds between source checks
+CONTENT_PACK_ENV: Final[str] = "EMERALD_CONTENT_PACK"  # path to a JSON-lines world pack
+CONTENT_REGIONS_ENV: Final[str] = "EMERALD_CONTENT_REGIONS"  # comma-separated regions to host
+
+# Structured Output Settings
+EVENTS_ENV: Final[str] = "EMERALD_EVENTS"  # path to append the JSON-lines event stream to
+
+# Full-Screen Mode Settings
+TUI_ENV: Final[str] = "EMERALD_TUI"  # set to 1 for the full-screen curses interface
+TUI_SCROLLBACK_LINES: Final[int] = 2000  # lines of past output kept for paging back
+
+# Puzzle Variant Settings
+PUZZLE_VARIANTS_ENV: Final[str] = "EMERALD_PUZZLE_VARIANTS"  # set to 1 for per-game puzzle answers
+PUZZLE_SEED_ENV: Final[str] = "EMERALD_PUZZLE_SEED"  # a seed, to replay one game's answers
+
+# Radio Band Settings (tune/scan; needs NumPy)
+RADIO_SAMPLE_RATE: Final[int] = 8000  # samples per second of simulated receiver audio
+RADIO_TUNE_SECONDS: Final[float] = 3.0  # audio rendered when tuning to one frequency
+RADIO_SCAN_SECONDS: Final[float] = 0.75  # audio rendered per frequency when scanning
+RADIO_SCAN_SPAN: Final[float] = 1.0  # MHz either side of the dial when scanning
+RADIO_WAV_ENV: Final[str] = "EMERALD_RADIO_WAV"  # path to write what was last tuned as a WAV file
+
+# Vehicle Registry Settings (trace)
+REGISTRY_SIZE: Final[int] = 100_000  # synthetic registrations on file, 1,000 to 1,000,000
+REGISTRY_SIZE_ENV: Final[str] = "EMERALD_REGISTRY_SIZE"  # overrides REGISTRY_SIZE
+REGISTRY_SEED: Final[int] = 1947  # the same files every run
+REGISTRY_RESULTS: Final[int] = 8  # registrations a trace reads back
+REGISTRY_MAX_CHECKS: Final[int] = 50_000  # registrations a trace may check before asking for more
+
+# Network Settings
+TELNET_HOST: Final[str] = "127.0.0.1"
+TELNET_PORT: Final[int] = 4000
+TELNET_COMPRESSION: Final[bool] = True  # offer MCCP v2 to clients that support it
+TELNET_COMPRESSION_LEVEL: Final[int] = 6  # zlib level, 1 (fastest) to 9 (smallest)
+TELNET_SAVE_DIR: Final[Path] = SAVE_DIR / "telnet"  # one subdirectory of saves per connection
+
+# Command Parser Settings
+PARSE_CACHE_SIZE: Final[int] = 512  # distinct inputs whose parses are remembered
 
 # Terminal Display Settings
 @dataclass(frozen=True)
@@ -118,7 +161,13 @@ BASIC_COMMANDS: Final[Set[str]] = frozenset({
 
 COMPLEX_COMMANDS: Final[Set[str]] = frozenset({
     # Action Commands
-    "go", "take", "examine", "use", "combine", "solve", "drop"
+    "go", "take", "examine", "use", "combine", "solve", "drop",
+
+    # Radio
+    "tune", "scan",
+
+    # Vehicle registry
+    "trace"
 })
 
 # Validate command sets
@@ -127,6 +176,7 @@ if BASIC_COMMANDS & COMPLEX_COMMANDS:
 
 # Game Text Settings
 TEXT_SCROLL_SPEED: Final[float] = 0.03  # seconds per character
+TYPEWRITER_FRAME_RATE: Final[int] = 12  # writes per second while slow text plays
 ENABLE_TEXT_EFFECTS: Final[bool] = True
 MAX_MESSAGE_LENGTH: Final[int] = 1000
 
@@ -139,6 +189,11 @@ PUZZLE_SOLUTIONS: Final[Dict[str, Dict[str, str]]] = {
         "frequency": "415.6",
         "success_message": "You lock onto 415.6 MHz—smugglers chatter floods your headphones.",
         "fail_message": "Static sputters. That frequency is dead tonight.",
+        "tune_what": "The dial runs from 400.0 to 429.9 MHz. Tune to what?",
+        "no_band": (
+            "The set's valves won't warm up. (Tuning and scanning the band need "
+            "NumPy: pip install numpy. 'solve' still works.)"
+        ),
     },
     "cipher_puzzle": {
         "key": "ANGELS",
@@ -0,0 +1,151 @@
+# Item rule configurations for Emerald Shadows
+#
+# Each rule fires when the player performs ``verb`` on ``item`` at
+# ``location``. ``item`` and ``location`` may be a single name, a list of
+# names, or "*" for any. The most specific matching rule wins:
+# (item, location), then (item, "*"), then ("*", "*").
+#
+# A rule with "unless" only fires while that game-state flag is still unset.
+# Effects run in order; each is a one-key object:
+#   {"print": text}        show text ("{item}" is replaced with the item name)
+#   {"set_flag": name}     set a game-state flag to True
+#   {"set_state": {...}}   assign several game-state values
+#   {"add_score": points}  add to the case score
+#   {"remove_items": [..]} take items out of the inventory
+#   {"call": hook}         run a named ItemManager hook (see rules.RULE_HOOKS)
+#
+# Combination rules are generated from ITEM_COMBINATIONS in config_items.py.
+ITEM_RULES = [
+    # --- take ---
+    {
+        "verb": "take",
+        "item": "*",
+        "effects": [{"print": "You take the {item}."}]
+    },
+    {
+        "verb": "take",
+        "item": ["cipher_wheel", "notebook", "binoculars", "radio_manual"],
+        "effects": [{"add_score": 10}, {"print": "You take the {item}."}]
+    },
+    {
+        "verb": "take",
+        "item": "badge",
+        "effects": [
+            {"set_flag": "has_badge"},
+            {"add_score": 10},
+            {"print": "You clip the badge to your belt. Its familiar weight is reassuring."}
+        ]
+    },
+    {
+        "verb": "take",
+        "item": ["note_1", "note_2", "note_3", "note_4", "note_5"],
+        "effects": [{"add_score": 5}, {"call": "collect_note"}]
+    },
+    {
+        "verb": "take",
+        "item": "informant_note",
+        "effects": [{"print": (
+            "You take the note. Something in the handwriting stops you — "
+            "it was written in a hurry by someone who knew the risk. "
+            "Read it carefully."
+        )}]
+    },
+    {
+        "verb": "take",
+        "item": "bulletin_notice",
+        "effects": [{"print": (
+            "You pull the notice from the board. Whatever's on it, "
+            "someone went to the trouble of posting it where you'd find it. "
+            "Examine it when you get a moment."
+        )}]
+    },
+    {
+        "verb": "take",
+        "item": "membership_register",
+        "effects": [{"add_score": 10}, {"print": (
+            "You tear out the 1946 roster page and fold it into your pocket. "
+            "The night porter is going to have questions in the morning. "
+            "You'll be somewhere else by then."
+        )}]
+    },
+    {
+        "verb": "take",
+        "item": "meeting_minutes",
+        "effects": [{"add_score": 10}, {"print": (
+            "You take the folder. It's heavy — months of meetings, agreements, "
+            "money moving between names that shouldn't be in the same room. "
+            "Examine it when you're ready to see exactly what Voss signed."
+        )}]
+    },
+    {
+        "verb": "take",
+        "item": "manifest",
+        "effects": [{"add_score": 10}, {"print": (
+            "You pull the manifest from the board. Someone will notice it's "
+            "missing when they come to cover their tracks. "
+            "You intend to be finished before that happens."
+        )}]
+    },
+
+    # --- examine (after the item's detailed text is shown) ---
+    {
+        "verb": "examine",
+        "item": "photo",
+        "unless": "discovered_suspect",
+        "effects": [
+            {"set_flag": "discovered_suspect"},
+            {"print": "\nThe person in the photo looks familiar..."}
+        ]
+    },
+    {
+        "verb": "examine",
+        "item": "cipher_wheel",
+        "unless": "examined_cipher",
+        "effects": [
+            {"set_flag": "examined_cipher"},
+            {"print": "\nThe cipher wheel looks like it could decode encrypted messages..."}
+        ]
+    },
+    {
+        "verb": "examine",
+        "item": "informant_note",
+        "unless": "found_emergency_frequency",
+        "effects": [
+            {"set_flag": "found_emergency_frequency"},
+            {"add_score": 10},
+            {"print": "\nYou have the emergency frequency. They'll be broadcasting tonight."}
+        ]
+    },
+    {
+        "verb": "examine",
+        "item": "bulletin_notice",
+        "unless": "identified_organization",
+        "effects": [
+            {"set_flag": "identified_organization"},
+            {"add_score": 10},
+            {"print": "\nNorthwest Maritime Imports — that's the front. You have your organization."}
+        ]
+    },
+
+    # --- use (after the item's use_effects text is shown) ---
+    {
+        "verb": "use",
+        "item": "binoculars",
+        "location": ["observation_deck", "waterfront"],
+        "unless": "surveilled_docks",
+        "effects": [{"set_flag": "surveilled_docks"}, {"add_score": 10}]
+    },
+    {
+        "verb": "use",
+        "item": "flashlight",
+        "location": "underground_tunnels",
+        "effects": [{"set_state": {"flashlight_lit": True, "dark_turns": 0}}]
+    },
+    {
+        "verb": "use",
+        "item": "badge",
+        "location": "anchor_tavern",
+        "unless": "ches_tip",
+        "effects": [{"set_flag": "ches_tip"}, {"add_score": 15}]
+    }
+]
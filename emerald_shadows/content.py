@@ -0,0 +1,313 @@
+"""Versioned world content for Emerald Shadows.
+
+The static text of the world — location descriptions, exits, requirements and
+item prose — is published as an immutable ``WorldContent`` generation. Each
+session keeps its own mutable state (inventory, room items, first visits) and
+rebinds to the store's current generation at the start of every turn, so a
+designer can fix a typo in ``config_locations.py`` or ``config_items.py``
+without restarting a worker or interrupting a player.
+
+Reloads are built and validated off the serving path by ``ContentWatcher``;
+publishing a new generation is a single reference swap. A generation is freed
+as soon as the last session holding it moves on.
+"""
+
+from __future__ import annotations
+
+import ast
+import dataclasses
+import logging
+import threading
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from .config import STARTING_LOCATION, CONTENT_RELOAD_INTERVAL
+from .config_items import ITEM_DESCRIPTIONS
+from .config_locations import LOCATIONS
+
+logger = logging.getLogger(__name__)
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+# Content source files and the module-level literal each one defines.
+CONTENT_SOURCES: Tuple[Tuple[Path, str], ...] = (
+    (_PACKAGE_DIR / "config_locations.py", "LOCATIONS"),
+    (_PACKAGE_DIR / "config_items.py", "ITEM_DESCRIPTIONS"),
+)
+
+
+class ContentError(Exception):
+    """Raised when world content is malformed or fails validation."""
+    pass
+
+
+class LazyText:
+    """A long text field that stays on disk until it is displayed.
+
+    Content packs can carry hundreds of megabytes of prose; only the reference
+    is held in memory and ``loader`` fetches the text on demand. Behaves like
+    a string wherever the game concatenates or formats text.
+    """
+
+    __slots__ = ("_loader", "_key")
+
+    def __init__(self, loader: Callable[[Any], str], key: Any) -> None:
+        self._loader = loader
+        self._key = key
+
+    def __str__(self) -> str:
+        return self._loader(self._key)
+
+    def __format__(self, spec: str) -> str:
+        return format(str(self), spec)
+
+    def __add__(self, other: str) -> str:
+        return str(self) + other
+
+    def __radd__(self, other: str) -> str:
+        return other + str(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyText):
+            return str(self) == str(other)
+        return str(self) == other
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        return f"LazyText({self._key!r})"
+
+
+def is_text(value: Any) -> bool:
+    """True for a non-empty string or a lazy text reference."""
+    return isinstance(value, LazyText) or (isinstance(value, str) and bool(value.strip()))
+
+
+@dataclass(frozen=True)
+class WorldContent:
+    """One immutable generation of world text and topology.
+
+    ``boundary`` names rooms that exits lead to but that are hosted by
+    another worker; it is only non-empty for partially loaded content packs.
+    """
+    generation: int
+    locations: Mapping[str, Mapping[str, Any]]
+    item_descriptions: Mapping[str, Mapping[str, Any]]
+    start: str = STARTING_LOCATION
+    boundary: FrozenSet[str] = frozenset()
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def validate_content(content: WorldContent) -> None:
+    """Check a generation for internal consistency before it is published.
+
+    Raises:
+        ContentError: describing the first problem found.
+    """
+    if content.start not in content.locations:
+        raise ContentError(f"Starting location '{content.start}' is not defined")
+
+    for name, data in content.locations.items():
+        if not is_text(data.get("description")):
+            raise ContentError(f"Location '{name}' has no description")
+        exits = data.get("exits")
+        if not isinstance(exits, Mapping):
+            raise ContentError(f"Location '{name}' has no exits mapping")
+        for direction, destination in exits.items():
+            if (
+                destination != "trolley"
+                and destination not in content.locations
+                and destination not in content.boundary
+            ):
+                raise ContentError(
+                    f"Location '{name}' exit '{direction}' points to unknown location '{destination}'"
+                )
+
+    for item, data in content.item_descriptions.items():
+        for field in ("basic", "detailed"):
+            if not isinstance(data.get(field), (str, LazyText)):
+                raise ContentError(f"Item '{item}' is missing its '{field}' text")
+
+
+def build_content(
+    locations: Mapping[str, Mapping[str, Any]],
+    item_descriptions: Mapping[str, Mapping[str, Any]],
+    generation: int = 0,
+    start: str = STARTING_LOCATION,
+) -> WorldContent:
+    """Freeze raw content dictionaries into a validated ``WorldContent``."""
+    content = WorldContent(
+        generation=generation,
+        locations=_freeze(locations),
+        item_descriptions=_freeze(item_descriptions),
+        start=start,
+    )
+    validate_content(content)
+    return content
+
+
+def read_source_literal(path: Path, name: str) -> Any:
+    """Read a module-level literal assignment from a content source file.
+
+    The file is parsed, never executed, so a half-saved edit can only fail
+    validation rather than run arbitrary code inside a live worker.
+    """
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (OSError, SyntaxError) as e:
+        raise ContentError(f"Could not parse content source {path}: {e}") from e
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == name for target in node.targets
+        ):
+            try:
+                return ast.literal_eval(node.value)
+            except ValueError as e:
+                raise ContentError(f"{name} in {path} is not a plain literal: {e}") from e
+    raise ContentError(f"{path} does not define {name}")
+
+
+class ContentStore:
+    """Holds the current content generation and publishes replacements.
+
+    Readers never lock: ``current`` is a plain attribute read, and ``publish``
+    replaces it with a single assignment once the new generation has been
+    fully built and validated.
+    """
+
+    def __init__(self, initial: WorldContent) -> None:
+        validate_content(initial)
+        self._current = initial
+        self._lock = threading.Lock()
+        self._live: "weakref.WeakValueDictionary[int, WorldContent]" = weakref.WeakValueDictionary()
+        self._live[initial.generation] = initial
+
+    @property
+    def current(self) -> WorldContent:
+        """The generation new turns should use."""
+        return self._current
+
+    def publish(
+        self,
+        locations: Mapping[str, Mapping[str, Any]],
+        item_descriptions: Mapping[str, Mapping[str, Any]],
+    ) -> WorldContent:
+        """Build, validate and swap in a new generation.
+
+        Raises:
+            ContentError: if the new content is invalid; the current
+                generation stays in place.
+        """
+        with self._lock:
+            content = build_content(
+                locations,
+                item_descriptions,
+                generation=self._current.generation + 1,
+                start=self._current.start,
+            )
+            self._current = content
+            self._live[content.generation] = content
+        logger.info(f"Published world content generation {content.generation}")
+        return content
+
+    def install(self, content: WorldContent) -> WorldContent:
+        """Publish an already-built generation, such as a loaded content pack.
+
+        The generation number is reassigned so it stays monotonic.
+
+        Raises:
+            ContentError: if the content is invalid.
+        """
+        validate_content(content)
+        with self._lock:
+            content = dataclasses.replace(content, generation=self._current.generation + 1)
+            self._current = content
+            self._live[content.generation] = content
+        logger.info(f"Installed world content generation {content.generation}")
+        return content
+
+    def reload(self, sources: Iterable[Tuple[Path, str]] = CONTENT_SOURCES) -> WorldContent:
+        """Re-read the content source files and publish them as a new generation."""
+        values: Dict[str, Any] = {name: read_source_literal(path, name) for path, name in sources}
+        return self.publish(
+            values.get("LOCATIONS", self._current.locations),
+            values.get("ITEM_DESCRIPTIONS", self._current.item_descriptions),
+        )
+
+    def live_generations(self) -> List[int]:
+        """Generations still referenced by the store or by some session."""
+        return sorted(self._live.keys())
+
+
+class ContentWatcher(threading.Thread):
+    """Background thread that reloads content when a source file changes.
+
+    Polls modification times rather than relying on platform file-change
+    APIs, so it behaves the same on every OS the game supports. A failed
+    reload is logged and the running generation is left untouched.
+    """
+
+    def __init__(
+        self,
+        store: ContentStore,
+        sources: Iterable[Tuple[Path, str]] = CONTENT_SOURCES,
+        interval: float = CONTENT_RELOAD_INTERVAL,
+    ) -> None:
+        super().__init__(name="content-watcher", daemon=True)
+        self.store = store
+        self.sources = tuple(sources)
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._mtimes = self._snapshot()
+
+    def _snapshot(self) -> Dict[Path, Optional[float]]:
+        mtimes: Dict[Path, Optional[float]] = {}
+        for path, _ in self.sources:
+            try:
+                mtimes[path] = path.stat().st_mtime
+            except OSError:
+                mtimes[path] = None
+        return mtimes
+
+    def check(self) -> bool:
+        """Reload if any source changed since the last check. Returns True on a publish."""
+        mtimes = self._snapshot()
+        if mtimes == self._mtimes:
+            return False
+        self._mtimes = mtimes
+        try:
+            self.reload()
+            return True
+        except ContentError as e:
+            logger.error(f"Content reload rejected: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error reloading content: {e}")
+        return False
+
+    def reload(self) -> None:
+        """Publish the changed sources as a new generation."""
+        self.store.reload(self.sources)
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.check()
+
+    def stop(self) -> None:
+        """Ask the watcher to exit after its current poll."""
+        self._stop_event.set()
+
+
+CONTENT_STORE = ContentStore(build_content(LOCATIONS, ITEM_DESCRIPTIONS))
@@ -0,0 +1,251 @@
+"""Streaming loader for external JSON-lines content packs.
+
+A content pack is a UTF-8 text file with one JSON object per line::
+
+    {"type": "pack", "start": "police_station"}
+    {"type": "location", "name": "police_station", "region": "downtown",
+     "description": "...", "exits": {"outside": "street"}, "items": ["badge"]}
+    {"type": "item", "name": "badge", "basic": "...", "detailed": "..."}
+
+Location records use the ``LOCATIONS`` schema plus ``name`` and an optional
+``region``; item records use the ``ITEM_DESCRIPTIONS`` schema plus ``name``.
+
+The pack is read one line at a time and each room goes straight into the world
+index, so memory during load is bounded by the longest line rather than the
+file size. Long prose fields are not kept: they become ``LazyText`` references
+to the line's byte offset and are re-read (through a small LRU cache) when a
+player actually sees them. Passing ``regions`` loads only those regions' rooms,
+letting each worker host one district of a very large city. ``PackWatcher``
+hot-reloads a served pack when its file changes; a pack loaded with
+``snapshot=True`` reads its lazy text from a private copy, so rewriting the
+file never changes the text of a generation already being served.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import weakref
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+from .config import CONTENT_RELOAD_INTERVAL
+from .content import ContentError, ContentStore, ContentWatcher, LazyText, WorldContent, _freeze, validate_content
+
+logger = logging.getLogger(__name__)
+
+# Text fields that may be deferred, and the length at which deferring pays off.
+LAZY_FIELDS = frozenset({"description", "historical_note", "detailed"})
+LAZY_TEXT_MIN_CHARS = 200
+
+# Records re-read for lazy text; sized for the rooms a busy worker shows at once.
+_RECORD_CACHE_SIZE = 1024
+
+
+def _remove_snapshot(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class _PackSnapshot:
+    """A private copy of a pack file, removed once no lazy text refers to it."""
+
+    __slots__ = ("path", "__weakref__")
+
+    def __init__(self, source: Path) -> None:
+        handle, self.path = tempfile.mkstemp(prefix="pack-", suffix=".jsonl")
+        os.close(handle)
+        weakref.finalize(self, _remove_snapshot, self.path)
+        shutil.copyfile(source, self.path)
+
+    def __fspath__(self) -> str:
+        return self.path
+
+
+PackFile = Union[str, _PackSnapshot]
+
+
+@lru_cache(maxsize=_RECORD_CACHE_SIZE)
+def _read_record(path: str, offset: int) -> Dict[str, Any]:
+    """Read and parse the single pack line starting at ``offset``."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return json.loads(f.readline())
+
+
+def _load_lazy(key: Tuple[PackFile, int, str]) -> str:
+    pack_file, offset, field = key
+    return _read_record(os.fspath(pack_file), offset)[field]
+
+
+def iter_pack(path: Path) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield ``(byte_offset, record)`` for every non-blank line of a pack.
+
+    Raises:
+        ContentError: on a line that is not a JSON object.
+    """
+    offset = 0
+    with open(path, "rb") as f:
+        for line_number, line in enumerate(f, start=1):
+            start, offset = offset, offset + len(line)
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise ContentError(f"{path}:{line_number}: invalid JSON ({e})") from e
+            if not isinstance(record, dict):
+                raise ContentError(f"{path}:{line_number}: expected a JSON object")
+            yield start, record
+
+
+def _defer_text(record: Dict[str, Any], pack_file: PackFile, offset: int) -> Dict[str, Any]:
+    """Replace long prose fields of a record with lazy references."""
+    for field in LAZY_FIELDS:
+        value = record.get(field)
+        if isinstance(value, str) and len(value) >= LAZY_TEXT_MIN_CHARS:
+            record[field] = LazyText(_load_lazy, (pack_file, offset, field))
+    return record
+
+
+def load_pack(
+    path: Path,
+    regions: Optional[Collection[str]] = None,
+    start: Optional[str] = None,
+    snapshot: bool = False,
+) -> WorldContent:
+    """Stream a content pack into a validated ``WorldContent``.
+
+    Args:
+        path: The JSON-lines pack file.
+        regions: If given, load only locations (and items) tagged with one of
+            these regions; records without a region are always loaded. Exits
+            into rooms of other regions are kept and listed as the boundary.
+        start: Starting location; defaults to the pack header's, or the first
+            loaded room when the header's start lies outside ``regions``.
+        snapshot: Copy the pack first and read from the copy, for a pack that
+            may be rewritten while this content is served.
+
+    Raises:
+        ContentError: if the pack is malformed or fails validation.
+    """
+    pack_file: PackFile = str(Path(path).resolve())
+    wanted = frozenset(regions) if regions is not None else None
+    locations: Dict[str, Mapping[str, Any]] = {}
+    items: Dict[str, Mapping[str, Any]] = {}
+    header_start: Optional[str] = None
+    skipped = 0
+
+    try:
+        if snapshot:
+            pack_file = _PackSnapshot(Path(pack_file))
+        for offset, record in iter_pack(Path(os.fspath(pack_file))):
+            kind = record.pop("type", "location")
+            if kind == "pack":
+                header_start = record.get("start")
+                continue
+            name = record.pop("name", None)
+            if not name:
+                raise ContentError(f"{path}: {kind} record at byte {offset} has no name")
+            region = record.pop("region", None)
+            if wanted is not None and region is not None and region not in wanted:
+                skipped += 1
+                continue
+            record = _defer_text(record, pack_file, offset)
+            if kind == "location":
+                locations[name] = _freeze(record)
+            elif kind == "item":
+                items[name] = _freeze(record)
+            else:
+                raise ContentError(f"{path}: unknown record type '{kind}' for '{name}'")
+    except OSError as e:
+        raise ContentError(f"Could not read content pack {path}: {e}") from e
+
+    if not locations:
+        raise ContentError(f"{path}: no locations loaded")
+
+    boundary = frozenset(
+        destination
+        for data in locations.values()
+        for destination in data["exits"].values()
+        if destination != "trolley" and destination not in locations
+    )
+    if wanted is None and boundary:
+        raise ContentError(f"{path}: exits point to undefined locations: {sorted(boundary)[:5]}")
+
+    if start is None:
+        start = header_start if header_start in locations else next(iter(locations))
+
+    content = WorldContent(
+        generation=0,
+        locations=MappingProxyType(locations),
+        item_descriptions=MappingProxyType(items),
+        start=start,
+        boundary=boundary,
+    )
+    validate_content(content)
+    logger.info(
+        f"Loaded content pack {path}: {len(locations)} locations, {len(items)} items"
+        f" ({skipped} records outside the requested regions)"
+    )
+    return content
+
+
+def write_pack(
+    path: Path,
+    locations: Iterable[Tuple[str, Mapping[str, Any]]],
+    items: Iterable[Tuple[str, Mapping[str, Any]]] = (),
+    start: Optional[str] = None,
+    region_of: Optional[Callable[[str, Mapping[str, Any]], Optional[str]]] = None,
+) -> None:
+    """Write locations and items to a JSON-lines pack, one record at a time.
+
+    ``locations`` and ``items`` may be generators, so packs larger than memory
+    can be produced straight from ``tools.worldgen.iter_world``.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        if start:
+            f.write(json.dumps({"type": "pack", "start": start}) + "\n")
+        for name, data in locations:
+            record: Dict[str, Any] = {"type": "location", "name": name}
+            region = region_of(name, data) if region_of else None
+            if region is not None:
+                record["region"] = region
+            record.update(data)
+            f.write(json.dumps(record) + "\n")
+        for name, data in items:
+            f.write(json.dumps({"type": "item", "name": name, **data}) + "\n")
+
+
+class PackWatcher(ContentWatcher):
+    """Reloads a served content pack when the pack file changes.
+
+    Once a pack is installed the config source files no longer describe the
+    world, so this watches the pack instead and streams it in again. Each
+    reload reads from a snapshot of its own, so the generation being served
+    keeps reading the text it was indexed from, even if the new pack is
+    rejected.
+    """
+
+    def __init__(
+        self,
+        store: ContentStore,
+        path: Path,
+        regions: Optional[Collection[str]] = None,
+        interval: float = CONTENT_RELOAD_INTERVAL,
+    ) -> None:
+        self.path = Path(path)
+        self.regions = regions
+        super().__init__(store, sources=[(self.path, "pack")], interval=interval)
+
+    def reload(self) -> None:
+        self.store.install(load_pack(self.path, self.regions, snapshot=True))
+        # Older generations' records are only wanted until their sessions move on
+        _read_record.cache_clear()
@@ -0,0 +1,140 @@
+"""Structured game output as a stream of typed JSON-lines events.
+
+Terminal players read wrapped prose; other clients can instead read one JSON
+object per line describing what happened:
+
+    {"type": "narration", "text": "You take the photo.", "spans": [...]}
+    {"type": "location", "id": "evidence_room", "text": "...", "spans": [...]}
+    {"type": "exits", "exits": ["downstairs"]}
+    {"type": "items", "items": ["cipher_wheel", "photo"]}
+    {"type": "score", "score": 25, "delta": 10}
+    {"type": "media", "moment": "grue_death"}
+    {"type": "prompt", "text": "> "}
+
+``spans`` mark where item and exit names occur in the text as
+``{"start", "end", "kind", "name"}`` so clients never have to pattern-match
+prose. Events are produced from ``print_text``, the location description and
+``media.present``; when no stream is active every hook is a no-op.
+
+The active stream is held in a context variable, so concurrent sessions on
+one event loop each write to their own.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import re
+from collections import deque
+from typing import IO, Any, Dict, Iterable, List, Optional, Pattern, Tuple
+
+
+class EventStream:
+    """Writes events for one session as JSON lines."""
+
+    def __init__(self, stream: IO[str]) -> None:
+        self.stream = stream
+        # Surface text -> (kind, canonical name) for span marking
+        self._names: Dict[str, Tuple[str, str]] = {}
+        self._pattern: Optional[Pattern[str]] = None
+        # Recently described texts; bounded in case one is never printed
+        self._described: deque = deque(maxlen=4)
+
+    def emit(self, event_type: str, **fields: Any) -> None:
+        """Write one event."""
+        try:
+            self.stream.write(json.dumps({"type": event_type, **fields}, ensure_ascii=False) + "\n")
+        except Exception as e:
+            logging.error(f"Error writing {event_type} event: {e}")
+
+    def set_scope(self, items: Iterable[str] = (), exits: Iterable[str] = ()) -> None:
+        """Set the item and exit names that spans should mark."""
+        names: Dict[str, Tuple[str, str]] = {}
+        for exit_name in exits:
+            names[exit_name] = ("exit", exit_name)
+        for item in items:
+            names[item] = ("item", item)
+            names[item.replace("_", " ")] = ("item", item)
+        if names != self._names:
+            self._names = names
+            self._pattern = None
+
+    def spans(self, text: str) -> List[Dict[str, Any]]:
+        """Locate the in-scope item and exit names in text."""
+        if not self._names:
+            return []
+        if self._pattern is None:
+            # Longest first, so "radio manual" wins over a shorter overlapping name
+            alternatives = sorted(self._names, key=len, reverse=True)
+            self._pattern = re.compile(
+                r"(?<![\w])(" + "|".join(re.escape(name) for name in alternatives) + r")(?![\w])",
+                re.IGNORECASE,
+            )
+        spans = []
+        for match in self._pattern.finditer(text):
+            kind, name = self._names[match.group(1).lower()]
+            spans.append({"start": match.start(1), "end": match.end(1), "kind": kind, "name": name})
+        return spans
+
+    def claim(self, text: str) -> None:
+        """Note text already sent as a structured event, so printing it adds no narration."""
+        self._described.append(text.strip())
+
+    def narrate(self, text: str) -> None:
+        """Emit printed text as narration, unless it was already described."""
+        stripped = text.strip()
+        if stripped in self._described:
+            self._described.remove(stripped)
+            return
+        if stripped:
+            self.emit("narration", text=stripped, spans=self.spans(stripped))
+
+
+_active: contextvars.ContextVar[Optional[EventStream]] = contextvars.ContextVar("event_stream", default=None)
+
+
+def active() -> Optional[EventStream]:
+    """The event stream for the current session, if any."""
+    return _active.get()
+
+
+def set_stream(stream: Optional[EventStream]) -> contextvars.Token:
+    """Make stream the current session's event stream. Returns a token for reset_stream()."""
+    return _active.set(stream)
+
+
+def reset_stream(token: contextvars.Token) -> None:
+    """Restore the event stream that was current before set_stream()."""
+    _active.reset(token)
+
+
+def emit(event_type: str, **fields: Any) -> None:
+    """Emit an event on the current stream, if there is one."""
+    stream = _active.get()
+    if stream is not None:
+        stream.emit(event_type, **fields)
+
+
+def narrate(text: str) -> None:
+    """Emit printed text as narration on the current stream, if there is one."""
+    stream = _active.get()
+    if stream is not None:
+        stream.narrate(str(text))
+
+
+def describe_location(location_id: str, description: str, exits: List[str],
+                      items: List[str], text: str) -> None:
+    """Emit a location header with its exits and items.
+
+    ``text`` is the formatted description about to be printed; it is claimed
+    so it doesn't come through a second time as narration.
+    """
+    stream = _active.get()
+    if stream is None:
+        return
+    stream.set_scope(items, exits)
+    stream.emit("location", id=location_id, text=description, spans=stream.spans(description))
+    stream.emit("exits", exits=exits)
+    stream.emit("items", items=items)
+    stream.claim(text)
@@ -1,5 +1,5 @@
 """Game manager module for Emerald Shadows."""
-from typing import Dict, Optional, Tuple, Any
+from typing import Any, Callable, Dict, Optional, Tuple
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -13,20 +13,27 @@ from .config import (
 from .location_manager import LocationManager
 from .item_manager import ItemManager
 from .puzzles import PuzzleManager
-from .commands.natural_commands import NaturalCommandHandler
-from .utils import SaveLoadManager, print_text, clear_screen
+from .puzzles.variants import session_variant
+from .commands.natural_commands import COMBINE_SEPARATORS, NaturalCommandHandler
+from .utils import SaveLoadManager, BatchedOutput, print_text, clear_screen
 from .game_art import display_title_screen
-from .media import present
+from .media import present, prefetch_for_location
+from .content import CONTENT_STORE
+from . import events
 
 TROLLEY_COMMANDS = {"next", "off", "status", "history"}
 
 class GameManager:
     """Main game manager class handling game state and core gameplay loop."""
     
-    def __init__(self):
-        """Initialize the game manager and all subsystems."""
-        # Ensure save directory exists
-        Path(SAVE_DIR).mkdir(parents=True, exist_ok=True)
+    def __init__(self, save_dir: Path = SAVE_DIR):
+        """Initialize the game manager and all subsystems.
+
+        save_dir is where this game's saves go; network sessions each get
+        their own.
+        """
+        # Created on the first save (see SaveLoadManager)
+        self.save_dir = Path(save_dir)
 
         # Initialize managers
         self.init_managers()
@@ -41,16 +48,50 @@ class GameManager:
         # Brief mode: track last displayed location so description only shows on move
         self._last_location: Optional[str] = None
 
+        # Set when the last command didn't do what was asked; ends a chained batch
+        self.last_command_failed = False
+
+        # Reads a line of player input; front ends other than the plain
+        # terminal (see tui.py) replace it. None means input().
+        self.read_line: Optional[Callable[[str], str]] = None
+
+        # Command dispatch table, built once
+        self._handlers = {
+            "go": self._handle_movement,
+            "take": self._handle_take_item,
+            "examine": self._handle_examine,
+            "inventory": self._handle_inventory,
+            "save": self._handle_save,
+            "load": self._handle_load,
+            "solve": self._handle_puzzle,
+            "tune": self._handle_tune,
+            "scan": self._handle_scan,
+            "trace": self._handle_trace,
+            "help": self._handle_help,
+            "look": self._handle_look,
+            "use": self._handle_use_item,
+            "combine": self._handle_combine_items,
+            "drop": self._handle_drop_item,
+            "score": self._handle_score,
+            "exits": self._handle_exits,
+        }
+
+        # Everything printed during a turn goes out in one write
+        self.output = BatchedOutput()
+
         # Configure logging
         self._setup_logging()
 
     def init_managers(self) -> None:
         """Initialize all game subsystem managers."""
-        self.location_manager = LocationManager()
-        self.puzzle_manager = PuzzleManager()
-        self.item_manager = ItemManager()
+        self.content = CONTENT_STORE.current
+        self.location_manager = LocationManager(self.content)
+        # Solutions are asked for the way commands are, so a network session reads its own player
+        self.puzzle_manager = PuzzleManager(solution_provider=self._ask_for_solution, variant=session_variant())
+        self.item_manager = ItemManager(self.content)
+        self.item_manager.clues = self.puzzle_manager.clue_text
         self.command_handler = NaturalCommandHandler()
-        self.save_load_manager = SaveLoadManager(SAVE_DIR)
+        self.save_load_manager = SaveLoadManager(self.save_dir)
 
     def _setup_logging(self) -> None:
         """Configure logging system."""
@@ -66,9 +107,17 @@ class GameManager:
         Process a single game command.
         Returns True if game should continue, False if it should end.
         """
+        with self.output.collecting():
+            return self._process_command(command)
+
+    def _process_command(self, command: str) -> bool:
+        self.last_command_failed = False
         if not command:
             return True
-            
+        logging.info(f"Command: {command}")
+
+        self._sync_content()
+
         if command == "quit":
             return self.handle_quit()
             
@@ -77,11 +126,14 @@ class GameManager:
         if not command_type:
             # A bare named exit ("outside", "upstairs", "tavern", "o") is movement.
             words = command.split()
-            if len(words) == 1 and self.location_manager.resolve_exit(words[0]):
-                self._handle_movement(words[0])
+            if len(words) == 1 and self._resolve_exit(words[0]):
+                self.last_command_failed = self._handle_movement(words[0]) is False
+                return True
+            command_type, args = self.command_handler.understand_with_corrections(command)
+            if not command_type:
+                self.last_command_failed = True
+                print_text("Diamond considered that, then decided it wasn't productive. (Type 'help' for commands.)")
                 return True
-            print_text("Diamond considered that, then decided it wasn't productive. (Type 'help' for commands.)")
-            return True
         
         if command_type in TROLLEY_COMMANDS:
             self._handle_trolley_command(command_type)
@@ -89,59 +141,164 @@ class GameManager:
         
         if command_type not in BASIC_COMMANDS and command_type not in COMPLEX_COMMANDS:
             logging.warning(f"Invalid command type received: {command_type}")
+            self.last_command_failed = True
             print_text("I don't understand that command. Type 'help' for available commands.")
             return True
             
-        handlers = {
-            "go": self._handle_movement,
-            "take": self._handle_take_item,
-            "examine": self._handle_examine,
-            "inventory": self._handle_inventory,
-            "save": self._handle_save,
-            "load": self._handle_load,
-            "solve": self._handle_puzzle,
-            "help": self._handle_help,
-            "look": self._handle_look,
-            "use": self._handle_use_item,
-            "combine": self._handle_combine_items,
-            "drop": self._handle_drop_item,
-            "score": self._handle_score,
-            "exits": self._handle_exits,
-        }
-        
-        if command_type in handlers:
-            handlers[command_type](args)
+        handler = self._handlers.get(command_type)
+        if handler:
+            # Handlers that can fail return False; the rest return None
+            self.last_command_failed = handler(args) is False
             
         return True
 
-    def _handle_movement(self, direction: str) -> None:
+    def play_turn(self, command: str) -> bool:
+        """Run one command and the end-of-turn darkness and win checks.
+
+        Returns True if the game should continue.
+        """
+        score = self.game_state.get("score", 0)
+        stream = events.active()
+        if stream is not None:
+            location_manager = self.location_manager
+            stream.set_scope(
+                [*location_manager.get_available_items(), *self.item_manager.get_inventory()],
+                location_manager.get_valid_exits(),
+            )
+        try:
+            if not self.process_command(command):
+                return False
+            if self._check_darkness():
+                return False
+            if self.check_game_progress():
+                self.show_victory()
+                return False
+            return True
+        finally:
+            new_score = self.game_state.get("score", 0)
+            if new_score != score:
+                events.emit("score", score=new_score, delta=new_score - score)
+
+    def play_line(self, line: str) -> bool:
+        """Run every command chained on one line of input as a single batch.
+
+        Each step is a full turn. The batch stops at the first command that
+        fails, and its output goes out in one write rather than one per
+        command. Returns True if the game should continue.
+        """
+        commands = self.command_handler.split_commands(line)
+        if len(commands) <= 1:
+            return self.play_turn(commands[0] if commands else "")
+
+        with self.output.collecting():
+            for step, command in enumerate(commands, 1):
+                if not self.play_turn(command):
+                    return False
+                if self.last_command_failed:
+                    if step < len(commands):
+                        print_text(f"(Stopped there — skipped: {'; '.join(commands[step:])})")
+                    break
+                if step < len(commands):
+                    self.show_location_if_changed()
+        return True
+
+    def prompt(self, text: str) -> str:
+        """Ask the player for input, first writing out the turn so far."""
+        self.output.flush()
+        return (self.read_line or input)(text)
+
+    def _ask_for_solution(self, location: str) -> Optional[str]:
+        """Prompt the player for a puzzle's solution."""
+        try:
+            return self.prompt(f"\nEnter solution for the puzzle at {location}: ").strip()
+        except (EOFError, KeyboardInterrupt):
+            return None
+
+    def handle_line(self, line: str) -> bool:
+        """Play one line of input, then show the location if it changed.
+
+        All of it - every chained command, the darkness / grue and win
+        checks, the new location - goes out in one write before the next
+        prompt. Returns True if the game should continue.
+        """
+        with self.output.collecting():
+            if not self.play_line(line):
+                return False
+            self.check_auto_save()
+            self.show_location_if_changed()
+        return True
+
+    def show_location_if_changed(self) -> None:
+        """Describe the current location if the player has moved since it was last shown."""
+        current_location = self.location_manager.current_location
+        if current_location != self._last_location:
+            print_text("\n" + self.location_manager.get_location_description())
+            self._last_location = current_location
+
+    def _sync_content(self) -> None:
+        """Pick up a newly published content generation at the turn boundary."""
+        current = CONTENT_STORE.current
+        if current is not self.content:
+            self.location_manager.apply_content(current)
+            self.item_manager.apply_content(current)
+            self.content = current
+
+    def _resolve_item(self, item: str) -> str:
+        """Map what the player typed to an item here or in hand, forgiving typos.
+
+        Returns the input unchanged when nothing in scope is a clear match, so
+        the usual "no such item" messages still name what the player typed.
+        """
+        scope = [*self.location_manager.get_available_items(), *self.item_manager.get_inventory()]
+        return self.command_handler.vocabulary.resolve(item, scope) or item
+
+    def _resolve_exit(self, direction: str) -> Optional[str]:
+        """Map what the player typed to an exit of the current location, forgiving typos."""
+        return self.location_manager.resolve_exit(direction) or self.command_handler.vocabulary.resolve(
+            direction, self.location_manager.get_valid_exits()
+        )
+
+    def _handle_movement(self, direction: str) -> bool:
         """Handle movement commands."""
-        self.location_manager.move_to_location(direction, self.game_state)
+        moved = self.location_manager.move_to_location(self._resolve_exit(direction) or direction, self.game_state)
+        if moved:
+            prefetch_for_location(self.location_manager.is_dark())
+        return moved
 
-    def _handle_take_item(self, item: str) -> None:
+    def _handle_take_item(self, item: str) -> bool:
         """Handle taking items, including 'take all'."""
         if not item:
             print_text("Take what?")
-            return
+            return False
         available_items = self.location_manager.get_available_items()
+        location = self.location_manager.current_location
         if item in ("all", "everything"):
             if not available_items:
                 print_text("There's nothing here worth taking.")
-                return
+                return False
+            taken = False
             for thing in list(available_items):
-                if self.item_manager.take_item(thing, available_items, self.game_state):
+                if self.item_manager.take_item(thing, available_items, self.game_state, location):
                     self.location_manager.remove_item(thing)
-            return
-        if self.item_manager.take_item(item, available_items, self.game_state):
+                    taken = True
+                elif self.item_manager.inventory.is_full():
+                    break
+            return taken
+        item = self._resolve_item(item)
+        if self.item_manager.take_item(item, available_items, self.game_state, location):
             self.location_manager.remove_item(item)
+            return True
+        return False
 
-    def _handle_examine(self, item: str) -> None:
+    def _handle_examine(self, item: str) -> bool:
         """Handle examining items."""
         if not item:
             print_text("Examine what?")
-            return
+            return False
         available_items = self.location_manager.get_available_items()
-        self.item_manager.examine_item(item, available_items, self.game_state)
+        return self.item_manager.examine_item(
+            self._resolve_item(item), available_items, self.game_state, self.location_manager.current_location
+        )
 
     def _handle_look(self, _: Any) -> None:
         """Describe the current location, respecting darkness."""
@@ -158,37 +315,50 @@ class GameManager:
         """Handle inventory command."""
         self.item_manager.show_inventory(self.game_state)
 
-    def _handle_use_item(self, item: str) -> None:
+    def _handle_use_item(self, item: str) -> bool:
         """Handle using an inventory item. Triggers a puzzle if the item activates one here."""
         if not item:
             print_text("Use what?")
-            return
+            return False
         location = self.location_manager.current_location
-        self.item_manager.use_item(item, location, self.game_state)
+        item = self._resolve_item(item)
+        used = self.item_manager.use_item(item, location, self.game_state)
         if self.puzzle_manager.should_trigger_on_use(item, location):
             self.puzzle_manager.handle_puzzle(location, self.item_manager.get_inventory(), self.game_state)
+        return used
 
-    def _handle_drop_item(self, item: str) -> None:
+    def _handle_drop_item(self, item: str) -> bool:
         """Handle dropping an inventory item into the current location."""
         if not item:
             print_text("Drop what?")
-            return
+            return False
+        item = self._resolve_item(item)
         if self.item_manager.drop_item(item):
             self.location_manager.add_item(item)
+            return True
+        return False
 
-    def _handle_combine_items(self, items: str) -> None:
-        """Handle combining inventory items."""
-        item1, item2 = self._parse_combine_args(items)
-        if not item1 or not item2:
+    def _handle_combine_items(self, items: str) -> bool:
+        """Handle combining inventory items, including 'combine all'."""
+        if items in ("all", "everything"):
+            return self.item_manager.combine_all(self.game_state) > 0
+        parts = self._parse_combine_args(items)
+        if len(parts) < 2 or not all(parts):
             print_text("Combine which items? Try 'combine notebook with cipher wheel'.")
-            return
-        self.item_manager.combine_items(item1, item2, self.game_state)
+            return False
+        parts = tuple(self._resolve_item(part) for part in parts)
+        if len(parts) == 2:
+            return self.item_manager.combine_items(parts[0], parts[1], self.game_state)
+        return self.item_manager.combine_set(list(parts), self.game_state)
 
     def _handle_save(self, _: Any) -> None:
         """Handle save command."""
-        save_name = input("\nEnter save name (or press Enter for default): ").strip()
+        save_name = self.prompt("\nEnter save name (or press Enter for default): ").strip()
         if not save_name:
             save_name = "manual_save"
+        if not self.save_load_manager.valid_name(save_name):
+            print_text("A save name can't contain slashes, colons or '..'.")
+            return
         if self.save_load_manager.save_game(self, save_name):
             print_text("Game saved successfully!")
 
@@ -203,7 +373,7 @@ class GameManager:
         for i, save in enumerate(saves):
             print_text(f"{i+1}. {save['name']} - {save['date']}")
         
-        choice = input("\nEnter save number to load (or press Enter to cancel): ").strip()
+        choice = self.prompt("\nEnter save number to load (or press Enter to cancel): ").strip()
         if choice and choice.isdigit() and 0 < int(choice) <= len(saves):
             save_name = saves[int(choice)-1]['name']
             if self.save_load_manager.load_game(self, save_name):
@@ -219,6 +389,30 @@ class GameManager:
             self.game_state
         )
 
+    def _handle_tune(self, setting: str) -> bool:
+        """Turn the dial of the radio here, if there is one."""
+        radio = self.puzzle_manager.radio_at(self.location_manager.current_location)
+        if radio is None:
+            print_text("There's no radio here to tune.")
+            return False
+        return radio.tune(setting)
+
+    def _handle_scan(self, setting: str) -> bool:
+        """Sweep the band on the radio here, if there is one."""
+        radio = self.puzzle_manager.radio_at(self.location_manager.current_location)
+        if radio is None:
+            print_text("There's no radio here to scan with.")
+            return False
+        return radio.scan(setting)
+
+    def _handle_trace(self, query: str) -> bool:
+        """Look up a plate in the vehicle registry, from where the call box is."""
+        car = self.puzzle_manager.car_at(self.location_manager.current_location)
+        if car is None:
+            print_text("You'd need a telephone to reach the Department of Licenses.")
+            return False
+        return car.trace(query)
+
     def _handle_help(self, _: Any) -> None:
         """Display help information."""
         self.show_help()
@@ -274,7 +468,7 @@ class GameManager:
         )
         saves = self.save_load_manager.list_saves()
         if saves:
-            choice = input("\nRestore last save? (y/n) ").strip().lower()
+            choice = self.prompt("\nRestore last save? (y/n) ").strip().lower()
             if choice.startswith("y"):
                 # list_saves() is sorted newest-first
                 save_name = saves[0]["name"]
@@ -285,7 +479,8 @@ class GameManager:
 
     def handle_quit(self) -> bool:
         """Handle quit command and return False to end game."""
-        if input("\nSave before quitting? (y/n) ").lower().startswith('y'):
+        logging.info(f"Parse cache: {self.command_handler.parse_cache_stats()}")
+        if self.prompt("\nSave before quitting? (y/n) ").lower().startswith('y'):
             self.save_load_manager.save_game(self, "quit_save")
         print_text("\nThanks for playing!")
         return False
@@ -309,29 +504,12 @@ class GameManager:
         try:
             display_title_screen()
             self._last_location = None
+            self.show_location_if_changed()
 
             while True:
-                self.check_auto_save()
-
-                # Show location description only when location changes
-                current_location = self.location_manager.current_location
-                if current_location != self._last_location:
-                    print_text("\n" + self.location_manager.get_location_description())
-                    self._last_location = current_location
-
-                # Get and process command
-                command = input("\n> ").strip().lower()
-
-                if not self.process_command(command):
-                    break
-
-                # Check darkness / grue
-                if self._check_darkness():
-                    break
-
-                # Check win condition
-                if self.check_game_progress():
-                    self.show_victory()
+                events.emit("prompt", text="> ")
+                line = self.prompt("\n> ").strip().lower()
+                if not self.handle_line(line):
                     break
 
         except KeyboardInterrupt:
@@ -345,18 +523,21 @@ class GameManager:
             self.save_load_manager.save_game(self, "error_save")
             raise
 
-    def _parse_combine_args(self, items: str) -> Tuple[str, str]:
-        """Parse user input for the combine command."""
+    def _parse_combine_args(self, items: str) -> Tuple[str, ...]:
+        """Parse user input for the combine command into the items named.
+
+        'a with b', 'a and b', 'a, b and c' name their items explicitly; a bare
+        'a b' is read as the first word and the rest.
+        """
         if not items:
             return "", ""
-        lowered = items.lower()
-        for separator in (" with ", " and "):
-            if separator in lowered:
-                left, right = lowered.split(separator, 1)
-                return left.strip(), right.strip()
-        parts = lowered.split()
+        lowered = items.lower().strip()
+        parts = [part.strip() for part in COMBINE_SEPARATORS.split(lowered)]
         if len(parts) >= 2:
-            return parts[0], " ".join(parts[1:]).strip()
+            return tuple(parts)
+        words = lowered.split()
+        if len(words) >= 2:
+            return words[0], " ".join(words[1:]).strip()
         return "", ""
 
     def show_help(self) -> None:
@@ -380,8 +561,13 @@ class GameManager:
             "  drop <item>           — set something down\n"
             "  use <item>            — put an item to work; may reveal a puzzle\n"
             "  combine <x> with <y>  — two clues are sometimes one clue\n"
+            "  combine all           — try everything you're carrying together\n"
             "  inventory (or i)      — check what you're carrying\n"
-            "  score                 — check your case progress\n\n"
+            "  score                 — check your case progress\n"
+            "  tune <MHz> / scan     — work a radio's dial, where there is one\n"
+            "  trace <plate>         — phone in a partial plate: 'trace 7?3-K* make ford'\n\n"
+            "  Several commands fit on one line: 'take all. upstairs; take photo then\n"
+            "  examine photo'. Diamond stops at the first one that doesn't work out.\n\n"
             "HOUSEKEEPING\n"
             "  save / load   — the city will still be here when you come back\n"
             "  quit          — end the session\n\n"
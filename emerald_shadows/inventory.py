@@ -0,0 +1,125 @@
+"""Ordered-set inventory for Emerald Shadows."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from typing import Dict, Iterable, Iterator, Optional
+
+from .config import INVENTORY_LIMIT
+
+
+class InventoryFullError(Exception):
+    """Raised when adding an item would exceed the carrying limit."""
+    pass
+
+
+class InventoryView(Collection):
+    """Live read-only view of an inventory's items; creating one copies nothing."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Dict[str, None]) -> None:
+        self._items = items
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, InventoryView):
+            return list(self._items) == list(other._items)
+        if isinstance(other, (list, tuple)):
+            return list(self._items) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"InventoryView({list(self._items)!r})"
+
+
+class Inventory:
+    """Items the player carries, in pickup order, with O(1) membership.
+
+    Backed by a dict used as an ordered set. Keeps the list-style ``append``,
+    ``extend`` and ``remove`` the rest of the game was written against, and
+    hands out live read-only views instead of copies. ``version`` increases
+    on every change so callers can cache anything derived from the contents.
+    """
+
+    __slots__ = ("_items", "limit", "version")
+
+    def __init__(self, items: Iterable[str] = (), limit: Optional[int] = INVENTORY_LIMIT) -> None:
+        # Restored saves are loaded as-is; the limit guards new pickups only.
+        self._items: Dict[str, None] = dict.fromkeys(items)
+        self.limit = limit
+        self.version = 0
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Inventory):
+            return list(self._items) == list(other._items)
+        if isinstance(other, (list, tuple)):
+            return list(self._items) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Inventory({list(self._items)!r})"
+
+    def is_full(self) -> bool:
+        """True if no more items can be picked up."""
+        return self.limit is not None and len(self._items) >= self.limit
+
+    def append(self, item: str) -> None:
+        """Add an item at the end. Adding an item already carried is a no-op.
+
+        Raises:
+            InventoryFullError: if the carrying limit has been reached.
+        """
+        if item in self._items:
+            return
+        if self.is_full():
+            raise InventoryFullError(f"Cannot carry more than {self.limit} items")
+        self._items[item] = None
+        self.version += 1
+
+    add = append
+
+    def extend(self, items: Iterable[str]) -> None:
+        for item in items:
+            self.append(item)
+
+    def remove(self, item: str) -> None:
+        """Remove an item, raising ValueError if it isn't carried (like list.remove)."""
+        try:
+            del self._items[item]
+        except KeyError:
+            raise ValueError(f"{item} is not in the inventory") from None
+        self.version += 1
+
+    def discard(self, item: str) -> None:
+        """Remove an item if it is carried."""
+        if self._items.pop(item, ...) is not ...:
+            self.version += 1
+
+    def view(self) -> InventoryView:
+        """A live, read-only view of the contents; nothing is copied."""
+        return InventoryView(self._items)
+
+    def to_list(self) -> list:
+        """A list copy, for saving."""
+        return list(self._items)
@@ -1,11 +1,14 @@
 """Location management system for Emerald Shadows."""
-from typing import Dict, Optional, List, Tuple, Any
+from typing import Dict, Optional, List, Tuple, Any, Collection, Union
+from collections import deque
 import json
 import logging
 from copy import deepcopy
 from dataclasses import dataclass
-from .config import STARTING_LOCATION
-from .config_locations import LOCATIONS
+from pathlib import Path
+from .content import CONTENT_STORE, LazyText, WorldContent
+from . import events
+from .content_pack import load_pack
 from .trolley_system import TrolleySystem, TrolleyState
 from .utils import print_text
 
@@ -13,12 +16,12 @@ from .utils import print_text
 class Location:
     """Data structure for location information."""
     name: str
-    description: str
+    description: Union[str, LazyText]
     exits: Dict[str, str]
     items: List[str]
     first_visit: bool = True
     requires: Optional[str] = None
-    historical_note: Optional[str] = None
+    historical_note: Optional[Union[str, LazyText]] = None
     dark: bool = False
 
 class LocationError(Exception):
@@ -48,8 +51,23 @@ class LocationManager:
         "leave": ("outside", "out", "off"),
     }
 
-    def __init__(self) -> None:
-        """Initialize the LocationManager with all game locations and routes."""
+    def __init__(
+        self,
+        content: Optional[WorldContent] = None,
+        pack: Optional[Path] = None,
+        regions: Optional[Collection[str]] = None,
+    ) -> None:
+        """Initialize the LocationManager with all game locations and routes.
+
+        Args:
+            content: World content generation to build from; defaults to the
+                store's current generation.
+            pack: JSON-lines content pack to stream the world from instead.
+            regions: With ``pack``, load only these regions of the city.
+        """
+        if pack is not None:
+            content = load_pack(pack, regions)
+        self.content = content or CONTENT_STORE.current
         self._initialize_locations()
         self.trolley = TrolleySystem()
         self.last_command: Optional[str] = None
@@ -57,35 +75,68 @@ class LocationManager:
     def _initialize_locations(self) -> None:
         """Initialize location data structures."""
         try:
-            self.current_location: str = STARTING_LOCATION
+            self.current_location: str = self.content.start
             self.locations: Dict[str, Location] = {}
             self.original_items: Dict[str, List[str]] = {}
             
-            for name, data in LOCATIONS.items():
+            for name, data in self.content.locations.items():
                 # Convert dictionary data to Location objects
                 location = Location(
                     name=name,
                     description=data["description"],
-                    exits=data["exits"].copy(),
-                    items=data.get("items", []).copy(),
+                    exits=dict(data["exits"]),
+                    items=list(data.get("items", ())),
                     first_visit=True,
                     requires=data.get("requires"),
                     historical_note=data.get("historical_note"),
                     dark=data.get("dark", False)
                 )
                 self.locations[name] = location
-                self.original_items[name] = data.get("items", []).copy()
+                self.original_items[name] = list(data.get("items", ()))
                 
             logging.info("Locations initialized successfully")
         except Exception as e:
             logging.error(f"Failed to initialize locations: {e}")
             raise LocationError("Could not initialize game locations")
 
+    def apply_content(self, content: WorldContent) -> None:
+        """Rebind to a newer content generation, keeping per-session state.
+
+        Text, exits, requirements and darkness come from the new generation;
+        room items and first-visit flags stay as this session left them. The
+        trolley's exits are driven by the ride, so they are left alone.
+        """
+        try:
+            for name, data in content.locations.items():
+                location = self.locations.get(name)
+                if location is None:
+                    self.locations[name] = Location(
+                        name=name,
+                        description=data["description"],
+                        exits=dict(data["exits"]),
+                        items=list(data.get("items", ())),
+                        requires=data.get("requires"),
+                        historical_note=data.get("historical_note"),
+                        dark=data.get("dark", False)
+                    )
+                else:
+                    location.description = data["description"]
+                    location.requires = data.get("requires")
+                    location.historical_note = data.get("historical_note")
+                    location.dark = data.get("dark", False)
+                    if name != "trolley":
+                        location.exits = dict(data["exits"])
+                self.original_items[name] = list(data.get("items", ()))
+            self.content = content
+            logging.info(f"Location manager moved to content generation {content.generation}")
+        except Exception as e:
+            logging.error(f"Error applying content generation {content.generation}: {e}")
+
     def get_location_description(self) -> str:
         """Get the description of the current location with available exits and items."""
         try:
             location = self.locations[self.current_location]
-            description_parts = [location.description]
+            description_parts = [str(location.description)]
 
             # Add available exits
             if location.exits:
@@ -97,7 +148,12 @@ class LocationManager:
                 item_list = ", ".join(location.items)
                 description_parts.append(f"\nYou can see: {item_list}")
         
-            return "\n".join(description_parts)
+            text = "\n".join(description_parts)
+            events.describe_location(
+                self.current_location, description_parts[0],
+                list(location.exits), list(location.items), text
+            )
+            return text
             
         except KeyError:
             logging.error(f"Invalid location reference: {self.current_location}")
@@ -147,6 +203,12 @@ class LocationManager:
 
             new_location_name = current_location.exits[resolved]
 
+            # Rooms in another region of a partial content pack live on another worker
+            if new_location_name in self.content.boundary and new_location_name not in self.locations:
+                logging.info(f"Exit to {new_location_name} crosses the hosted region boundary")
+                print_text("That part of the city is out of reach from here.")
+                return False
+
             # Handle trolley as special case
             if new_location_name == "trolley":
                 return self._handle_trolley_movement()
@@ -336,6 +398,47 @@ class LocationManager:
             logging.error(f"Error getting valid exits: {e}")
             return []
 
+    def find_path(self, destination: str, game_state: Optional[Dict] = None) -> Optional[List[str]]:
+        """
+        Find the shortest route from the current location to a destination.
+
+        Args:
+            destination: Location name to reach
+            game_state: If given, rooms whose requirements are unmet are avoided
+
+        Returns:
+            The exit names to follow in order, an empty list if already there,
+            or None if the destination can't be reached on foot.
+        """
+        try:
+            if destination not in self.locations:
+                return None
+            if destination == self.current_location:
+                return []
+
+            came_from: Dict[str, Tuple[str, str]] = {self.current_location: ("", "")}
+            frontier = deque([self.current_location])
+            while frontier:
+                name = frontier.popleft()
+                for direction, neighbour in self.locations[name].exits.items():
+                    if neighbour in came_from or neighbour == "trolley" or neighbour not in self.locations:
+                        continue
+                    requires = self.locations[neighbour].requires
+                    if game_state is not None and requires and not game_state.get(requires, False):
+                        continue
+                    came_from[neighbour] = (name, direction)
+                    if neighbour == destination:
+                        path: List[str] = []
+                        while neighbour != self.current_location:
+                            neighbour, step = came_from[neighbour]
+                            path.append(step)
+                        return path[::-1]
+                    frontier.append(neighbour)
+            return None
+        except Exception as e:
+            logging.error(f"Error finding path to {destination}: {e}")
+            return None
+
     def get_requirements(self, location: str) -> Optional[str]:
         """Get requirements for accessing a location."""
         try:
@@ -1,11 +1,21 @@
 """Main entry point for Emerald Shadows."""
 
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, TextIO, Tuple
 from .game_manager import GameManager
-from .config import LOG_FILE, LOG_FORMAT, SAVE_DIR, check_filesystem
+from .config import (
+    LOG_FILE, LOG_FORMAT, SAVE_DIR, CONTENT_RELOAD_ENV, CONTENT_PACK_ENV,
+    CONTENT_REGIONS_ENV, EVENTS_ENV, TUI_ENV, check_filesystem
+)
+from . import events, terminal
+from .commands.completion import install_completion
+from .content import CONTENT_STORE, ContentWatcher
+from .content_pack import PackWatcher, load_pack
+from .tui import run_tui
+from .utils import DisplayManager
 
 def _enable_utf8_output() -> None:
     """Make stdout/stderr render the game's Unicode art on Windows consoles that
@@ -50,20 +60,72 @@ def ensure_directories() -> None:
     # Create save directory if it doesn't exist
     Path(SAVE_DIR).mkdir(parents=True, exist_ok=True)
 
+def content_pack_settings() -> Tuple[Optional[Path], Optional[List[str]]]:
+    """The pack named by EMERALD_CONTENT_PACK, if any, and the regions to host."""
+    pack = os.environ.get(CONTENT_PACK_ENV, "").strip()
+    regions = [r.strip() for r in os.environ.get(CONTENT_REGIONS_ENV, "").split(",") if r.strip()]
+    return (Path(pack) if pack else None), (regions or None)
+
+def hot_reload_enabled() -> bool:
+    """True when EMERALD_HOT_RELOAD asks for content to be watched."""
+    return os.environ.get(CONTENT_RELOAD_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+def install_content_pack() -> None:
+    """Serve the world from an external content pack when EMERALD_CONTENT_PACK is set."""
+    pack, regions = content_pack_settings()
+    if pack is None:
+        return
+    CONTENT_STORE.install(load_pack(pack, regions, snapshot=hot_reload_enabled()))
+    logging.info(f"Serving content pack {pack}")
+
+def start_content_watcher() -> Optional[ContentWatcher]:
+    """Start hot-reloading world content when EMERALD_HOT_RELOAD is set.
+
+    A served content pack is watched in place of the config source files.
+    """
+    if not hot_reload_enabled():
+        return None
+    pack, regions = content_pack_settings()
+    watcher = PackWatcher(CONTENT_STORE, pack, regions) if pack else ContentWatcher(CONTENT_STORE)
+    watcher.start()
+    logging.info("Content hot-reload enabled")
+    return watcher
+
+def open_event_stream() -> Optional[TextIO]:
+    """Write the game's JSON-lines event stream to the file named by EMERALD_EVENTS."""
+    path = os.environ.get(EVENTS_ENV, "").strip()
+    if not path:
+        return None
+    handle = open(path, "a", encoding="utf-8", buffering=1)
+    events.set_stream(events.EventStream(handle))
+    logging.info(f"Writing game events to {path}")
+    return handle
+
 def main() -> None:
     """Main entry point for the game."""
     handler = None
+    watcher = None
+    event_file = None
     try:
         # Setup
         _enable_utf8_output()
+        terminal.info()
         ensure_directories()
         check_filesystem()
         handler = setup_logging()
+        DisplayManager.watch_terminal_resize()
         logging.info("Starting Emerald Shadows")
+        install_content_pack()
+        watcher = start_content_watcher()
+        event_file = open_event_stream()
         
         # Initialize and start game
         game = GameManager()
-        game.start_game()
+        full_screen = os.environ.get(TUI_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+        if not (full_screen and sys.stdin.isatty() and run_tui(game)):
+            if sys.stdin.isatty():
+                install_completion(game)
+            game.start_game()
         
     except KeyboardInterrupt:
         print("\nGame terminated by user.")
@@ -75,6 +137,10 @@ def main() -> None:
         
     finally:
         # Cleanup
+        if watcher:
+            watcher.stop()
+        if event_file:
+            event_file.close()
         cleanup_logging(handler)
         sys.exit(0)
 
@@ -12,12 +12,14 @@ function here is safe to call unconditionally and never raises into the loop.
 
 from __future__ import annotations
 
+import contextvars
 import os
 import sys
 import time
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
 
-from . import game_art
+from . import events, game_art, terminal
 
 
 def _flag_on(name: str) -> bool:
@@ -30,18 +32,16 @@ def art_enabled() -> bool:
 
     Suppressed when stdout is redirected/captured (pytest, pipes, CI) or when
     EMERALD_NO_ART is set. This is what keeps the 253-test suite output clean.
+    Reads the startup probe in ``terminal``, the same one ``DisplayManager``
+    uses.
     """
-    if _flag_on("EMERALD_NO_ART"):
-        return False
-    try:
-        return bool(sys.stdout.isatty())
-    except Exception:
-        return False
+    return not _flag_on("EMERALD_NO_ART") and terminal.info().interactive
 
 
 def color_enabled() -> bool:
-    """ANSI color is allowed only when art is, and honors the NO_COLOR convention."""
-    return art_enabled() and not _flag_on("NO_COLOR")
+    """ANSI color is allowed only when art is, the terminal has colors, and
+    NO_COLOR is not set."""
+    return art_enabled() and not _flag_on("NO_COLOR") and terminal.info().colors >= 8
 
 
 def audio_enabled() -> bool:
@@ -49,6 +49,66 @@ def audio_enabled() -> bool:
     return False
 
 
+@dataclass(frozen=True)
+class Capabilities:
+    """What one output stream can show: art at all, ANSI color, its encoding,
+    its width in columns if art must be cut to fit (None: no limit), and
+    whether art may be revealed line by line or must appear all at once."""
+    art: bool
+    color: bool
+    encoding: str = "utf-8"
+    width: Optional[int] = None
+    animate: bool = True
+
+
+PLAIN = Capabilities(art=True, color=False)
+COLOR = Capabilities(art=True, color=True)
+STILL = Capabilities(art=True, color=False, animate=False)
+
+# Set by a front end that draws art itself (see set_capabilities)
+_override: Optional[Capabilities] = None
+# A network session's own capabilities, which win over the detected ones
+_session: contextvars.ContextVar[Optional[Capabilities]] = contextvars.ContextVar(
+    "media_capabilities", default=None
+)
+
+
+def _probed_capabilities(info: terminal.TerminalInfo) -> Capabilities:
+    return Capabilities(art_enabled(), color_enabled(), info.encoding)
+
+
+def terminal_capabilities() -> Capabilities:
+    """Capabilities of this process's terminal, from the probe ``terminal``
+    makes once at startup. They are worked out once and kept with the probe.
+
+    Call terminal.reset() if stdout or the environment changes.
+    """
+    session = _session.get()
+    if session is not None:
+        return session
+    if _override is not None:
+        return _override
+    return terminal.derived("media", _probed_capabilities)
+
+
+def reset_capabilities() -> None:
+    """Go back to the terminal's own capabilities after set_capabilities()."""
+    global _override
+    _override = None
+
+
+def set_capabilities(capabilities: Capabilities) -> None:
+    """Use these capabilities instead of the terminal's, e.g. for a front end
+    that draws art inside its own window."""
+    global _override
+    _override = capabilities
+
+
+def use_session_capabilities(capabilities: Optional[Capabilities]) -> None:
+    """Present this session's moments with its own capabilities."""
+    _session.set(capabilities)
+
+
 # Registry of narrative moments -> presentation assets. Adding a new visual or
 # audio beat is a data change here plus a single present("key") call in the game.
 # 'audio' paths are placeholders reserved for the roadmap's audio phase.
@@ -57,40 +117,134 @@ MOMENTS: Dict[str, Dict[str, Any]] = {
         "art": game_art.GRUE_ART,
         "color": game_art.BRIGHT_GREEN,
         "animate": True,
+        "prefetch_dark": True,  # rendered ahead on entering a dark place
         "audio": None,  # future: sounds/grue_death.wav
     },
 }
 
 
-def _emit(text: str) -> None:
-    """Write text to stdout, falling back to raw UTF-8 bytes when the console's
-    encoding (e.g. cp1252 on Windows) can't represent the block-art glyphs."""
+ANIMATION_FRAME_SECONDS = 0.04  # pause between revealed lines of animated art
+
+Writer = Callable[[bytes], Any]
+
+
+@dataclass(frozen=True)
+class RenderedArt:
+    """Art ready to write: one frame per line for animation, and the whole block."""
+    frames: Tuple[bytes, ...]
+    block: bytes
+
+
+# (moment key, color, encoding, width) -> rendered art
+_rendered: Dict[Tuple[str, bool, str, Optional[int]], RenderedArt] = {}
+
+
+def render_art(art: str, color: Optional[str], encoding: str,
+               width: Optional[int] = None) -> RenderedArt:
+    """Render an art block to bytes, preceded by a blank line.
+
+    Lines are cut at width, when given, rather than left for the terminal to
+    wrap. Text the encoding can't represent (block glyphs on a cp1252
+    console) is sent as UTF-8 instead, which most such consoles still display.
+    """
+    lines = [
+        f"{color}{line}{game_art.RESET}\n" if color else f"{line}\n"
+        for line in (line[:width] for line in art.strip("\n").splitlines())
+    ]
+    lines[0] = "\n" + lines[0]
+    try:
+        frames = tuple(line.encode(encoding) for line in lines)
+    except (UnicodeEncodeError, LookupError):
+        frames = tuple(line.encode("utf-8") for line in lines)
+    return RenderedArt(frames, b"".join(frames))
+
+
+def rendered(moment_key: str, capabilities: Capabilities) -> Optional[RenderedArt]:
+    """A moment's art rendered for a capability profile, built on first use."""
+    moment = MOMENTS.get(moment_key)
+    if not moment or not moment.get("art"):
+        return None
+    color = moment.get("color") if capabilities.color else None
+    key = (moment_key, bool(color), capabilities.encoding, capabilities.width)
+    art = _rendered.get(key)
+    if art is None:
+        art = _rendered[key] = render_art(moment["art"], color, capabilities.encoding, capabilities.width)
+    return art
+
+
+def prefetch(moment_keys: Iterable[str], capabilities: Optional[Capabilities] = None) -> None:
+    """Render moments ahead of time so presenting them is just a write."""
     try:
-        sys.stdout.write(text)
-    except UnicodeEncodeError:
-        try:
-            sys.stdout.flush()
-            sys.stdout.buffer.write(text.encode("utf-8"))
-            sys.stdout.buffer.flush()
-        except Exception:
-            pass
-
-
-def _render_art(art: str, color: Optional[str], animate: bool) -> None:
-    """Print an art block, optionally colorized and revealed line by line."""
-    use_color = bool(color) and color_enabled()
-    for line in art.strip("\n").splitlines():
-        _emit(f"{color}{line}{game_art.RESET}\n" if use_color else f"{line}\n")
-        if animate:
-            sys.stdout.flush()
-            time.sleep(0.04)
-
-
-def present(moment_key: str) -> bool:
+        capabilities = capabilities or terminal_capabilities()
+        if capabilities.art:
+            for key in moment_keys:
+                rendered(key, capabilities)
+    except Exception:
+        pass
+
+
+def prefetch_for_location(dark: bool, capabilities: Optional[Capabilities] = None) -> None:
+    """Render the moments likely to follow entering a location."""
+    if dark:
+        prefetch((key for key, moment in MOMENTS.items() if moment.get("prefetch_dark")), capabilities)
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write rendered bytes to stdout in one call, through the text layer if it has no buffer."""
+    try:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data)
+    except AttributeError:
+        sys.stdout.write(data.decode(terminal_capabilities().encoding, errors="replace"))
+
+
+def _flush_stdout() -> None:
+    try:
+        sys.stdout.flush()
+        sys.stdout.buffer.flush()
+    except Exception:
+        pass
+
+
+class BlockingClock:
+    """Plays animation frames in the calling thread, sleeping between them.
+
+    The reveal finishes before present() returns. The telnet server runs each
+    session in a thread of its own, so a reveal there holds up only the
+    player who is watching it.
+    """
+
+    def __init__(self, sleep: Callable[[float], Any] = time.sleep) -> None:
+        self.sleep = sleep
+
+    def animate(self, frames: Sequence[bytes], interval: float, write: Writer,
+                flush: Callable[[], Any]) -> None:
+        for index, frame in enumerate(frames):
+            write(frame)
+            flush()
+            if index + 1 < len(frames):
+                self.sleep(interval)
+
+
+_clock: Any = BlockingClock()
+
+
+def set_clock(clock: Any) -> Any:
+    """Choose how animations are timed. Returns the previous clock."""
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
+
+
+def present(moment_key: str, write: Optional[Writer] = None,
+            capabilities: Optional[Capabilities] = None) -> bool:
     """Present a narrative moment's media. Returns True if anything was shown.
 
     Safe to call from anywhere: no-ops on non-interactive terminals and
     swallows any rendering error rather than disturbing the game loop.
+    ``write`` sends the rendered bytes somewhere other than stdout (a network
+    session, say) with that session's ``capabilities`` (plain art by
+    default); animation timing comes from the clock set by set_clock().
     """
     moment = MOMENTS.get(moment_key)
     if not moment:
@@ -98,9 +252,17 @@ def present(moment_key: str) -> bool:
 
     shown = False
     try:
-        if moment.get("art") and art_enabled():
-            sys.stdout.write("\n")
-            _render_art(moment["art"], moment.get("color"), moment.get("animate", False))
+        events.emit("media", moment=moment_key)
+        if capabilities is None:
+            capabilities = PLAIN if write is not None else terminal_capabilities()
+        art = rendered(moment_key, capabilities) if capabilities.art else None
+        if art is not None:
+            emit, flush = (write, lambda: None) if write is not None else (_write_stdout, _flush_stdout)
+            if moment.get("animate", False) and capabilities.animate:
+                _clock.animate(art.frames, ANIMATION_FRAME_SECONDS, emit, flush)
+            else:
+                emit(art.block)
+                flush()
             shown = True
         # Audio playback is reserved for roadmap phase 3:
         # if moment.get("audio") and audio_enabled():
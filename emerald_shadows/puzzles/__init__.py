@@ -6,5 +6,9 @@ from .radio_puzzle import RadioPuzzle
 from .cipher_puzzle import CipherPuzzle
 from .morse_puzzle import MorsePuzzle
 from .car_puzzle import CarPuzzle
+from .variants import PuzzleVariant, generate_variant
 
-__all__ = ["PuzzleManager", "BasePuzzle", "RadioPuzzle", "CipherPuzzle", "MorsePuzzle", "CarPuzzle"]
+__all__ = [
+    "PuzzleManager", "BasePuzzle", "RadioPuzzle", "CipherPuzzle", "MorsePuzzle", "CarPuzzle",
+    "PuzzleVariant", "generate_variant",
+]
@@ -1,7 +1,7 @@
 """Abstract base class for all puzzles in Emerald Shadows."""
 
 from abc import ABC, abstractmethod
-from typing import Set, Tuple
+from typing import Collection, Set, Tuple
 
 
 class BasePuzzle(ABC):
@@ -12,9 +12,9 @@ class BasePuzzle(ABC):
         self.required_items = required_items
         self.description = description
 
-    def check_requirements(self, inventory: Set[str]) -> bool:
+    def check_requirements(self, inventory: Collection[str]) -> bool:
         """Return True if the player has all items needed for this puzzle."""
-        return self.required_items.issubset(inventory)
+        return all(item in inventory for item in self.required_items)
 
     @abstractmethod
     def attempt(self, solution: str) -> Tuple[bool, str]:
@@ -1,9 +1,13 @@
-"""Car licence plate puzzle — pioneer_square (reserved for future expansion)."""
+"""Car licence plate puzzle — pioneer_square."""
 
 from typing import Tuple
 from .base_puzzle import BasePuzzle
+from ..config import REGISTRY_RESULTS
+from ..utils import print_text
+from . import vehicle_registry
+from .vehicle_registry import QueryError, SMUGGLERS_PLATE
 
-_CORRECT_PLATE = "WA-4471"
+_CORRECT_PLATE = SMUGGLERS_PLATE
 _LOCATION = "pioneer_square"
 
 
@@ -14,7 +18,11 @@ class CarPuzzle(BasePuzzle):
         super().__init__(
             location=_LOCATION,
             required_items={"notebook"},
-            description="Your notes describe a blue sedan seen near three crime scenes. Can you pin down the plate number?",
+            description=(
+                "Your notes describe a blue sedan seen near three crime scenes. Can you pin down the plate number? "
+                "The call box on the corner reaches the Department of Licenses: 'trace WA-44??', or add "
+                "'make ford' or 'owner <name>'."
+            ),
         )
 
     def attempt(self, solution: str) -> Tuple[bool, str]:
@@ -24,3 +32,30 @@ class CarPuzzle(BasePuzzle):
                 "WA-4471 — registered to a shell company. That's your blue sedan.",
             )
         return False, "That plate doesn't match the witness descriptions."
+
+    def trace(self, query: str) -> bool:
+        """Have the licence clerk look up a partial plate, make and owner."""
+        plate, make, owner = vehicle_registry.parse_query(query)
+        if plate == "*" and not make and not owner:
+            print_text("The clerk sighs down the line. 'Trace what, Detective? A plate, a make, an owner?'")
+            return False
+        try:
+            plate = vehicle_registry.normalize_pattern(plate)
+            found = vehicle_registry.shared().search(plate, make, owner, limit=REGISTRY_RESULTS + 1)
+        except QueryError as error:
+            print_text(str(error))
+            return False
+        asked = " ".join(filter(None, [
+            plate if plate != "*" else "", f"make {make}" if make else "", f"owner {owner}" if owner else "",
+        ]))
+        print_text(f"\nYou read '{asked.upper()}' down the line to the Department of Licenses.")
+        if not found:
+            print_text("A long wait, paper shuffling. 'Nothing on file like that, Detective.'")
+            return True
+        for vehicle in found[:REGISTRY_RESULTS]:
+            print_text("  " + vehicle.describe(), wrap=False)
+        if len(found) > REGISTRY_RESULTS:
+            print_text("'There's more where those came from. Narrow it down for me, would you?'")
+        if any(vehicle.plate == _CORRECT_PLATE for vehicle in found):
+            print_text("A blue sedan delivery, registered to a company nobody's heard of. You underline it twice.")
+        return True
@@ -3,20 +3,28 @@
 from typing import Tuple
 from .base_puzzle import BasePuzzle
 from ..config import PUZZLE_SOLUTIONS
+from .codec import intercept, wheel
+from .variants import CLASSIC, PuzzleVariant
 
 
 class CipherPuzzle(BasePuzzle):
     """Player must find the correct cipher key to decode the smugglers' memo."""
 
-    def __init__(self) -> None:
+    def __init__(self, variant: PuzzleVariant = CLASSIC) -> None:
         super().__init__(
             location="evidence_room",
             required_items={"cipher_wheel", "notebook"},
             description="The cipher wheel and coded notes beg to be decoded.",
         )
-        self._solution = PUZZLE_SOLUTIONS["cipher_puzzle"]["key"].upper()
+        self._solution = variant.cipher_key.upper()
+        self._variant = variant
 
     def attempt(self, solution: str) -> Tuple[bool, str]:
         if solution.strip().upper() == self._solution:
-            return True, PUZZLE_SOLUTIONS["cipher_puzzle"]["success_message"]
+            transmission = intercept(self._solution, self._variant.warehouse)
+            memo = wheel(self._solution).decode(transmission.groups)
+            return True, (
+                self._variant.rewrite(PUZZLE_SOLUTIONS["cipher_puzzle"]["success_message"])
+                + f"\n\nThe latest intercept, letter by letter: {memo}"
+            )
         return False, PUZZLE_SOLUTIONS["cipher_puzzle"]["fail_message"]
@@ -0,0 +1,232 @@
+"""Cipher-wheel and Morse codecs behind the puzzles.
+
+The cipher wheel is a Vigenère cipher: each letter of the key turns the
+outer ring by that letter's place in the alphabet, and the key repeats along
+the message. The 26 ring positions are built once as ``str.maketrans``
+tables. The letters of a message are split into one column per key letter,
+so every column is a single ``str.translate`` call, and the columns are woven
+back together. Anything that isn't an ASCII letter passes through and doesn't
+use up the key.
+
+Morse encodes through a translation table too. Decoding looks codes up in a
+prefix tree, kept flat as a dict from every path down the tree to the letter
+it spells. ``MorseDecoder`` takes a signal in whatever pieces it arrives in,
+hands back each letter as soon as the gap after it arrives, and holds on to
+the symbols of a letter still being keyed.
+
+``intercept`` writes a fresh smugglers' transmission: plain text from a few
+templates, the enciphered groups read over the air and the Morse for them.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import string
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+ALPHABET = string.ascii_uppercase
+
+
+def _shift_table(shift: int) -> Dict[int, int]:
+    upper = ALPHABET[shift:] + ALPHABET[:shift]
+    return str.maketrans(ALPHABET + ALPHABET.lower(), upper + upper.lower())
+
+
+# Table n turns the ring n places forward; decoding uses table -n
+_RING_TABLES: Tuple[Dict[int, int], ...] = tuple(_shift_table(shift) for shift in range(26))
+_GAPS = re.compile(r"([^A-Za-z]+)")
+_NOT_LETTERS = re.compile(r"[^A-Za-z]+")
+
+
+def caesar(text: str, shift: int) -> str:
+    """Turn the wheel a fixed number of places; negative shifts turn it back."""
+    return text.translate(_RING_TABLES[shift % 26])
+
+
+class CipherWheel:
+    """A cipher wheel set to a key word."""
+
+    def __init__(self, key: str) -> None:
+        shifts = [ALPHABET.index(letter) for letter in key.upper() if letter in ALPHABET]
+        if not shifts:
+            raise ValueError(f"cipher key has no letters: {key!r}")
+        self.key = key.upper()
+        self._encode = [_RING_TABLES[shift] for shift in shifts]
+        self._decode = [_RING_TABLES[-shift % 26] for shift in shifts]
+
+    def encode(self, text: str) -> str:
+        return self._apply(text, self._encode)
+
+    def decode(self, text: str) -> str:
+        return self._apply(text, self._decode)
+
+    @staticmethod
+    def _apply(text: str, tables: List[Dict[int, int]]) -> str:
+        # Runs of letters at even indexes, what separates them at odd ones
+        parts = _GAPS.split(text)
+        runs = parts[::2]
+        letters = "".join(runs)
+        period = len(tables)
+        woven = list(letters)
+        for column, table in enumerate(tables):
+            woven[column::period] = letters[column::period].translate(table)
+        shifted = "".join(woven)
+        if len(parts) == 1:
+            return shifted
+        ends = list(accumulate(map(len, runs)))
+        parts[::2] = map(shifted.__getitem__, map(slice, [0] + ends[:-1], ends))
+        return "".join(parts)
+
+
+@lru_cache(maxsize=64)
+def wheel(key: str) -> CipherWheel:
+    """The wheel for a key, shared by every session using it."""
+    return CipherWheel(key)
+
+
+MORSE_CODE: Dict[str, str] = {
+    "A": ".-", "B": "-...", "C": "-.-.", "D": "-..", "E": ".", "F": "..-.", "G": "--.",
+    "H": "....", "I": "..", "J": ".---", "K": "-.-", "L": ".-..", "M": "--", "N": "-.",
+    "O": "---", "P": ".--.", "Q": "--.-", "R": ".-.", "S": "...", "T": "-", "U": "..-",
+    "V": "...-", "W": ".--", "X": "-..-", "Y": "-.--", "Z": "--..",
+    "0": "-----", "1": ".----", "2": "..---", "3": "...--", "4": "....-",
+    "5": ".....", "6": "-....", "7": "--...", "8": "---..", "9": "----.",
+    ".": ".-.-.-", ",": "--..--", "?": "..--..", "-": "-....-", "/": "-..-.",
+}
+
+# Letters end with a space, words with a slash
+_MORSE_TABLE = str.maketrans(
+    {**{char: code + " " for char, code in MORSE_CODE.items()},
+     **{char.lower(): code + " " for char, code in MORSE_CODE.items() if char.isalpha()},
+     " ": "/ "}
+)
+# The other ways dots and dashes get typed
+_SYMBOLS = str.maketrans({
+    "·": ".", "•": ".", "*": ".", "_": "-", "−": "-", "–": "-", "—": "-", "|": "/",
+    "\t": " ", "\n": " ", "\r": " ",
+})
+_MORSE_ONLY = re.compile(r"[.\-\s/]+")
+UNKNOWN = "?"
+
+
+def encode_morse(text: str) -> str:
+    """Morse for text; characters Morse has no code for are dropped."""
+    encoded = text.translate(_MORSE_TABLE)
+    return re.sub(r"[^.\-/ ]", "", encoded).replace("/ / ", "/ ").strip()
+
+
+def _build_tree() -> Dict[str, str]:
+    tree: Dict[str, str] = {}
+    for char, code in MORSE_CODE.items():
+        for depth in range(1, len(code)):
+            tree.setdefault(code[:depth], "")
+        tree[code] = char
+    return tree
+
+
+# Every path down the tree, to the letter it spells ("" part-way down a branch)
+MORSE_TREE = _build_tree()
+_LETTERS = {code: char for code, char in MORSE_TREE.items() if char}
+_WORD_GAP = re.compile(r" */ *| {3,}")
+
+
+class MorseDecoder:
+    """Decodes a Morse signal as its symbols arrive.
+
+    A space ends a letter; a slash, or three or more spaces, ends a word.
+    """
+
+    def __init__(self) -> None:
+        self._pending = ""  # a letter still being keyed, or a gap that may grow
+        self._in_word = False
+
+    @property
+    def keying(self) -> str:
+        """The letter the symbols since the last gap spell so far: "" if
+        they are part-way down a branch, ``UNKNOWN`` if they left the tree."""
+        return MORSE_TREE.get(self._pending.strip(), UNKNOWN) if self._pending.strip() else ""
+
+    def feed(self, symbols: str) -> str:
+        """Take the next piece of the signal; return the text it completes."""
+        signal = self._pending + symbols.translate(_SYMBOLS)
+        body = signal.rstrip(" ")
+        if len(body) < len(signal):
+            # Everything before a trailing gap is complete; the gap may yet
+            # turn out to be the end of a word
+            done, self._pending = body, signal[len(body):]
+        else:
+            cut = max(body.rfind(" "), body.rfind("/")) + 1
+            done, self._pending = body[:cut], body[cut:]
+        return self._decode(done)
+
+    def finish(self) -> str:
+        """End of the signal: the letter still being keyed, if any."""
+        done, self._pending = self._pending, ""
+        text = self._decode(done)
+        self._in_word = False
+        return text
+
+    def _decode(self, signal: str) -> str:
+        out: List[str] = []
+        words = _WORD_GAP.split(signal) if "   " in signal else signal.split("/")
+        for index, word in enumerate(words):
+            if index and self._in_word:
+                out.append(" ")
+                self._in_word = False
+            codes = word.split()
+            if codes:
+                out.append("".join([_LETTERS.get(code, UNKNOWN) for code in codes]))
+                self._in_word = True
+        return "".join(out)
+
+
+def decode_morse(signal: str) -> str:
+    decoder = MorseDecoder()
+    return (decoder.feed(signal) + decoder.finish()).strip()
+
+
+def looks_like_morse(text: str) -> bool:
+    """Whether text is keyed dots and dashes rather than plain words."""
+    text = text.translate(_SYMBOLS)
+    return any(symbol in text for symbol in ".-") and _MORSE_ONLY.fullmatch(text) is not None
+
+
+@dataclass(frozen=True)
+class Transmission:
+    plain: str
+    groups: str  # the enciphered text, read over the air in five-letter groups
+    morse: str
+
+
+_TEMPLATES = (
+    "{cargo} ARRIVES {day} {hour} PIER {pier} UNLOAD WAREHOUSE {warehouse}",
+    "TRUCKS WAVED THROUGH {day} {hour} {cargo} TO WAREHOUSE {warehouse}",
+    "HARBORMASTER SAYS HOLD PIER {pier} UNTIL {day} THEN WAREHOUSE {warehouse}",
+    "SULLIVAN WANTS {cargo} COUNTED {day} {hour} WAREHOUSE {warehouse} NO LIGHTS",
+)
+_CARGO = ("MORPHINE", "PENICILLIN", "PLASMA", "SURPLUS", "CRATES", "MEDICAL STORES")
+_DAYS = ("MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY")
+_HOURS = ("MIDNIGHT", "ONE AM", "TWO AM", "THREE AM", "FOUR AM")
+_DIGITS = ("ZERO", "ONE", "TWO", "THREE", "FOUR", "FIVE", "SIX", "SEVEN", "EIGHT", "NINE")
+
+
+def _spoken(number: int) -> str:
+    """A number read digit by digit, the way it goes over the air."""
+    return " ".join(_DIGITS[int(digit)] for digit in str(number))
+
+
+def intercept(key: str, warehouse: int, rng: Optional[random.Random] = None) -> Transmission:
+    """A new smugglers' transmission, enciphered with key. Numbers are
+    spelled out, since only letters go through the wheel."""
+    rng = rng or random
+    plain = rng.choice(_TEMPLATES).format(
+        cargo=rng.choice(_CARGO), day=rng.choice(_DAYS), hour=rng.choice(_HOURS),
+        pier=_spoken(rng.randint(1, 91)), warehouse=_spoken(warehouse),
+    )
+    letters = wheel(key).encode(_NOT_LETTERS.sub("", plain))
+    groups = " ".join(letters[i:i + 5] for i in range(0, len(letters), 5))
+    return Transmission(plain, groups, encode_morse(groups))
@@ -3,15 +3,14 @@
 from typing import Tuple
 from .base_puzzle import BasePuzzle
 from ..config import PUZZLE_SOLUTIONS
-
-_CORRECT_ANSWER = "WAREHOUSE 22"
-_ALT_ANSWERS = {"W-22", "W 22", "WAREHOUSE22"}
+from .codec import decode_morse, looks_like_morse
+from .variants import CLASSIC, PuzzleVariant
 
 
 class MorsePuzzle(BasePuzzle):
     """Player must decode a Morse transmission to identify the smugglers' base."""
 
-    def __init__(self) -> None:
+    def __init__(self, variant: PuzzleVariant = CLASSIC) -> None:
         super().__init__(
             location="underground_tunnels",
             required_items={"flashlight"},
@@ -22,9 +21,14 @@ class MorsePuzzle(BasePuzzle):
                 "Make it fast. Make it right."
             ),
         )
+        self._variant = variant
+        self._answers = variant.morse_answers
 
     def attempt(self, solution: str) -> Tuple[bool, str]:
+        """Accepts the answer as words or keyed as dots and dashes."""
+        if looks_like_morse(solution):
+            solution = decode_morse(solution)
         normalised = solution.strip().upper()
-        if normalised == _CORRECT_ANSWER or normalised in _ALT_ANSWERS:
-            return True, PUZZLE_SOLUTIONS["morse_code"]["success_message"]
+        if normalised in self._answers:
+            return True, self._variant.rewrite(PUZZLE_SOLUTIONS["morse_code"]["success_message"])
         return False, PUZZLE_SOLUTIONS["morse_code"]["fail_message"]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Callable, Dict, Iterable, Optional, Set
+from typing import Callable, Collection, Dict, List, Optional, Set
 
 from ..utils import print_text
 from ..config import GAME_MESSAGES
@@ -11,14 +11,15 @@ from .radio_puzzle import RadioPuzzle
 from .cipher_puzzle import CipherPuzzle
 from .morse_puzzle import MorsePuzzle
 from .car_puzzle import CarPuzzle
+from .variants import CLASSIC, PuzzleVariant
 
 SolutionProvider = Callable[[str], Optional[str]]
 
-# Registry mapping location -> puzzle instance
-_PUZZLE_REGISTRY: Dict[str, BasePuzzle] = {
-    puzzle.location: puzzle
-    for puzzle in [RadioPuzzle(), CipherPuzzle(), MorsePuzzle(), CarPuzzle()]
-}
+
+def build_puzzles(variant: PuzzleVariant = CLASSIC) -> List[BasePuzzle]:
+    """One of each puzzle, answering to the variant."""
+    return [RadioPuzzle(variant), CipherPuzzle(variant), MorsePuzzle(variant), CarPuzzle()]
+
 
 _PROGRESS_MAP: Dict[str, str] = {
     "warehouse_office": "found_warehouse",
@@ -31,21 +32,36 @@ _PROGRESS_MAP: Dict[str, str] = {
 class PuzzleManager:
     """Manages puzzle state and delegates solving to individual puzzle classes."""
 
-    def __init__(self, solution_provider: Optional[SolutionProvider] = None) -> None:
+    def __init__(
+        self,
+        solution_provider: Optional[SolutionProvider] = None,
+        variant: PuzzleVariant = CLASSIC,
+    ) -> None:
         self.solved_puzzles: Set[str] = set()
         self.solution_provider = solution_provider or self._prompt_for_solution
+        self.use_variant(variant)
+
+    def use_variant(self, variant: PuzzleVariant) -> None:
+        """Set this game's puzzle answers."""
+        self.variant = variant
+        # Location -> puzzle instance
+        self.puzzles: Dict[str, BasePuzzle] = {puzzle.location: puzzle for puzzle in build_puzzles(variant)}
+
+    def clue_text(self, item: str, text: str) -> str:
+        """An item's description, with clues pointing at this game's answers."""
+        return self.variant.clue_text(item, text)
 
     def handle_puzzle(
         self,
         location: str,
-        inventory: Iterable[str],
+        inventory: Collection[str],
         game_state: dict,
     ) -> bool:
         """Entry point used by ``GameManager`` when the player types ``solve``.
 
         Returns ``True`` when a puzzle is successfully solved.
         """
-        puzzle = _PUZZLE_REGISTRY.get(location)
+        puzzle = self.puzzles.get(location)
         if puzzle is None:
             print_text("\n" + GAME_MESSAGES["NO_PUZZLE"])
             return False
@@ -54,9 +70,8 @@ class PuzzleManager:
             print_text("\n" + GAME_MESSAGES["ALREADY_SOLVED"])
             return False
 
-        inventory_set = set(inventory)
-        if not puzzle.check_requirements(inventory_set):
-            missing = puzzle.required_items - inventory_set
+        if not puzzle.check_requirements(inventory):
+            missing = {item for item in puzzle.required_items if item not in inventory}
             print_text("\n" + GAME_MESSAGES["MISSING_ITEMS"].format(items=", ".join(sorted(missing))))
             return False
 
@@ -77,18 +92,34 @@ class PuzzleManager:
         return solved
 
     def get_state(self) -> dict:
-        """Get puzzle progress for saving."""
-        return {"solved_puzzles": sorted(self.solved_puzzles)}
+        """Get puzzle progress, and the answers if they aren't the classic ones, for saving."""
+        state: dict = {"solved_puzzles": sorted(self.solved_puzzles)}
+        if not self.variant.is_classic:
+            state["variant"] = self.variant.to_dict()
+        return state
 
     def restore_state(self, state: Optional[dict]) -> None:
         """Restore puzzle progress from save data. Older saves that predate
-        puzzle persistence have no entry; they restore to nothing solved."""
+        puzzle persistence have no entry; they restore to nothing solved.
+        Saves without a variant were played with the classic answers."""
         state = state or {}
         self.solved_puzzles = set(state.get("solved_puzzles", []))
+        variant = state.get("variant")
+        self.use_variant(PuzzleVariant.from_dict(variant) if variant else CLASSIC)
+
+    def radio_at(self, location: str) -> Optional[RadioPuzzle]:
+        """The receiver at a location, if there is one to tune."""
+        puzzle = self.puzzles.get(location)
+        return puzzle if isinstance(puzzle, RadioPuzzle) else None
+
+    def car_at(self, location: str) -> Optional[CarPuzzle]:
+        """The plate puzzle at a location, if traces can be run from there."""
+        puzzle = self.puzzles.get(location)
+        return puzzle if isinstance(puzzle, CarPuzzle) else None
 
     def should_trigger_on_use(self, item: str, location: str) -> bool:
         """Return True if using this item at this location should activate a puzzle."""
-        puzzle = _PUZZLE_REGISTRY.get(location)
+        puzzle = self.puzzles.get(location)
         if puzzle is None or location in self.solved_puzzles:
             return False
         return item in puzzle.required_items
@@ -0,0 +1,225 @@
+"""Simulated radio band for tuning and scanning the seized receiver.
+
+The band holds a few stations: the smugglers keying their enciphered
+intercept in Morse on the game's frequency, a weather beacon and a dance
+band. Each station's programme - one loop of its audio at full strength - is
+synthesized once per variant and shared by every session that uses it.
+
+Tuning renders what the receiver hears as NumPy arrays. Every station's gain
+at every requested frequency falls off with distance from its frequency, so
+one matrix product mixes the whole band for every dial setting at once. Static
+comes from a shared bank of noise read at random offsets, and a strong signal
+pulls the static down the way the set's automatic gain control would. A scan
+of twenty-one frequencies is one batched computation, not twenty-one, and
+there are no per-sample Python loops.
+
+The signal meter is read from the same buffer: the RMS level in 20 ms windows
+gives the strength, and the spread between loud and quiet windows shows
+whether the signal is keyed on and off, as Morse is. ``write_wav`` saves a
+buffer with the standard library's ``wave`` module.
+
+NumPy is optional. Without it ``available()`` is False and the game says the
+band display needs it; everything else, the radio puzzle included, works.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import wave
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple
+
+from ..config import RADIO_SAMPLE_RATE, RADIO_SCAN_SECONDS, RADIO_TUNE_SECONDS
+from .codec import encode_morse, intercept
+from .variants import FREQUENCY_BAND, PuzzleVariant
+
+try:
+    import numpy as np
+except ImportError:  # the band simulator is optional: pip install numpy
+    np = None
+
+BAND = (FREQUENCY_BAND[0] / 10, FREQUENCY_BAND[1] / 10)
+BANDWIDTH_MHZ = 0.12  # how far off a station its signal has fallen to a third
+STATIC_LEVEL = 0.08
+NOISE_BANK_SAMPLES = 1 << 17
+UNIT_SECONDS = 0.06  # one Morse dot at the smugglers' keying speed
+METER_WIDTH = 10
+METER_DB_PER_BAR = 2.0
+WINDOW_SECONDS = 0.02
+KEYED_SPREAD = 0.6  # loud windows this much above quiet ones, relative to the level
+MUSIC_SWELL = 0.1  # depth of the dance band's swell, well under KEYED_SPREAD
+
+
+def available() -> bool:
+    """Whether NumPy is installed, so the band can be simulated."""
+    return np is not None
+
+
+@dataclass(frozen=True)
+class Station:
+    frequency: float
+    strength: float
+    kind: str  # "morse" or "music"
+    copy: str = ""  # what an operator copies down from a Morse station
+
+
+@dataclass
+class Reading:
+    """What the receiver heard at one dial setting."""
+    frequency: float
+    level: float
+    bars: int
+    keyed: bool
+    samples: Any  # this setting's audio, a NumPy array
+
+    @property
+    def meter(self) -> str:
+        return "[" + "#" * self.bars + "." * (METER_WIDTH - self.bars) + "]"
+
+    @property
+    def description(self) -> str:
+        if self.bars <= 1:
+            return "static"
+        if self.keyed:
+            return "Morse, loud and clear" if self.bars >= 6 else "Morse, somewhere under the static"
+        return "a dance band, of all things" if self.bars >= 6 else "a murmur under the hiss"
+
+
+def _morse_envelope(signal: str, samples_per_unit: int) -> Any:
+    """On/off keying for a Morse signal, as 0s and 1s, one loop with a pause."""
+    units: List[Tuple[int, int]] = []
+    for symbol in signal:
+        if symbol in ".-":
+            units += [(1, 1 if symbol == "." else 3), (0, 1)]
+        elif symbol == " ":
+            units.append((0, 2))  # a letter gap is three units with the one above
+        elif symbol == "/":
+            units.append((0, 2))  # and with the spaces around it, seven for a word
+    units.append((0, 14))
+    values, lengths = zip(*units)
+    return np.repeat(np.array(values, dtype=np.float32), np.array(lengths) * samples_per_unit)
+
+
+def _tone(samples: int, pitch: float, rate: int) -> Any:
+    return np.sin(2 * np.pi * pitch * np.arange(samples, dtype=np.float32) / rate).astype(np.float32)
+
+
+class BandSimulator:
+    """The band as one variant's players hear it."""
+
+    def __init__(self, stations: Sequence[Station], rate: int = RADIO_SAMPLE_RATE) -> None:
+        if np is None:
+            raise RuntimeError("the radio band simulator needs NumPy")
+        self.stations = tuple(stations)
+        self.rate = rate
+        self._frequencies = np.array([station.frequency for station in self.stations])
+        self._strengths = np.array([station.strength for station in self.stations], dtype=np.float32)
+        self._programmes = [self._programme(station) for station in self.stations]
+        self._noise = np.random.default_rng(0).standard_normal(NOISE_BANK_SAMPLES).astype(np.float32)
+
+    def _programme(self, station: Station) -> Any:
+        unit = int(UNIT_SECONDS * self.rate)
+        if station.kind == "morse":
+            envelope = _morse_envelope(encode_morse(station.copy), unit)
+            return envelope * _tone(len(envelope), 700.0, self.rate)
+        # Two notes and a slow swell: close enough to a dance band through a cheap
+        # set. The swell stays shallow so the meter never takes it for keying.
+        samples = self.rate * 4
+        phase = 2 * np.pi * 0.5 * np.arange(samples, dtype=np.float32) / self.rate
+        swell = 1.0 - MUSIC_SWELL + MUSIC_SWELL * np.sin(phase)
+        return (0.5 * _tone(samples, 392.0, self.rate) + 0.5 * _tone(samples, 494.0, self.rate)) * swell
+
+    def render(self, frequencies: Sequence[float], seconds: float, at: Optional[float] = None,
+               seed: Optional[int] = None) -> Any:
+        """Receiver audio at each frequency, one row per frequency.
+
+        at is the broadcast time in seconds (now, by default), so every
+        station is partway through its loop; seed fixes the static.
+        """
+        samples = int(seconds * self.rate)
+        dial = np.asarray(frequencies, dtype=np.float64)
+        offsets = (dial[:, None] - self._frequencies[None, :]) / BANDWIDTH_MHZ
+        gains = (self._strengths[None, :] * np.exp(-offsets ** 2)).astype(np.float32)
+
+        start = int((time.time() if at is None else at) * self.rate)
+        ticks = start + np.arange(samples)
+        programmes = np.stack([programme[ticks % len(programme)] for programme in self._programmes])
+        signal = gains @ programmes
+
+        rng = np.random.default_rng(seed)
+        reads = rng.integers(0, NOISE_BANK_SAMPLES, len(dial))[:, None] + np.arange(samples)
+        static = self._noise[reads % NOISE_BANK_SAMPLES]
+        captured = np.clip(gains.sum(axis=1, keepdims=True), 0.0, 1.0)
+        return signal + static * (STATIC_LEVEL * (1.0 - 0.7 * captured))
+
+    def read(self, frequencies: Sequence[float], buffer: Any) -> List[Reading]:
+        """The meter for each row of a rendered buffer."""
+        window = int(WINDOW_SECONDS * self.rate)
+        usable = buffer.shape[1] // window * window
+        frames = buffer[:, :usable].reshape(buffer.shape[0], -1, window)
+        envelope = np.sqrt(np.mean(frames ** 2, axis=2))
+        level = envelope.mean(axis=1)
+        loud, quiet = np.percentile(envelope, [90, 10], axis=1)
+        keyed = (loud - quiet) / np.maximum(level, 1e-9) > KEYED_SPREAD
+        decibels = 20 * np.log10(np.maximum(level, 1e-9) / STATIC_LEVEL)
+        bars = np.clip(np.round(decibels / METER_DB_PER_BAR), 0, METER_WIDTH).astype(int)
+        return [
+            Reading(round(float(frequency), 1), float(level[row]), int(bars[row]), bool(keyed[row]), buffer[row])
+            for row, frequency in enumerate(frequencies)
+        ]
+
+    def tune(self, frequency: float, seconds: float = RADIO_TUNE_SECONDS, **kwargs: Any) -> Reading:
+        return self.read([frequency], self.render([frequency], seconds, **kwargs))[0]
+
+    def scan(self, frequencies: Sequence[float], seconds: float = RADIO_SCAN_SECONDS,
+             **kwargs: Any) -> List[Reading]:
+        return self.read(frequencies, self.render(frequencies, seconds, **kwargs))
+
+    def station_near(self, frequency: float) -> Optional[Station]:
+        """The station the dial is on, if it's close enough to copy."""
+        for station in self.stations:
+            if abs(station.frequency - frequency) < BANDWIDTH_MHZ / 2:
+                return station
+        return None
+
+
+# Frequencies the beacon and the band may take, well away from the smugglers
+_BEACON_FREQUENCIES = (403.4, 426.2)
+_MUSIC_FREQUENCIES = (411.8, 419.5)
+
+
+def _away_from(choices: Sequence[float], frequency: float) -> float:
+    return max(choices, key=lambda choice: abs(choice - frequency))
+
+
+@lru_cache(maxsize=32)
+def simulator(variant: PuzzleVariant) -> BandSimulator:
+    """The band for a variant, shared by every session playing it."""
+    target = float(variant.frequency)
+    rng = random.Random(f"{variant.frequency}/{variant.cipher_key}/{variant.warehouse}")
+    transmission = intercept(variant.cipher_key, variant.warehouse, rng)
+    return BandSimulator([
+        Station(target, 1.0, "morse", transmission.groups),
+        Station(_away_from(_BEACON_FREQUENCIES, target), 0.5, "morse", "WX WX WX"),
+        Station(_away_from(_MUSIC_FREQUENCIES, target), 0.8, "music"),
+    ])
+
+
+def scan_frequencies(center: float, span: float, step: float = 0.1) -> List[float]:
+    """The dial settings a scan visits, clipped to the band."""
+    steps = int(round(span / step))
+    settings = (round(center + index * step, 1) for index in range(-steps, steps + 1))
+    return [setting for setting in settings if BAND[0] <= setting <= BAND[1]]
+
+
+def write_wav(path: str, samples: Any, rate: int = RADIO_SAMPLE_RATE) -> None:
+    """Save a buffer as 16-bit mono PCM."""
+    peak = float(np.max(np.abs(samples))) or 1.0
+    pcm = (np.asarray(samples) / peak * 0.9 * 32767).astype("<i2")
+    with wave.open(path, "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(rate)
+        out.writeframes(pcm.tobytes())
@@ -1,22 +1,101 @@
 """Radio frequency puzzle — warehouse_office."""
 
-from typing import Tuple
+import logging
+import os
+import re
+from typing import Optional, Tuple
 from .base_puzzle import BasePuzzle
-from ..config import PUZZLE_SOLUTIONS
+from ..config import PUZZLE_SOLUTIONS, RADIO_SCAN_SPAN, RADIO_WAV_ENV
+from ..utils import print_text
+from . import radio_band
+from .codec import intercept
+from .variants import CLASSIC, PuzzleVariant
+
+_FREQUENCY = re.compile(r"\d{3}(?:\.\d+)?")
 
 
 class RadioPuzzle(BasePuzzle):
     """Player must tune a salvaged radio to the smugglers' emergency frequency."""
 
-    def __init__(self) -> None:
+    def __init__(self, variant: PuzzleVariant = CLASSIC) -> None:
         super().__init__(
             location="warehouse_office",
             required_items={"radio_manual"},
             description="You unfold the seized radio equipment and tune its broken dials.",
         )
-        self._solution = PUZZLE_SOLUTIONS["radio_puzzle"]["frequency"]
+        self._solution = variant.frequency
+        self._variant = variant
+        # Where the receiver's dial sits, in MHz
+        self.dial = round(sum(radio_band.BAND) / 2, 1)
 
     def attempt(self, solution: str) -> Tuple[bool, str]:
         if solution.strip() == self._solution:
-            return True, PUZZLE_SOLUTIONS["radio_puzzle"]["success_message"]
+            transmission = intercept(self._variant.cipher_key, self._variant.warehouse)
+            return True, (
+                self._variant.rewrite(PUZZLE_SOLUTIONS["radio_puzzle"]["success_message"])
+                + f"\n\nBetween bursts of static a flat voice reads out letter groups: {transmission.groups}"
+            )
         return False, PUZZLE_SOLUTIONS["radio_puzzle"]["fail_message"]
+
+    def tune(self, setting: str) -> bool:
+        """Turn the dial to the frequency in setting and show what comes through."""
+        frequency = self._frequency(setting)
+        if not self._ready(frequency):
+            return False
+        self.dial = frequency
+        band = radio_band.simulator(self._variant)
+        reading = band.tune(frequency)
+        print_text(f"\nYou turn the dial to {frequency:.1f} MHz.")
+        print_text(self._meter_line(reading), wrap=False)
+        station = band.station_near(frequency)
+        if station is not None and station.copy and reading.keyed and reading.bars >= 4:
+            print_text(f"You copy it down as it comes: {station.copy}")
+        self._save_audio(reading)
+        return True
+
+    def scan(self, setting: str = "") -> bool:
+        """Sweep the band around the frequency in setting, or around the dial."""
+        center = self._frequency(setting) if setting.strip() else self.dial
+        if not self._ready(center):
+            return False
+        self.dial = center
+        settings = radio_band.scan_frequencies(center, RADIO_SCAN_SPAN)
+        readings = radio_band.simulator(self._variant).scan(settings)
+        print_text(f"\nYou sweep the dial from {settings[0]:.1f} to {settings[-1]:.1f} MHz.")
+        print_text("\n".join(self._meter_line(reading) for reading in readings), wrap=False)
+        return True
+
+    @staticmethod
+    def _ready(frequency: Optional[float]) -> bool:
+        messages = PUZZLE_SOLUTIONS["radio_puzzle"]
+        if frequency is None:
+            print_text(messages["tune_what"])
+            return False
+        if not radio_band.available():
+            print_text(messages["no_band"])
+            return False
+        return True
+
+    @staticmethod
+    def _frequency(setting: str) -> Optional[float]:
+        match = _FREQUENCY.search(setting)
+        if match is None:
+            return None
+        frequency = round(float(match.group()), 1)
+        low, high = radio_band.BAND
+        return frequency if low <= frequency <= high else None
+
+    @staticmethod
+    def _meter_line(reading: "radio_band.Reading") -> str:
+        return f"  {reading.frequency:.1f}  {reading.meter}  {reading.description}"
+
+    @staticmethod
+    def _save_audio(reading: "radio_band.Reading") -> None:
+        path = os.environ.get(RADIO_WAV_ENV, "").strip()
+        if not path:
+            return
+        try:
+            radio_band.write_wav(path, reading.samples)
+            logging.info(f"Wrote {reading.frequency:.1f} MHz audio to {path}")
+        except OSError as e:
+            logging.error(f"Could not write radio audio to {path}: {e}")
@@ -0,0 +1,132 @@
+"""Per-session puzzle variants.
+
+The classic game always has the same answers: the smugglers broadcast on
+415.6, the cipher key is ANGELS and the Morse reply names Warehouse 22. A
+variant swaps in other answers drawn from a seeded generator, so every
+session can have its own, and rewrites the clues the player reads - the
+informant's note, the radio manual's margin, the water-stained note, the
+business card, the compiled notes and the puzzle messages - to match. The
+manifest gains a pencilled line naming the warehouse and the password.
+
+Set ``EMERALD_PUZZLE_VARIANTS=1`` to give every new game its own answers;
+``EMERALD_PUZZLE_SEED`` replays the variant for one seed. The same seed
+always gives the same variant, and a variant saves as a plain dict with
+``PuzzleManager.get_state``.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import re
+import secrets
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, FrozenSet, Optional
+
+from ..config import PUZZLE_SOLUTIONS, PUZZLE_SEED_ENV, PUZZLE_VARIANTS_ENV
+
+# Frequencies the seized radio can tune, in tenths of a MHz
+FREQUENCY_BAND = (4000, 4299)
+WAREHOUSE_NUMBERS = (10, 99)
+CIPHER_KEYS = (
+    "ANGELS", "HARBOR", "SPARROW", "LANTERN", "FOGHORN", "CANARY", "RAINIER",
+    "KESTREL", "BALLAST", "TIDEWATER", "STEVEDORE", "GULLWING", "NIGHTJAR",
+    "BOATHOOK", "SANDPIPER", "CORMORANT",
+)
+
+_CLASSIC_ANSWERS = re.compile(r"415\.6|\bangels\b|\bwarehouse 22\b", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class PuzzleVariant:
+    """The answers to one session's puzzles."""
+    frequency: str
+    cipher_key: str
+    warehouse: int
+    seed: Optional[int] = None  # None for the classic answers
+
+    @property
+    def morse_target(self) -> str:
+        return f"WAREHOUSE {self.warehouse}"
+
+    @property
+    def morse_answers(self) -> FrozenSet[str]:
+        """Every accepted way of tapping out the target."""
+        n = self.warehouse
+        return frozenset({self.morse_target, f"W-{n}", f"W {n}", f"WAREHOUSE{n}"})
+
+    @property
+    def is_classic(self) -> bool:
+        return self.seed is None
+
+    def rewrite(self, text: str) -> str:
+        """Replace the classic answers in text with this variant's."""
+        if self.is_classic:
+            return text
+        return _CLASSIC_ANSWERS.sub(self._replace, text)
+
+    def _replace(self, match: "re.Match[str]") -> str:
+        found = match.group()
+        if found == "415.6":
+            return self.frequency
+        if found[-2:] == "22":
+            return f"{found[:-2]}{self.warehouse}"
+        if found.isupper():
+            return self.cipher_key
+        if found[0].isupper():
+            return self.cipher_key.capitalize()
+        return self.cipher_key.lower()
+
+    def clue_text(self, item: str, text: str) -> str:
+        """An item's description as this variant's player should read it."""
+        text = self.rewrite(text)
+        if item == "manifest" and not self.is_classic:
+            text += (
+                f" Pencilled beside the declared weight, in a hurried hand: "
+                f"'Warehouse {self.warehouse}. Tell them the {self.cipher_key.lower()} sent you.'"
+            )
+        return text
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PuzzleVariant":
+        return cls(str(data["frequency"]), str(data["cipher_key"]).upper(), int(data["warehouse"]), data.get("seed"))
+
+
+def mentions_answers(text: str) -> bool:
+    """Whether text gives away any of the classic answers."""
+    return _CLASSIC_ANSWERS.search(text) is not None
+
+
+CLASSIC = PuzzleVariant(
+    PUZZLE_SOLUTIONS["radio_puzzle"]["frequency"], PUZZLE_SOLUTIONS["cipher_puzzle"]["key"].upper(), 22
+)
+
+
+def generate_variant(seed: int) -> PuzzleVariant:
+    """The variant for a seed; never the classic answers."""
+    rng = random.Random(seed)
+    while True:
+        frequency = rng.randint(*FREQUENCY_BAND)
+        variant = PuzzleVariant(
+            f"{frequency // 10}.{frequency % 10}",
+            rng.choice(CIPHER_KEYS),
+            rng.randint(*WAREHOUSE_NUMBERS),
+            seed,
+        )
+        if (variant.frequency, variant.cipher_key, variant.warehouse) != (
+            CLASSIC.frequency, CLASSIC.cipher_key, CLASSIC.warehouse
+        ):
+            return variant
+
+
+def session_variant() -> PuzzleVariant:
+    """The variant a new game should use, as the environment asks."""
+    seed = os.environ.get(PUZZLE_SEED_ENV, "").strip()
+    if seed.isdigit():
+        return generate_variant(int(seed))
+    if os.environ.get(PUZZLE_VARIANTS_ENV, "").strip().lower() in {"1", "true", "yes", "on"}:
+        return generate_variant(secrets.randbits(32))
+    return CLASSIC
@@ -0,0 +1,444 @@
+"""Washington State vehicle registry for tracing the smugglers' plate.
+
+The Department of Licenses files are synthetic: a deterministic run of
+1940s registrations - plate, year, make, body, color and owner - generated
+from a seed, with the smugglers' WA-4471 filed among them. Plates come in
+two seven-character styles, county letters and a number (``WA-4471``) and a
+number with a series letter (``713-K42``).
+
+Players trace partial plates with wildcards, ``?`` for one character and
+``*`` for any run (``7?3-K*``, ``WA-44??``), optionally narrowed by make and
+owner. A query never scans the whole registry. The plan picks the smallest
+candidate list among the indexes the query can use - plates sorted from the
+front and from the back, bisected for a literal prefix or suffix; every run
+of three characters inside a plate (trigrams); the character at each of the
+seven positions; make; owner - and checks only those candidates against the
+full pattern. Plates are all seven characters, so every literal character
+of a pattern can only sit at a few positions (``??3-?9?`` puts a 3 third and
+a 9 sixth), and the postings for those positions are a candidate list. Only
+a pattern with no literal characters at all, which every plate fits, reads
+the registrations in order, and it stops at the first few.
+
+A pattern neither plate style could fit - two dashes, a letter where the
+number goes - is answered before any index is read. A trace whose smallest
+candidate list still holds too few matches, such as ``*0*0*0*0*``, stops
+after ``REGISTRY_MAX_CHECKS`` registrations and asks for more to go on.
+
+The columns are packed arrays and the plates one fixed-width byte string,
+so a million registrations take tens of megabytes rather than a Python
+object apiece. ``shared()`` builds the registry once per process, on first
+use, and every session queries the same one.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from functools import partial
+from itertools import accumulate, chain
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from ..config import REGISTRY_MAX_CHECKS, REGISTRY_SEED, REGISTRY_SIZE, REGISTRY_SIZE_ENV
+
+logger = logging.getLogger(__name__)
+
+PLATE_WIDTH = 7
+# The two plate styles, a letter as A and a digit as 0: "WA-4471" and "713-K42"
+PLATE_SHAPES = ("AA-0000", "000-A00")
+GRAM = 3  # the n-gram index holds every run of three characters
+SMUGGLERS_PLATE = "WA-4471"
+
+MIN_SIZE = 1_000
+MAX_SIZE = 1_000_000
+
+MAKES = (
+    "Buick", "Cadillac", "Chevrolet", "Chrysler", "DeSoto", "Dodge", "Ford", "GMC",
+    "Hudson", "International", "LaSalle", "Lincoln", "Mercury", "Nash", "Oldsmobile",
+    "Packard", "Plymouth", "Pontiac", "Studebaker", "Willys",
+)
+BODIES = ("sedan", "coupe", "club coupe", "convertible", "station wagon", "pickup",
+          "panel truck", "sedan delivery", "stake truck")
+COLORS = ("black", "blue", "green", "maroon", "grey", "tan", "cream")
+YEARS = (1932, 1947)  # model years on the road in 1947, inclusive
+
+_FIRST_NAMES = (
+    "Albert", "Alice", "Arthur", "Bernard", "Carl", "Charles", "Clara", "Dorothy", "Earl",
+    "Edna", "Edward", "Elmer", "Ethel", "Floyd", "Frances", "Frank", "George", "Gladys",
+    "Harold", "Harry", "Helen", "Herbert", "Howard", "Irene", "James", "John", "Joseph",
+    "Kenji", "Louis", "Mabel", "Margaret", "Martin", "Mildred", "Nels", "Olaf", "Paul",
+    "Ralph", "Ruth", "Sigrid", "Walter",
+)
+_LAST_NAMES = (
+    "Andersen", "Baker", "Bergstrom", "Brennan", "Carlson", "Chin", "Clark", "Costello",
+    "Dahl", "Doyle", "Erickson", "Fujii", "Gallagher", "Hansen", "Hayes", "Holm",
+    "Jensen", "Johnson", "Kelly", "Kowalski", "Larsen", "Lindgren", "Lundquist", "Mahoney",
+    "Martin", "McCarthy", "Miller", "Moreau", "Murphy", "Nakamura", "Nelson", "Novak",
+    "O'Brien", "Olsen", "Pedersen", "Petrov", "Quinn", "Reilly", "Rossi", "Ryan",
+    "Santos", "Schultz", "Sorensen", "Sullivan", "Swanson", "Tanaka", "Thompson", "Walsh",
+    "Weber", "Young",
+)
+COMPANIES = (
+    "Northwest Maritime Imports", "Elliott Bay Freight", "Puget Sound Fisheries",
+    "Rainier Brewing Co.", "Seattle City Light", "Yesler Hardware", "Smith Tower Realty",
+    "Pike Place Produce", "Alaska Steamship Co.", "Boeing Airplane Co.",
+)
+_COMPANY_SHARE = 0.04
+_BODY_WEIGHTS = (30, 12, 8, 3, 4, 12, 8, 3, 4)
+_COLOR_WEIGHTS = (40, 12, 12, 8, 12, 8, 8)
+
+# Every owner, people then companies; records hold an index into this
+OWNERS: Tuple[str, ...] = tuple(
+    f"{first} {last}" for last in _LAST_NAMES for first in _FIRST_NAMES
+) + COMPANIES
+
+SHELL_COMPANY = COMPANIES[0]  # owns the smugglers' truck and nothing else
+_OWNER_ODDS = list(accumulate(
+    [(1 - _COMPANY_SHARE) / (len(OWNERS) - len(COMPANIES))] * (len(OWNERS) - len(COMPANIES))
+    + [0.0] + [_COMPANY_SHARE / (len(COMPANIES) - 1)] * (len(COMPANIES) - 1)
+))
+
+# The smugglers' truck, always on file
+_SMUGGLERS = (1941, MAKES.index("Ford"), BODIES.index("sedan delivery"),
+              COLORS.index("blue"), OWNERS.index(SHELL_COMPANY))
+
+# Plate numbering: each style's numbers are visited in a scrambled order by
+# a stride coprime to the number of plates, so every plate issued is distinct.
+_COUNTY_PLATES = 26 * 26 * 10_000  # "WA-4471"
+_SERIES_PLATES = 1_000 * 26 * 100  # "713-K42"
+_COUNTY_STRIDE = 4_194_301
+_SERIES_STRIDE = 1_299_709
+_SERIES_SHARE = 0.3
+_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# Plates are built from these pieces rather than formatted one by one
+_LETTER_PAIRS = [first + second + "-" for first in _LETTERS for second in _LETTERS]
+_FOUR_DIGITS = [f"{number:04d}" for number in range(10_000)]
+_THREE_DIGITS = [f"{number:03d}" for number in range(1_000)]
+_SERIES_TAILS = [f"-{letter}{number:02d}" for letter in _LETTERS for number in range(100)]
+
+_MAKE_IDS = {make.lower(): index for index, make in enumerate(MAKES)}
+_PATTERN_CHARS = re.compile(r"[A-Z0-9?*\-]+")
+_WILDCARDS = re.compile(r"[?*]")
+_PIECES = re.compile(r"[^?*]+|[?*]")
+_EMPTY = array("I")
+
+
+class Vehicle(NamedTuple):
+    plate: str
+    year: int
+    make: str
+    body: str
+    color: str
+    owner: str
+
+    def describe(self) -> str:
+        return f"{self.plate}  {self.year} {self.make} {self.body}, {self.color} - {self.owner}"
+
+
+class QueryError(ValueError):
+    """A trace the records clerk can't make sense of."""
+
+
+def _postings(keys: Iterable[Hashable]) -> Dict[Any, array]:
+    """Each key's record numbers, in record order."""
+    postings: Dict[Any, array] = defaultdict(partial(array, "I"))
+    for record, key in enumerate(keys):
+        postings[key].append(record)
+    return dict(postings)
+
+
+def _distinct(records: Iterable[int]) -> Iterator[int]:
+    """Records in the order given, each once."""
+    seen = set()
+    for record in records:
+        if record not in seen:
+            seen.add(record)
+            yield record
+
+
+class _SortedKeys:
+    """Records in sorted order seen as their keys, for bisect."""
+
+    def __init__(self, order: array, key: Callable[[int], str]) -> None:
+        self._order = order
+        self._key = key
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getitem__(self, position: int) -> str:
+        return self._key(self._order[position])
+
+
+def normalize_pattern(pattern: str) -> str:
+    """A plate or partial plate as the registry files it: 'wa 44*' -> 'WA-44*'."""
+    text = "-".join(pattern.strip().upper().split())
+    if not text:
+        return "*"
+    if not _PATTERN_CHARS.fullmatch(text):
+        raise QueryError(f"A plate is letters, numbers and a dash, not {pattern.strip()!r}.")
+    return re.sub(r"\*+", "*", text)
+
+
+def _placements(pattern: str) -> Iterator[Tuple[str, range]]:
+    """Each literal run of a pattern with the positions it can start at in a plate.
+
+    A run with no * before it starts after the characters ahead of it; one
+    with no * after it ends as many characters from the end as follow it;
+    a run between two * can start anywhere the rest of the pattern leaves room.
+    """
+    runs, width, stars = [], 0, 0
+    for piece in _PIECES.findall(pattern):
+        if piece == "*":
+            stars += 1
+        elif piece == "?":
+            width += 1
+        else:
+            runs.append((piece, width, stars))
+            width += len(piece)
+    for run, first, stars_before in runs:
+        last = PLATE_WIDTH - (width - first)
+        if stars_before == 0:
+            last = first
+        elif stars_before == stars:
+            first = last
+        yield run, range(first, last + 1)
+
+
+def _matcher(pattern: str) -> "re.Pattern[str]":
+    return re.compile("".join(
+        "." if char == "?" else ".*" if char == "*" else re.escape(char) for char in pattern
+    ))
+
+
+def fits_a_plate(pattern: str) -> bool:
+    """Whether any plate of either style could match a normalized pattern."""
+    shape = "".join("A" if char.isalpha() else "0" if char.isdigit() else char for char in pattern)
+    match = _matcher(shape).fullmatch
+    return any(match(plate_shape) for plate_shape in PLATE_SHAPES)
+
+
+class VehicleRegistry:
+    """Registrations as packed columns, with the indexes that answer traces."""
+
+    def __init__(self, size: int = REGISTRY_SIZE, seed: int = REGISTRY_SEED) -> None:
+        if not MIN_SIZE <= size <= MAX_SIZE:
+            raise ValueError(f"registry size must be between {MIN_SIZE:,} and {MAX_SIZE:,}")
+        start = time.perf_counter()
+        self._generate(size, seed)
+        self._build_indexes()
+        self.build_seconds = time.perf_counter() - start
+        logger.info("Vehicle registry: %d registrations indexed in %.2fs", size, self.build_seconds)
+
+    def __len__(self) -> int:
+        return len(self._years)
+
+    def _generate(self, size: int, seed: int) -> None:
+        rng = random.Random(seed)
+        series = int(size * _SERIES_SHARE)
+        county = size - series - 1
+        smugglers = _LETTER_PAIRS.index("WA-") * 10_000 + 4471
+        offset = rng.randrange(_COUNTY_PLATES)
+        codes = ((index * _COUNTY_STRIDE + offset) % _COUNTY_PLATES for index in range(county + 1))
+        plates = [_LETTER_PAIRS[code // 10_000] + _FOUR_DIGITS[code % 10_000]
+                  for code in codes if code != smugglers][:county]
+        offset = rng.randrange(_SERIES_PLATES)
+        codes = ((index * _SERIES_STRIDE + offset) % _SERIES_PLATES for index in range(series))
+        plates += [_THREE_DIGITS[code // 2_600] + _SERIES_TAILS[code % 2_600] for code in codes]
+        # File the smugglers' plate somewhere in the middle, not at either end
+        record = rng.randrange(1, size - 1)
+        plates.insert(record, SMUGGLERS_PLATE)
+        self._plates = "".join(plates).encode("ascii")
+
+        self._years = array("H", rng.choices(range(YEARS[0], YEARS[1] + 1), k=size))
+        self._makes = array("B", rng.choices(range(len(MAKES)), k=size))
+        self._bodies = array("B", rng.choices(range(len(BODIES)), weights=_BODY_WEIGHTS, k=size))
+        self._colors = array("B", rng.choices(range(len(COLORS)), weights=_COLOR_WEIGHTS, k=size))
+        self._owners = array("H", rng.choices(range(len(OWNERS)), cum_weights=_OWNER_ODDS, k=size))
+        year, make, body, color, owner = _SMUGGLERS
+        self._years[record], self._makes[record], self._bodies[record] = year, make, body
+        self._colors[record], self._owners[record] = color, owner
+
+    def _build_indexes(self) -> None:
+        text = self._plates.decode("ascii")
+        starts = range(0, len(text), PLATE_WIDTH)
+        records = range(len(self))
+        plates = [text[start:start + PLATE_WIDTH] for start in starts]
+        self._by_plate = array("I", sorted(records, key=plates.__getitem__))
+        plates = [plate[::-1] for plate in plates]
+        self._by_tail = array("I", sorted(records, key=plates.__getitem__))
+        del plates
+        self._grams: Dict[str, array] = {}
+        for first in range(PLATE_WIDTH - GRAM + 1):
+            for gram, postings in _postings(text[start + first:start + first + GRAM] for start in starts).items():
+                if gram in self._grams:
+                    self._grams[gram].extend(postings)  # the same trigram at another position
+                else:
+                    self._grams[gram] = postings
+        # Each position's characters, one column of the plates at a time
+        self._at: List[Dict[str, array]] = [
+            _postings(text[position::PLATE_WIDTH]) for position in range(PLATE_WIDTH)
+        ]
+        self._by_make = _postings(self._makes)
+        self._by_owner = _postings(self._owners)
+
+    def _range(self, order: array, key: Callable[[int], str], start: str) -> Sequence[int]:
+        """The records in a sorted order whose key starts with start."""
+        keys = _SortedKeys(order, key)
+        # "~" sorts after every letter, digit and dash a plate is made of
+        return order[bisect_left(keys, start):bisect_left(keys, start + "~")]
+
+    def plate(self, record: int) -> str:
+        return self._plates[record * PLATE_WIDTH:(record + 1) * PLATE_WIDTH].decode("ascii")
+
+    def _tail(self, record: int) -> str:
+        return self.plate(record)[::-1]
+
+    def vehicle(self, record: int) -> Vehicle:
+        return Vehicle(
+            self.plate(record), self._years[record], MAKES[self._makes[record]],
+            BODIES[self._bodies[record]], COLORS[self._colors[record]], OWNERS[self._owners[record]],
+        )
+
+    def lookup(self, plate: str) -> Optional[Vehicle]:
+        """The registration for one whole plate, if there is one."""
+        if _WILDCARDS.search(plate):
+            return None
+        found = self.search(plate, limit=1)
+        return found[0] if found else None
+
+    def _candidates(self, pattern: str, make: Optional[int],
+                    owners: Optional[Sequence[int]]) -> Iterable[int]:
+        """The smallest list of records the indexes say could match."""
+        runs = [run for run in _WILDCARDS.split(pattern) if run]
+        sources: List[Tuple[int, Iterable[int]]] = []
+
+        def add(postings: Sequence[int]) -> None:
+            sources.append((len(postings), postings))
+
+        if not pattern.startswith(("?", "*")):
+            add(self._range(self._by_plate, self.plate, runs[0]))
+        if not pattern.endswith(("?", "*")):
+            add(self._range(self._by_tail, self._tail, runs[-1][::-1]))
+        for run in runs:
+            for start in range(len(run) - GRAM + 1):
+                add(self._grams.get(run[start:start + GRAM], _EMPTY))
+        for run, starts in _placements(pattern):
+            # Wherever the run starts, its rarest character there narrows it most
+            postings = [
+                min((self._at[start + offset].get(char, _EMPTY) for offset, char in enumerate(run)), key=len)
+                for start in starts
+            ]
+            if len(postings) == 1:
+                add(postings[0])
+            else:
+                # A plate can hold the run at more than one of the places
+                sources.append((sum(map(len, postings)), _distinct(chain.from_iterable(postings))))
+        if make is not None:
+            add(self._by_make.get(make, _EMPTY))
+        if owners is not None:
+            postings = [self._by_owner.get(owner, _EMPTY) for owner in owners]
+            sources.append((sum(map(len, postings)), chain.from_iterable(postings)))
+        if not sources:
+            # Nothing but wildcards: every plate fits, so the first records do
+            return range(len(self))
+        return min(sources, key=lambda source: source[0])[1]
+
+    def search(self, pattern: str = "*", make: Optional[str] = None, owner: Optional[str] = None,
+               limit: int = 20, max_checks: int = REGISTRY_MAX_CHECKS) -> List[Vehicle]:
+        """Registrations matching a partial plate, make and owner, by plate.
+
+        pattern takes ? and * wildcards; make is matched whole and owner
+        anywhere in the owner's name, both ignoring case. The first limit
+        matches found come back, sorted by plate.
+
+        Raises:
+            QueryError: if max_checks registrations were checked before
+                limit matches were found.
+        """
+        pattern = normalize_pattern(pattern)
+        make_id: Optional[int] = None
+        if make:
+            make_id = _MAKE_IDS.get(make.strip().lower())
+            if make_id is None:
+                return []
+        owner_ids: Optional[Sequence[int]] = None
+        if owner:
+            wanted = " ".join(owner.lower().split())
+            owner_ids = [index for index, name in enumerate(OWNERS) if wanted in name.lower()]
+        width = len(pattern.replace("*", ""))
+        if width > PLATE_WIDTH or (width < PLATE_WIDTH and "*" not in pattern) or not fits_a_plate(pattern):
+            return []
+
+        match = _matcher(pattern).fullmatch
+        owner_set = frozenset(owner_ids) if owner_ids is not None else None
+        plates, found = self._plates, []
+        for checked, record in enumerate(self._candidates(pattern, make_id, owner_ids)):
+            if checked >= max_checks:
+                raise QueryError("\"That could be half the cars in the state. Give me more of the plate, "
+                                 "or a make or an owner.\"")
+            if not match(plates[record * PLATE_WIDTH:(record + 1) * PLATE_WIDTH].decode("ascii")):
+                continue
+            if make_id is not None and self._makes[record] != make_id:
+                continue
+            if owner_set is not None and self._owners[record] not in owner_set:
+                continue
+            found.append(record)
+            if len(found) >= limit:
+                break
+        return sorted((self.vehicle(record) for record in found), key=lambda vehicle: vehicle.plate)
+
+    def scan(self, pattern: str = "*", make: Optional[str] = None, owner: Optional[str] = None,
+             limit: int = 20) -> List[Vehicle]:
+        """The same search by reading every registration, for comparison."""
+        match = _matcher(normalize_pattern(pattern)).fullmatch
+        wanted = " ".join(owner.lower().split()) if owner else None
+        found = []
+        for record in range(len(self)):
+            vehicle = self.vehicle(record)
+            if (match(vehicle.plate) and (not make or vehicle.make.lower() == make.strip().lower())
+                    and (wanted is None or wanted in vehicle.owner.lower())):
+                found.append(vehicle)
+                if len(found) >= limit:
+                    break
+        return sorted(found, key=lambda vehicle: vehicle.plate)
+
+
+_shared: Optional[VehicleRegistry] = None
+_shared_lock = threading.Lock()
+
+
+def shared() -> VehicleRegistry:
+    """The registry every session queries, built on first use."""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                size = os.environ.get(REGISTRY_SIZE_ENV, "").strip().replace("_", "")
+                _shared = VehicleRegistry(int(size) if size.isdigit() else REGISTRY_SIZE)
+    return _shared
+
+
+def parse_query(text: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """Split 'trace 7?3-k* make ford owner sullivan' into plate, make and owner."""
+    parts: Dict[str, List[str]] = {"plate": [], "make": [], "owner": []}
+    field = "plate"
+    for word in text.split():
+        keyword = word.lower()
+        if keyword in ("make", "owner"):
+            field = keyword
+        elif keyword == "by" and field == "plate":
+            field = "owner"
+        elif keyword not in ("plate", "plates", "for") or field != "plate" or parts["plate"]:
+            parts[field].append(word)
+    return (
+        " ".join(parts["plate"]) or "*",
+        " ".join(parts["make"]) or None,
+        " ".join(parts["owner"]) or None,
+    )
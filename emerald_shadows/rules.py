@@ -0,0 +1,213 @@
+"""Compiled rule engine for item side effects.
+
+The declarative tables in ``config_rules.py`` (and the combinations in
+``config_items.py``) describe what happens when the player takes, examines,
+uses or combines something. ``compile_rules`` turns them into a dispatch table
+keyed by ``(verb, item, location)`` once, at import time; at play time finding
+a rule is a dictionary probe per specificity level and its effects are
+pre-built callables, so per-turn cost stays flat however much content exists.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .config_items import ITEM_COMBINATIONS
+from .config_rules import ITEM_RULES
+
+ANY = "*"
+
+# An effect receives the ItemManager, the item name and the game state.
+Effect = Callable[[Any, str, Dict[str, Any]], None]
+
+
+class RuleError(Exception):
+    """Raised when a rule table entry is malformed."""
+    pass
+
+
+def combination_key(items: Iterable[str]) -> str:
+    """Return the rule-table item name for a set of combined items."""
+    return "+".join(sorted(items))
+
+
+# Named hooks for behavior that needs more than flags and score.
+RULE_HOOKS: Dict[str, Effect] = {
+    "collect_note": lambda manager, item, state: manager.collect_note(state),
+}
+
+
+def _print_effect(text: str) -> Effect:
+    if "{item}" in text:
+        return lambda manager, item, state: manager.narrate(text.replace("{item}", item))
+    return lambda manager, item, state: manager.narrate(text)
+
+
+def _set_flag_effect(flag: str) -> Effect:
+    def effect(manager: Any, item: str, state: Dict[str, Any]) -> None:
+        state[flag] = True
+    return effect
+
+
+def _set_state_effect(values: Mapping[str, Any]) -> Effect:
+    values = dict(values)
+    return lambda manager, item, state: state.update(values)
+
+
+def _add_score_effect(points: int) -> Effect:
+    def effect(manager: Any, item: str, state: Dict[str, Any]) -> None:
+        state["score"] = state.get("score", 0) + points
+    return effect
+
+
+def _remove_items_effect(items: Sequence[str]) -> Effect:
+    items = tuple(items)
+
+    def effect(manager: Any, item: str, state: Dict[str, Any]) -> None:
+        for name in items:
+            if name in manager.inventory:
+                manager.inventory.remove(name)
+    return effect
+
+
+def _call_effect(hook: str) -> Effect:
+    if hook not in RULE_HOOKS:
+        raise RuleError(f"Unknown rule hook '{hook}'")
+    return RULE_HOOKS[hook]
+
+
+_EFFECT_BUILDERS: Dict[str, Callable[[Any], Effect]] = {
+    "print": _print_effect,
+    "set_flag": _set_flag_effect,
+    "set_state": _set_state_effect,
+    "add_score": _add_score_effect,
+    "remove_items": _remove_items_effect,
+    "call": _call_effect,
+}
+
+
+class CompiledRule:
+    """A rule reduced to its guard flag and a tuple of ready-to-run effects."""
+
+    __slots__ = ("unless", "effects")
+
+    def __init__(self, unless: Optional[str], effects: Tuple[Effect, ...]) -> None:
+        self.unless = unless
+        self.effects = effects
+
+    def fire(self, manager: Any, item: str, game_state: Dict[str, Any]) -> bool:
+        """Run the effects unless the guard flag is already set."""
+        if self.unless and game_state.get(self.unless, False):
+            return False
+        for effect in self.effects:
+            effect(manager, item, game_state)
+        return True
+
+
+def _names(value: Any) -> List[str]:
+    if value is None:
+        return [ANY]
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+def _compile_effects(rule: Mapping[str, Any]) -> Tuple[Effect, ...]:
+    effects = []
+    for spec in rule.get("effects", ()):
+        if not isinstance(spec, Mapping) or len(spec) != 1:
+            raise RuleError(f"Effect must be a single-key object, got {spec!r}")
+        (kind, argument), = spec.items()
+        builder = _EFFECT_BUILDERS.get(kind)
+        if builder is None:
+            raise RuleError(f"Unknown effect type '{kind}'")
+        effects.append(builder(argument))
+    return tuple(effects)
+
+
+def _index_combinations(combinations: Iterable[FrozenSet[str]]) -> Dict[str, Tuple[FrozenSet[str], ...]]:
+    """Map each component item to the combinations it takes part in."""
+    index: Dict[str, List[FrozenSet[str]]] = {}
+    for combo in combinations:
+        for item in combo:
+            index.setdefault(item, []).append(combo)
+    return {item: tuple(combos) for item, combos in index.items()}
+
+
+class Rulebook:
+    """Direct-dispatch table of compiled rules."""
+
+    def __init__(self, table: Dict[Tuple[str, str, str], CompiledRule]) -> None:
+        self._table = table
+        # Each item's combinations, read back from this book's own combine rules
+        self.combinations = _index_combinations(dict.fromkeys(
+            frozenset(item.split("+")) for verb, item, _ in table if verb == "combine" and "+" in item
+        ))
+
+    def lookup(self, verb: str, item: str, location: Optional[str] = None) -> Optional[CompiledRule]:
+        """Return the most specific rule for an action, or None."""
+        table = self._table
+        return (
+            (location is not None and table.get((verb, item, location)))
+            or table.get((verb, item, ANY))
+            or table.get((verb, ANY, ANY))
+        )
+
+    def apply(
+        self,
+        verb: str,
+        item: str,
+        location: Optional[str],
+        manager: Any,
+        game_state: Dict[str, Any],
+    ) -> bool:
+        """Fire the matching rule, if any. Returns True if its effects ran."""
+        rule = self.lookup(verb, item, location)
+        if rule is None:
+            return False
+        try:
+            return rule.fire(manager, item, game_state)
+        except Exception as e:
+            logging.error(f"Error applying {verb} rule for {item} at {location}: {e}")
+            return False
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
+def combination_rules(combinations: Mapping[Iterable[str], Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """Express ``ITEM_COMBINATIONS`` entries as ``combine`` rules."""
+    rules = []
+    for items, result in combinations.items():
+        effects: List[Dict[str, Any]] = [{"print": "\n" + result["description"]}]
+        if isinstance(result.get("removes_items"), (list, tuple)):
+            effects.append({"remove_items": list(result["removes_items"])})
+        effects.append({"set_flag": result["result"]})
+        effects.append({"add_score": result.get("score", 15)})
+        rules.append({"verb": "combine", "item": combination_key(items), "effects": effects})
+    return rules
+
+
+def compile_rules(rules: Iterable[Mapping[str, Any]]) -> Rulebook:
+    """Compile declarative rules into a ``Rulebook``.
+
+    Raises:
+        RuleError: on a malformed rule or a duplicate (verb, item, location).
+    """
+    table: Dict[Tuple[str, str, str], CompiledRule] = {}
+    for rule in rules:
+        verb = rule.get("verb")
+        if not verb:
+            raise RuleError(f"Rule has no verb: {rule!r}")
+        compiled = CompiledRule(rule.get("unless"), _compile_effects(rule))
+        for item in _names(rule.get("item")):
+            for location in _names(rule.get("location")):
+                key = (verb, item, location)
+                if key in table:
+                    raise RuleError(f"Duplicate rule for {key}")
+                table[key] = compiled
+    return Rulebook(table)
+
+
+ITEM_RULEBOOK = compile_rules([*ITEM_RULES, *combination_rules(ITEM_COMBINATIONS)])
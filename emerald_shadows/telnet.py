@@ -0,0 +1,329 @@
+"""Telnet front end: one game per connection, each at its own window size.
+
+    python -m emerald_shadows.telnet --port 4000
+
+On connect the server asks the client for NAWS (window size, RFC 1073) and
+TTYPE (terminal type, RFC 1091). Every size report - clients send a new one
+whenever the player resizes - updates the session's ``TerminalGeometry``,
+which ``DisplayManager.use_geometry()`` makes the width text is wrapped to;
+the terminal type decides whether art is colored, and the width where it is
+cut. Wrapped text is cached by width, so players at the same width share
+the work.
+
+Output is compressed when the client takes up the offer of MCCP version 2
+(option 86): after ``IAC SB COMPRESS2 IAC SE`` everything the server sends
+is one zlib stream for the life of the connection, sync-flushed whenever a
+turn's output is complete and before each prompt. Room descriptions that
+come round again cost a few bytes of back-reference each time.
+
+Each connection runs in its own thread with its own ``GameManager``, which
+saves into a directory of its own under ``TELNET_SAVE_DIR``; output reaches
+the right socket through ``SessionStdout``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import logging
+import secrets
+import socket
+import socketserver
+import sys
+import threading
+import time
+import zlib
+from typing import Any, Callable, Optional
+
+from . import media
+from .config import TELNET_COMPRESSION, TELNET_COMPRESSION_LEVEL, TELNET_HOST, TELNET_PORT, TELNET_SAVE_DIR
+from .game_manager import GameManager
+from .puzzles import vehicle_registry
+from .utils import DisplayManager, SessionStdout, TerminalGeometry, print_text, redirect_output
+
+IAC, DONT, DO, WONT, WILL, SB, SE = 255, 254, 253, 252, 251, 250, 240
+SGA, TTYPE, NAWS, COMPRESS2 = 3, 24, 31, 86
+TTYPE_IS, TTYPE_SEND = 0, 1
+
+# How long to wait for the client's window size before the first screen
+NEGOTIATION_SECONDS = 0.5
+
+# Terminal type prefixes known to show ANSI color
+COLOR_TERMINALS = ("xterm", "screen", "tmux", "rxvt", "linux", "ansi", "putty", "konsole", "alacritty")
+
+
+class TelnetParser:
+    """Separates telnet commands from the data in the bytes a client sends.
+
+    Window size and terminal type reports are recorded as they arrive;
+    ``reply`` sends the parser's answers to the client's negotiation.
+    """
+
+    def __init__(self, reply: Callable[[bytes], Any], geometry: Optional[TerminalGeometry] = None) -> None:
+        self.reply = reply
+        self.geometry = geometry if geometry is not None else TerminalGeometry()
+        self.terminal_type = ""
+        self.sized = False  # whether the client has reported its window size
+        self.compression_accepted = False  # whether the client said DO COMPRESS2
+        self._state = "data"
+        self._command = 0
+        self._sub = bytearray()
+
+    def feed(self, data: bytes) -> bytes:
+        """Consume received bytes and return the data among them."""
+        if self._state == "data" and IAC not in data:
+            return data
+        out = bytearray()
+        for byte in data:
+            state = self._state
+            if state == "data":
+                if byte == IAC:
+                    self._state = "iac"
+                else:
+                    out.append(byte)
+            elif state == "iac":
+                if byte == IAC:
+                    out.append(IAC)
+                    self._state = "data"
+                elif byte in (DO, DONT, WILL, WONT):
+                    self._command = byte
+                    self._state = "option"
+                elif byte == SB:
+                    self._sub.clear()
+                    self._state = "sb"
+                else:  # NOP, GA and the like
+                    self._state = "data"
+            elif state == "option":
+                self._negotiate(self._command, byte)
+                self._state = "data"
+            elif state == "sb":
+                if byte == IAC:
+                    self._state = "sb_iac"
+                else:
+                    self._sub.append(byte)
+            elif state == "sb_iac":
+                if byte == SE:
+                    self._subnegotiation(bytes(self._sub))
+                    self._state = "data"
+                else:
+                    self._sub.append(byte)
+                    self._state = "sb"
+        return bytes(out)
+
+    def _negotiate(self, command: int, option: int) -> None:
+        if command == WILL:
+            if option == TTYPE:
+                self.reply(bytes([IAC, SB, TTYPE, TTYPE_SEND, IAC, SE]))
+            elif option != NAWS:
+                self.reply(bytes([IAC, DONT, option]))
+        elif command == DO:
+            if option == COMPRESS2:
+                self.compression_accepted = True
+            elif option != SGA:
+                self.reply(bytes([IAC, WONT, option]))
+
+    def _subnegotiation(self, sub: bytes) -> None:
+        if len(sub) >= 5 and sub[0] == NAWS:
+            width, height = (sub[1] << 8) | sub[2], (sub[3] << 8) | sub[4]
+            if width and height:
+                self.geometry.width, self.geometry.height = width, height
+                self.sized = True
+                logging.debug(f"Client window is {width}x{height}")
+        elif len(sub) >= 2 and sub[0] == TTYPE and sub[1] == TTYPE_IS:
+            self.terminal_type = sub[2:].decode("ascii", errors="replace").lower()
+            logging.debug(f"Client terminal is {self.terminal_type}")
+
+
+class TelnetSession(io.TextIOBase):
+    """One connected player: text out to the socket, lines in from it."""
+
+    def __init__(self, sock: socket.socket, compress: bool = TELNET_COMPRESSION) -> None:
+        self.sock = sock
+        self.compress = compress
+        self.geometry = TerminalGeometry()
+        self.parser = TelnetParser(self._send, self.geometry)
+        self._received = bytearray()
+        self._skip_newline = False
+        self._compressor: Optional[Any] = None
+        # Bytes handed to the compressor, and bytes actually sent
+        self.bytes_out = 0
+        self.bytes_sent = 0
+
+    @property
+    def compressing(self) -> bool:
+        return self._compressor is not None
+
+    def negotiate(self, timeout: float = NEGOTIATION_SECONDS) -> None:
+        """Offer to suppress go-ahead and compress, and ask for the window
+        size and terminal type.
+
+        Waits up to timeout for the window size, so the first screen is
+        already wrapped to it; clients that never send one get 80 columns.
+        """
+        offer = [IAC, WILL, SGA, IAC, DO, NAWS, IAC, DO, TTYPE]
+        if self.compress:
+            offer += [IAC, WILL, COMPRESS2]
+        self._send(bytes(offer))
+        previous = self.sock.gettimeout()
+        deadline = time.monotonic() + timeout
+        try:
+            while not self.parser.sized:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.sock.settimeout(remaining)
+                self._receive()
+        except socket.timeout:
+            pass
+        finally:
+            self.sock.settimeout(previous)
+        media.use_session_capabilities(self.capabilities())
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        data = text.replace("\n", "\r\n").encode("utf-8").replace(b"\xff", b"\xff\xff")
+        self._send(data, flush=False)
+        return len(text)
+
+    def flush(self) -> None:
+        """End of a turn's output: push everything compressed so far to the client."""
+        if self._compressor is not None:
+            self._sendall(self._compressor.flush(zlib.Z_SYNC_FLUSH))
+
+    def finish(self) -> None:
+        """End the compressed stream before the connection closes."""
+        if self._compressor is not None:
+            self._sendall(self._compressor.flush(zlib.Z_FINISH))
+            self._compressor = None
+
+    def _send(self, data: bytes, flush: bool = True) -> None:
+        self.bytes_out += len(data)
+        if self._compressor is None:
+            self._sendall(data)
+            return
+        self._sendall(self._compressor.compress(data))
+        if flush:
+            self.flush()
+
+    def _sendall(self, data: bytes) -> None:
+        if data:
+            self.sock.sendall(data)
+            self.bytes_sent += len(data)
+
+    def _receive(self) -> None:
+        data = self.sock.recv(4096)
+        if not data:
+            raise EOFError("client disconnected")
+        self._received += self.parser.feed(data)
+        if self.parser.compression_accepted and self.compress and self._compressor is None:
+            # Everything after this marker is one zlib stream
+            self._sendall(bytes([IAC, SB, COMPRESS2, IAC, SE]))
+            self._compressor = zlib.compressobj(TELNET_COMPRESSION_LEVEL)
+            logging.debug("Client accepted compression")
+
+    def capabilities(self) -> media.Capabilities:
+        """What this player's terminal can show, as far as it has told us."""
+        color = self.parser.terminal_type.startswith(COLOR_TERMINALS) or "color" in self.parser.terminal_type
+        return media.Capabilities(art=True, color=color, width=self.geometry.width)
+
+    def read_line(self, prompt: str = "") -> str:
+        """Show prompt and return the next line the player sends.
+
+        Raises:
+            EOFError: if the player disconnects.
+        """
+        if prompt:
+            self.write(prompt)
+        self.flush()
+        while True:
+            if self._skip_newline and self._received[:1] in (b"\n", b"\x00"):
+                del self._received[:1]
+            if self._received:
+                self._skip_newline = False
+            ends = [i for i in (self._received.find(b"\r"), self._received.find(b"\n")) if i >= 0]
+            if ends:
+                end = min(ends)
+                line = bytes(self._received[:end])
+                self._skip_newline = self._received[end] == ord("\r")
+                del self._received[:end + 1]
+                break
+            self._receive()
+        # A resize or terminal type may have arrived with the line
+        media.use_session_capabilities(self.capabilities())
+        return line.decode("utf-8", errors="replace")
+
+
+def play_session(sock: socket.socket) -> None:
+    """Run a game for one connection until the player quits or leaves."""
+    session = TelnetSession(sock)
+    DisplayManager.use_geometry(session.geometry)
+    media.use_session_capabilities(session.capabilities())
+    try:
+        with redirect_output(session):
+            session.negotiate()
+            # Each connection saves into its own directory, so players never
+            # overwrite or restore one another's games
+            game = GameManager(save_dir=TELNET_SAVE_DIR / secrets.token_hex(8))
+            game.read_line = session.read_line
+            print_text("Seattle, Washington. October 1947.\nYou are Johnny Diamond, Detective.\n")
+            game.show_location_if_changed()
+            while game.handle_line(game.prompt("\n> ").strip().lower()):
+                pass
+        session.finish()
+    except (EOFError, OSError) as e:
+        logging.info(f"Telnet session ended: {e}")
+    finally:
+        sock.close()
+    if session.bytes_out:
+        logging.info(
+            f"Telnet session sent {session.bytes_sent} bytes for {session.bytes_out} "
+            f"({session.bytes_sent / session.bytes_out:.0%})"
+        )
+
+
+class TelnetServer(socketserver.ThreadingTCPServer):
+    """Accepts telnet connections, each played in its own thread."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: tuple) -> None:
+        super().__init__(address, _SessionHandler)
+
+
+class _SessionHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        logging.info(f"Telnet connection from {self.client_address}")
+        play_session(self.request)
+
+
+def install_session_stdout() -> None:
+    """Route printed output to each session's own stream."""
+    if not isinstance(sys.stdout, SessionStdout):
+        sys.stdout = SessionStdout(sys.stdout)
+
+
+def serve(host: str = TELNET_HOST, port: int = TELNET_PORT) -> None:
+    install_session_stdout()
+    # Index the vehicle registry while the first players are still connecting
+    threading.Thread(target=vehicle_registry.shared, name="vehicle-registry", daemon=True).start()
+    with TelnetServer((host, port)) as server:
+        logging.info(f"Serving telnet on {host}:{port}")
+        server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=TELNET_HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=TELNET_PORT, help="port to listen on")
+    args = parser.parse_args()
+    try:
+        serve(args.host, args.port)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Terminal capabilities, probed once, and the control sequences they allow.
+
+Everything is looked up when first needed - normally at startup - and kept:
+whether stdout is a terminal, how many colors it shows, whether it takes
+UTF-8, and the escape sequences for clearing the screen and placing the
+cursor. Sequences come from the terminfo database through the standard
+``curses`` module where it exists, with the common ANSI ones as a fallback
+(Windows consoles have them once virtual terminal processing is switched
+on). Clearing the screen is then one write, never a ``cls``/``clear`` shell.
+
+Terminal size is not kept here; ``DisplayManager`` caches it until SIGWINCH.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import curses
+except ImportError:  # Windows without windows-curses
+    curses = None
+
+ANSI_CLEAR = "\x1b[H\x1b[2J"
+ANSI_CURSOR_TO = "\x1b[{row};{column}H"
+
+
+@dataclass(frozen=True)
+class TerminalInfo:
+    """What the terminal behind one output stream can do."""
+    interactive: bool
+    colors: int = 0  # 0 when color is unavailable
+    utf8: bool = False
+    encoding: str = "utf-8"
+    clear: str = ""  # clears the screen and homes the cursor; "" if unknown
+    cursor_address: str = ""  # terminfo "cup" template; "" if unknown
+    name: str = ""
+
+    @property
+    def cursor_control(self) -> bool:
+        return bool(self.cursor_address)
+
+    def cursor_to(self, row: int, column: int) -> str:
+        """Sequence moving the cursor to a zero-based row and column."""
+        if not self.cursor_address:
+            return ""
+        if self.cursor_address == ANSI_CURSOR_TO:
+            return ANSI_CURSOR_TO.format(row=row + 1, column=column + 1)
+        return curses.tparm(self.cursor_address.encode("latin-1"), row, column).decode("latin-1")
+
+
+_info: Optional[TerminalInfo] = None
+# Values worked out from the probe (and the environment), each with the probe it came from
+_derived: Dict[str, Tuple[TerminalInfo, Any]] = {}
+
+
+def probe(stream: Any = None) -> TerminalInfo:
+    """Look up what stream's terminal can do (the process's real stdout by default).
+
+    The default is ``sys.__stdout__``, not ``sys.stdout``, so a first probe
+    made while output is redirected - into a turn's batch, say - still sees
+    the terminal. Never raises: anything that cannot be determined is
+    reported as absent.
+    """
+    if stream is None:
+        stream = sys.__stdout__ if sys.__stdout__ is not None else sys.stdout
+    encoding = getattr(stream, "encoding", None) or "utf-8"
+    utf8 = encoding.lower().replace("-", "").replace("_", "") == "utf8"
+    try:
+        interactive = bool(stream.isatty())
+    except Exception:
+        interactive = False
+    if not interactive:
+        return TerminalInfo(False, utf8=utf8, encoding=encoding)
+
+    name = os.environ.get("TERM", "")
+    if name == "dumb":
+        return TerminalInfo(True, utf8=utf8, encoding=encoding, name=name)
+    if curses is not None:
+        try:
+            curses.setupterm(name or None, stream.fileno())
+            colors = max(curses.tigetnum("colors"), 0)
+            clear = (curses.tigetstr("clear") or b"").decode("latin-1")
+            cup = (curses.tigetstr("cup") or b"").decode("latin-1")
+            return TerminalInfo(True, colors, utf8, encoding, clear, cup, name)
+        except Exception as e:
+            logging.debug(f"No terminfo entry for '{name}': {e}")
+    if os.name == "nt" and not _enable_windows_ansi():
+        return TerminalInfo(True, utf8=utf8, encoding=encoding, name=name)
+    return TerminalInfo(True, 8, utf8, encoding, ANSI_CLEAR, ANSI_CURSOR_TO, name)
+
+
+def _enable_windows_ansi() -> bool:
+    """Turn on virtual terminal processing for the Windows console's stdout."""
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except Exception:
+        return False
+
+
+def info() -> TerminalInfo:
+    """Capabilities of this process's stdout, probed on first use and then reused."""
+    global _info
+    if _info is None:
+        _info = probe()
+    return _info
+
+
+def derived(key: str, build: Callable[[TerminalInfo], Any]) -> Any:
+    """A value built from the probe, kept with it until the next reset()."""
+    current = info()
+    cached = _derived.get(key)
+    if cached is None or cached[0] is not current:
+        cached = _derived[key] = (current, build(current))
+    return cached[1]
+
+
+def reset() -> None:
+    """Forget the probed capabilities and everything derived from them, e.g.
+    after stdout is replaced or the environment changes."""
+    global _info
+    _info = None
+    _derived.clear()
+
+
+def clear_screen(stream: Any = None) -> bool:
+    """Clear the screen with a single write. False if the terminal can't."""
+    sequence = info().clear
+    if not sequence:
+        return False
+    stream = stream if stream is not None else sys.stdout
+    stream.write(sequence)
+    stream.flush()
+    return True
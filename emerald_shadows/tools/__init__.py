@@ -0,0 +1 @@
+"""Offline developer tools for Emerald Shadows (generators, analysers)."""
@@ -0,0 +1,247 @@
+"""Mine logged player commands for parser coverage gaps.
+
+Streams raw commands out of game logs (``Command: ...`` lines), transcripts
+(``> ...`` lines) or plain one-command-per-line files, runs them through
+``NaturalCommandHandler`` in parallel worker processes, and reports the most
+common:
+
+- unparsed inputs: nothing in the grammar matched
+- near-miss verbs: an unknown first word a few typos from a known verb
+- unknown nouns: a parsed command naming no item or exit in the world
+- ambiguous parses: a first word or noun equally close to several names
+
+Input is read in fixed-size chunks with a bounded number in flight, and each
+frequency table is pruned to its heaviest entries when it grows too large, so
+memory stays flat however many lines go through. Counts for rare entries are
+therefore approximate; the heads of the tables are what matter.
+
+Run from the repository root:
+
+    python -m emerald_shadows.tools.logmine logs/emerald_shadows.log
+    python -m emerald_shadows.tools.logmine sessions/*.txt.gz --processes 8 --top 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import re
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Deque, Dict, IO, Iterable, Iterator, List, Optional, Set
+
+from ..commands.natural_commands import COMBINE_SEPARATORS, NaturalCommandHandler
+from ..content import CONTENT_STORE
+from ..location_manager import LocationManager
+
+TABLES = ("unparsed", "near_miss_verbs", "unknown_nouns", "ambiguous")
+FORMATS = ("auto", "log", "transcript", "plain")
+
+CHUNK_LINES = 20_000
+MAX_TABLE_ENTRIES = 50_000
+
+# Commands whose argument should name an item, or an exit
+ITEM_COMMANDS = {"take", "examine", "use", "drop", "combine"}
+EXIT_COMMANDS = {"go"}
+
+_LOG_COMMAND = re.compile(r" - Command: (.*)$")
+_TRANSCRIPT_COMMAND = re.compile(r"^>\s*(.*)$")
+
+
+def open_text(path: Path) -> IO[str]:
+    """Open a log for reading as text, transparently un-gzipping ``.gz`` files."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+
+def extract_command(line: str, fmt: str = "auto") -> Optional[str]:
+    """Pull the raw player command out of one line, or None if it holds none."""
+    if fmt == "plain":
+        return line.strip() or None
+    if fmt in ("auto", "log"):
+        match = _LOG_COMMAND.search(line)
+        if match:
+            return match.group(1).strip() or None
+    if fmt in ("auto", "transcript"):
+        match = _TRANSCRIPT_COMMAND.match(line)
+        if match:
+            return match.group(1).strip() or None
+    return None
+
+
+def iter_commands(paths: Iterable[Path], fmt: str = "auto") -> Iterator[str]:
+    """Yield raw commands from every file in turn, one line in memory at a time."""
+    for path in paths:
+        with open_text(Path(path)) as handle:
+            for line in handle:
+                command = extract_command(line, fmt)
+                if command:
+                    yield command
+
+
+def prune(table: Counter, limit: int = MAX_TABLE_ENTRIES) -> None:
+    """Keep only the heaviest half of a table that has outgrown ``limit``."""
+    if len(table) > limit:
+        keep = table.most_common(limit // 2)
+        table.clear()
+        table.update(dict(keep))
+
+
+def merge(into: Dict[str, Counter], tables: Dict[str, Counter]) -> None:
+    """Add one set of frequency tables into another, pruning as it goes."""
+    for name in TABLES:
+        into[name].update(tables[name])
+        prune(into[name])
+
+
+class CommandMiner:
+    """Classifies raw commands against the parser and the world's vocabulary."""
+
+    def __init__(self) -> None:
+        self.handler = NaturalCommandHandler()
+        content = CONTENT_STORE.current
+        self.items: Set[str] = set(content.item_descriptions)
+        self.exits: Set[str] = set(self.handler.direction_aliases.values())
+        self.exits.update(LocationManager._EXIT_SYNONYMS)
+        for location in content.locations.values():
+            self.items.update(location.get("items", ()))
+            self.exits.update(location.get("exits", {}))
+
+    def mine(self, commands: Iterable[str]) -> Dict[str, Counter]:
+        """Return frequency tables for a batch of raw commands."""
+        tables = {name: Counter() for name in TABLES}
+        for raw in commands:
+            for command in self.handler.split_commands(raw):
+                self._classify(command, tables)
+        return tables
+
+    def _classify(self, command: str, tables: Dict[str, Counter]) -> None:
+        parsed = self.handler.parse(command)
+        vocabulary = self.handler.vocabulary
+        first_word = command.split()[0]
+
+        if not parsed.command:
+            if command in self.exits:
+                return
+            verbs = vocabulary.verb_candidates(first_word)
+            if len(verbs) > 1:
+                tables["ambiguous"][f"{first_word} -> {' | '.join(verbs)}"] += 1
+            elif verbs:
+                tables["near_miss_verbs"][f"{first_word} -> {verbs[0]}"] += 1
+            else:
+                tables["unparsed"][command] += 1
+            return
+
+        if parsed.command in ITEM_COMMANDS:
+            scope = self.items
+        elif parsed.command in EXIT_COMMANDS:
+            scope = self.exits
+        else:
+            return
+
+        names = [parsed.argument]
+        if parsed.command == "combine":
+            names = COMBINE_SEPARATORS.split(parsed.argument)
+        for name in names:
+            if not name or name in ("all", "everything"):
+                continue
+            found = vocabulary.candidates(name, scope)
+            if len(found) > 1:
+                tables["ambiguous"][f"{name} -> {' | '.join(found)}"] += 1
+            elif not found:
+                tables["unknown_nouns"][f"{parsed.command} {name}"] += 1
+
+
+_MINER: Optional[CommandMiner] = None
+
+
+def _mine_chunk(commands: List[str]) -> Dict[str, Counter]:
+    """Worker entry point: mine one chunk with this process's miner."""
+    global _MINER
+    if _MINER is None:
+        _MINER = CommandMiner()
+    return _MINER.mine(commands)
+
+
+def _chunks(commands: Iterator[str], size: int) -> Iterator[List[str]]:
+    while True:
+        chunk = list(islice(commands, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def mine_logs(
+    paths: Iterable[Path],
+    fmt: str = "auto",
+    processes: Optional[int] = None,
+    chunk_lines: int = CHUNK_LINES,
+) -> Dict[str, Counter]:
+    """Mine every command in ``paths`` and return merged frequency tables.
+
+    With ``processes=1`` everything runs in this process. Otherwise chunks
+    are farmed out to a process pool, with at most two per worker queued at
+    once so reading never races ahead of parsing.
+    """
+    totals = {name: Counter() for name in TABLES}
+    chunks = _chunks(iter_commands(paths, fmt), chunk_lines)
+    processes = processes or os.cpu_count() or 1
+
+    if processes == 1:
+        for chunk in chunks:
+            merge(totals, _mine_chunk(chunk))
+        return totals
+
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        for chunk in chunks:
+            pending.append(pool.submit(_mine_chunk, chunk))
+            if len(pending) >= processes * 2:
+                merge(totals, pending.popleft().result())
+        while pending:
+            merge(totals, pending.popleft().result())
+    return totals
+
+
+def format_report(tables: Dict[str, Counter], top: int) -> str:
+    """Render the heads of each frequency table as plain text."""
+    titles = {
+        "unparsed": "Unparsed inputs",
+        "near_miss_verbs": "Near-miss verbs",
+        "unknown_nouns": "Unknown nouns",
+        "ambiguous": "Ambiguous parses",
+    }
+    lines = []
+    for name in TABLES:
+        table = tables[name]
+        lines.append(f"{titles[name]} ({sum(table.values())} total, {len(table)} distinct)")
+        for entry, count in table.most_common(top):
+            lines.append(f"  {count:>8}  {entry}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", type=Path, nargs="+", help="log, transcript or command files (.gz ok)")
+    parser.add_argument("--format", choices=FORMATS, default="auto", help="how commands appear in the files")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-lines", type=int, default=CHUNK_LINES, help="commands per work unit")
+    parser.add_argument("--top", type=int, default=25, help="entries to show per table")
+    parser.add_argument("--json", action="store_true", help="print the tables as JSON")
+    args = parser.parse_args()
+
+    tables = mine_logs(args.paths, args.format, args.processes, args.chunk_lines)
+    if args.json:
+        print(json.dumps({name: dict(tables[name].most_common(args.top)) for name in TABLES}, indent=2))
+    else:
+        print(format_report(tables, args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Batch verifier for generated puzzle variants.
+
+Generates variants seed by seed and checks each one the way a player would
+meet it:
+
+* solvable - every puzzle accepts its own answer, in each accepted form
+  (the Morse one keyed in dots and dashes too);
+* unique - no other answer opens it: the classic answer, the neighbouring
+  frequencies and warehouse numbers, and every other cipher key;
+* clued - the clues the player reads name the answers and nothing of the
+  classic ones is left in them.
+
+    python -m emerald_shadows.tools.puzzlegen --count 20000 --seed 0
+
+Exits non-zero if any variant fails.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from ..config_items import ITEM_DESCRIPTIONS
+from ..puzzles.codec import encode_morse
+from ..puzzles.puzzle_manager import build_puzzles
+from ..puzzles.variants import CIPHER_KEYS, CLASSIC, PuzzleVariant, generate_variant, mentions_answers
+
+# Items whose descriptions carry a clue, and the manifest the variants add one to
+CLUE_ITEMS: Tuple[str, ...] = tuple(
+    item for item, data in ITEM_DESCRIPTIONS.items() if mentions_answers(data["detailed"])
+) + ("manifest",)
+
+
+@dataclass
+class BatchReport:
+    checked: int = 0
+    distinct: int = 0
+    seconds: float = 0.0
+    failures: Dict[int, List[str]] = field(default_factory=dict)
+
+    @property
+    def rate(self) -> float:
+        return self.checked / self.seconds if self.seconds else 0.0
+
+
+def _neighbours(frequency: str) -> List[str]:
+    tenths = round(float(frequency) * 10)
+    return [f"{n // 10}.{n % 10}" for n in (tenths - 1, tenths + 1)]
+
+
+def verify_variant(variant: PuzzleVariant) -> List[str]:
+    """Everything wrong with a variant; empty when it plays fairly."""
+    problems = []
+    radio, cipher, morse = build_puzzles(variant)[:3]
+
+    if not radio.attempt(variant.frequency)[0]:
+        problems.append(f"radio rejects {variant.frequency}")
+    if not cipher.attempt(variant.cipher_key.lower())[0]:
+        problems.append(f"cipher rejects {variant.cipher_key}")
+    for answer in variant.morse_answers:
+        if not morse.attempt(answer)[0]:
+            problems.append(f"morse rejects {answer}")
+    if not morse.attempt(encode_morse(variant.morse_target))[0]:
+        problems.append(f"morse rejects {variant.morse_target} keyed as dots and dashes")
+
+    for wrong in _neighbours(variant.frequency) + [CLASSIC.frequency]:
+        if wrong != variant.frequency and radio.attempt(wrong)[0]:
+            problems.append(f"radio also accepts {wrong}")
+    for wrong in CIPHER_KEYS:
+        if wrong != variant.cipher_key and cipher.attempt(wrong)[0]:
+            problems.append(f"cipher also accepts {wrong}")
+    for number in (variant.warehouse - 1, variant.warehouse + 1, CLASSIC.warehouse):
+        if number != variant.warehouse and morse.attempt(f"WAREHOUSE {number}")[0]:
+            problems.append(f"morse also accepts warehouse {number}")
+
+    clues = " ".join(
+        variant.clue_text(item, ITEM_DESCRIPTIONS[item]["detailed"]) for item in CLUE_ITEMS
+    )
+    lowered = clues.lower()
+    if variant.frequency not in clues:
+        problems.append(f"no clue gives {variant.frequency}")
+    if variant.cipher_key.lower() not in lowered:
+        problems.append(f"no clue gives {variant.cipher_key}")
+    if f"warehouse {variant.warehouse}" not in lowered:
+        problems.append(f"no clue gives warehouse {variant.warehouse}")
+    if not variant.is_classic:
+        if variant.frequency != CLASSIC.frequency and CLASSIC.frequency in clues:
+            problems.append("clues still give the classic frequency")
+        if variant.cipher_key != CLASSIC.cipher_key and CLASSIC.cipher_key.lower() in lowered:
+            problems.append("clues still give the classic key")
+        if variant.warehouse != CLASSIC.warehouse and f"warehouse {CLASSIC.warehouse}" in lowered:
+            problems.append("clues still give the classic warehouse")
+    return problems
+
+
+def verify_batch(count: int, seed: int = 0) -> BatchReport:
+    """Generate and verify count variants, seeds seed to seed + count - 1."""
+    report = BatchReport()
+    answers = set()
+    start = time.perf_counter()
+    for current in range(seed, seed + count):
+        variant = generate_variant(current)
+        answers.add((variant.frequency, variant.cipher_key, variant.warehouse))
+        problems = verify_variant(variant)
+        if problems:
+            report.failures[current] = problems
+        report.checked += 1
+    report.seconds = time.perf_counter() - start
+    report.distinct = len(answers)
+    return report
+
+
+def format_report(report: BatchReport) -> str:
+    lines = [
+        f"Checked {report.checked:,} variants in {report.seconds:.2f}s ({report.rate:,.0f}/s)",
+        f"{report.distinct:,} distinct answer sets, {len(report.failures):,} failing",
+    ]
+    for seed, problems in list(report.failures.items())[:20]:
+        lines.append(f"  seed {seed}: {'; '.join(problems)}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000, help="variants to verify")
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    report = verify_batch(args.count, args.seed)
+    print(format_report(report))
+    sys.exit(1 if report.failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Full-screen terminal mode: a status bar, a scrollback pane and an input line.
+
+    EMERALD_TUI=1 python -m emerald_shadows
+
+The top row shows where the player is, the score and, when riding, the
+trolley stop. Game output collects in the scrollback pane below it, which
+Page Up / Page Down page through, and commands are typed on the bottom row.
+
+Every repaint writes the whole screen into the curses window, which is only
+memory, and leaves it to curses' refresh to send the terminal just the
+characters that changed. The pane fills from the top like a terminal; once
+it is full, curses is allowed to use the terminal's own line insert/delete
+to scroll it. The grue's art is shown as one still block in the pane, since
+the pane is only repainted between turns.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import shutil
+from collections import deque
+from contextlib import redirect_stdout
+from itertools import islice
+from typing import Any, Deque, List
+
+from . import media
+from .config import TUI_SCROLLBACK_LINES
+
+try:
+    import curses
+except ImportError:  # Windows without windows-curses
+    curses = None
+
+STATUS_SEPARATOR = "  |  "
+
+
+def status_line(game: Any) -> str:
+    """Location, score and trolley stop for the status bar."""
+    location_manager = game.location_manager
+    parts = [
+        location_manager.current_location.replace("_", " ").title(),
+        f"Score: {game.game_state.get('score', 0)}",
+    ]
+    if location_manager.trolley.on_trolley:
+        parts.append(location_manager.trolley.get_stop_description())
+    return STATUS_SEPARATOR.join(parts)
+
+
+class Scrollback:
+    """Past output as screen lines, with a view that can be paged back."""
+
+    def __init__(self, limit: int = TUI_SCROLLBACK_LINES) -> None:
+        self.lines: Deque[str] = deque(maxlen=limit)
+        self.offset = 0  # lines paged back from the newest
+        self._partial = ""
+
+    def write(self, text: str, width: int) -> None:
+        """Add output, splitting it into lines no wider than width."""
+        text = self._partial + text
+        *complete, self._partial = text.split("\n")
+        for line in complete:
+            while len(line) > width:
+                self.lines.append(line[:width])
+                line = line[width:]
+            self.lines.append(line)
+        # New output brings the view back to the bottom
+        self.offset = 0
+
+    def view(self, height: int) -> List[str]:
+        """The height rows currently on show, filled from the top."""
+        end = len(self.lines) - self.offset
+        rows = list(islice(self.lines, max(0, end - height), end))
+        return rows + [""] * (height - len(rows))
+
+    def page(self, amount: int, height: int) -> None:
+        """Page back (positive amount) or forward through the output."""
+        self.offset = max(0, min(self.offset + amount, len(self.lines) - height))
+
+
+class _PaneWriter(io.TextIOBase):
+    """stdout replacement that sends game output to the scrollback pane."""
+
+    def __init__(self, ui: "TerminalUI") -> None:
+        self._ui = ui
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._ui.scrollback.write(text, self._ui.width - 1)
+        return len(text)
+
+
+class TerminalUI:
+    """Runs a GameManager inside a curses screen."""
+
+    BACKSPACE = {"\x7f", "\b"}
+
+    def __init__(self, game: Any, scrollback_lines: int = TUI_SCROLLBACK_LINES) -> None:
+        self.game = game
+        self.scrollback = Scrollback(scrollback_lines)
+        self.screen: Any = None
+        self.height, self.width = 24, 80
+        self.prompt_text = "> "
+        self.typed = ""
+
+    @property
+    def pane_height(self) -> int:
+        return max(1, self.height - 2)
+
+    def rows(self) -> List[str]:
+        """Every row of the screen as it should look now."""
+        usable = self.width - 1  # writing the bottom-right cell scrolls the screen
+        status = status_line(self.game)[:usable].ljust(usable)
+        line = self.prompt_text + self.typed
+        return [status, *self.scrollback.view(self.pane_height), line[-usable:]]
+
+    def redraw(self) -> None:
+        """Draw the screen; curses sends the terminal only what changed."""
+        for y, row in enumerate(self.rows()):
+            attr = curses.A_REVERSE if y == 0 and curses is not None else 0
+            self.screen.addstr(y, 0, row, attr)
+            self.screen.clrtoeol()
+        column = min(len(self.prompt_text) + len(self.typed), self.width - 2)
+        self.screen.move(self.height - 1, column)
+        self.screen.refresh()
+
+    def read_line(self, prompt: str = "> ") -> str:
+        """Edit a line on the input row until Enter. Stands in for input()."""
+        self.prompt_text = prompt.strip("\n")
+        self.typed = ""
+        while True:
+            self._check_size()
+            self.redraw()
+            try:
+                key = self.screen.get_wch()
+            except curses.error:
+                continue  # interrupted, e.g. by a resize
+            if key in ("\n", "\r") or key == getattr(curses, "KEY_ENTER", None):
+                line, self.typed = self.typed, ""
+                self.scrollback.write(f"{self.prompt_text}{line}\n", self.width - 1)
+                return line
+            if key in self.BACKSPACE or key == getattr(curses, "KEY_BACKSPACE", None):
+                self.typed = self.typed[:-1]
+            elif key == "\x04" and not self.typed:  # Ctrl-D
+                return "quit"
+            elif key == getattr(curses, "KEY_PPAGE", None):
+                self.scrollback.page(self.pane_height, self.pane_height)
+            elif key == getattr(curses, "KEY_NPAGE", None):
+                self.scrollback.page(-self.pane_height, self.pane_height)
+            elif key == getattr(curses, "KEY_RESIZE", None):
+                self._check_size(force=True)
+            elif isinstance(key, str) and key.isprintable():
+                self.typed += key
+
+    def _check_size(self, force: bool = False) -> None:
+        """Pick up a new terminal size and schedule a full redraw."""
+        columns, lines = shutil.get_terminal_size((self.width, self.height))
+        if force or (lines, columns) != (self.height, self.width):
+            if curses is not None and curses.is_term_resized(lines, columns):
+                curses.resizeterm(lines, columns)
+            self.height, self.width = self.screen.getmaxyx()
+            self.screen.clear()
+
+    def run(self, screen: Any) -> None:
+        """Play the game on screen until it ends; for curses.wrapper()."""
+        self.screen = screen
+        self.height, self.width = screen.getmaxyx()
+        screen.idlok(True)
+        screen.keypad(True)
+        game = self.game
+        game.read_line = self.read_line
+        # Art is drawn as plain text inside the pane, all at once: the pane
+        # isn't repainted until the turn is over
+        media.set_capabilities(media.STILL)
+        try:
+            with redirect_stdout(_PaneWriter(self)):
+                game.show_location_if_changed()
+                while game.handle_line(self.read_line("> ").strip().lower()):
+                    pass
+                self.read_line("[Press Enter to leave]")
+        finally:
+            game.read_line = None
+            media.reset_capabilities()
+
+
+def run_tui(game: Any) -> bool:
+    """Play the game full screen. False if curses is unavailable here."""
+    if curses is None:
+        logging.warning("Full-screen mode needs the curses module")
+        return False
+    curses.wrapper(TerminalUI(game).run)
+    return True
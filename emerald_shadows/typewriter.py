@@ -0,0 +1,122 @@
+"""Frame-based typewriter effect for slow text.
+
+Text is cut into frames sized so that ``TYPEWRITER_FRAME_RATE`` writes per
+second reproduce the requested per-character speed. Each frame is one write
+and one flush, so the cost follows how long the text plays, not how many
+characters it has. A keypress while it plays dumps the rest in a single
+write.
+
+``play`` drives the effect from a blocking loop. That suits the telnet
+server too: each connection has a thread of its own, so a pause holds up only
+that player.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import select
+import sys
+import time
+from typing import Any, Callable, List, Optional
+
+from .config import TYPEWRITER_FRAME_RATE
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
+    tty = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+
+def plan_frames(text: str, delay: float, frame_rate: int = TYPEWRITER_FRAME_RATE) -> List[str]:
+    """Split text into the chunks written on each frame."""
+    per_frame = max(1, round(1.0 / (delay * frame_rate)))
+    return [text[i:i + per_frame] for i in range(0, len(text), per_frame)]
+
+
+class KeypressWatcher:
+    """Waits between frames and reports whether a key was pressed meanwhile.
+
+    On a POSIX terminal stdin is put in cbreak mode while the effect plays so
+    a single key is seen without Enter; the key is consumed. On Windows the
+    console is polled. Anywhere else it simply sleeps.
+    """
+
+    def __init__(self, stream: Any = None) -> None:
+        self.stream = stream if stream is not None else sys.stdin
+        self._fd: Optional[int] = None
+        self._saved: Any = None
+
+    def __enter__(self) -> "KeypressWatcher":
+        try:
+            if termios is not None and self.stream.isatty():
+                self._fd = self.stream.fileno()
+                self._saved = termios.tcgetattr(self._fd)
+                tty.setcbreak(self._fd)
+        except Exception as e:
+            logging.debug(f"Keypress skipping unavailable: {e}")
+            self._fd = None
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._fd is not None:
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved)
+            self._fd = None
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to timeout seconds; True if a key was pressed."""
+        if self._fd is not None:
+            ready, _, _ = select.select([self._fd], [], [], timeout)
+            if ready:
+                os.read(self._fd, 64)
+                return True
+            return False
+        if msvcrt is not None and self.stream.isatty():
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                if msvcrt.kbhit():
+                    msvcrt.getwch()
+                    return True
+                time.sleep(min(0.01, timeout))
+            return False
+        time.sleep(timeout)
+        return False
+
+
+class Typewriter:
+    """Plays one piece of text as a typewriter effect."""
+
+    def __init__(self, text: str, delay: float, frame_rate: int = TYPEWRITER_FRAME_RATE) -> None:
+        self.frames = plan_frames(text, delay, frame_rate)
+        self.interval = len(self.frames[0]) * delay if len(self.frames) > 1 else 0.0
+        self.skipped = False
+
+    def play(self, stream: Any = None, wait: Optional[Callable[[float], bool]] = None) -> None:
+        """Write the frames to stream, pausing with wait() between them.
+
+        wait(seconds) returns True to skip to the end; by default it watches
+        the keyboard.
+        """
+        stream = stream if stream is not None else sys.stdout
+        if wait is None:
+            with KeypressWatcher() as watcher:
+                self.play(stream, watcher.wait)
+            return
+        for index, frame in enumerate(self.frames):
+            stream.write(frame)
+            stream.flush()
+            if index + 1 < len(self.frames) and wait(self.interval):
+                self._finish(stream, index + 1)
+                return
+
+    def _finish(self, stream: Any, start: int) -> None:
+        self.skipped = True
+        stream.write("".join(self.frames[start:]))
+        stream.flush()
@@ -1,18 +1,112 @@
-import os
+import io
+import signal
 import sys
 import time
 import logging
 import json
 import shutil
 import textwrap
-from typing import Tuple, Optional, Dict, Any, List
-from functools import wraps
+from typing import Tuple, Optional, Dict, Any, Iterator, List
+from contextlib import contextmanager, redirect_stdout
+from contextvars import ContextVar
+from functools import lru_cache, wraps
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 
+from . import events, terminal
+from .typewriter import Typewriter
+
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=256)
+def _wrap_paragraphs(text: str, width: int, indent: int) -> str:
+    """Wrap text paragraph by paragraph. Cached: the same prose is shown again and again."""
+    # Adjust width for indent
+    effective_width = width - indent
+
+    # Split into paragraphs
+    paragraphs = [p.strip() for p in text.strip().split('\n\n')]
+    wrapped_paragraphs = []
+
+    for paragraph in paragraphs:
+        # Normalize spaces
+        paragraph = ' '.join(paragraph.split())
+
+        # Wrap the paragraph
+        wrapped = textwrap.fill(
+            paragraph,
+            width=effective_width,
+            expand_tabs=True,
+            replace_whitespace=True,
+            break_long_words=False,
+            break_on_hyphens=True,
+            initial_indent=' ' * indent,
+            subsequent_indent=' ' * indent
+        )
+
+        wrapped_paragraphs.append(wrapped)
+
+    return '\n\n'.join(wrapped_paragraphs)
+
+
+@dataclass
+class TerminalGeometry:
+    """One remote player's window size, kept up to date by their front end."""
+    width: int = 80
+    height: int = 24
+
+
+# Per-session display state, for front ends serving several players from one
+# process (see telnet.py). Unset in the ordinary terminal game.
+_session_geometry: ContextVar[Optional[TerminalGeometry]] = ContextVar("terminal_geometry", default=None)
+_session_stdout: ContextVar[Optional[Any]] = ContextVar("session_stdout", default=None)
+
+
+class SessionStdout(io.TextIOBase):
+    """Stand-in for sys.stdout that sends each session's output to its own stream.
+
+    Installed once by a front end; a thread or task that has no session
+    stream writes to the fallback (the real stdout).
+    """
+
+    def __init__(self, fallback: Any):
+        self.fallback = fallback
+
+    def target(self) -> Any:
+        return _session_stdout.get() or self.fallback
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        return self.target().write(text)
+
+    def flush(self) -> None:
+        self.target().flush()
+
+
+def current_stdout() -> Any:
+    """The stream print() reaches from here: this session's, or sys.stdout."""
+    stdout = sys.stdout
+    return stdout.target() if isinstance(stdout, SessionStdout) else stdout
+
+
+@contextmanager
+def redirect_output(stream: Any) -> Iterator[Any]:
+    """Like contextlib.redirect_stdout, but for this session alone when
+    sessions share the process through SessionStdout."""
+    if not isinstance(sys.stdout, SessionStdout):
+        with redirect_stdout(stream):
+            yield stream
+        return
+    token = _session_stdout.set(stream)
+    try:
+        yield stream
+    finally:
+        _session_stdout.reset(token)
+
+
 class DisplayManager:
     """Handles all display-related functionality in a centralized way."""
     
@@ -20,50 +114,80 @@ class DisplayManager:
     MAX_TERMINAL_WIDTH = 120
     DEFAULT_TERMINAL_WIDTH = 80
     DEFAULT_TERMINAL_HEIGHT = 24
+
+    # Terminal size as of the last resize, once watch_terminal_resize() is on
+    _cached_size: Optional[Tuple[int, int]] = None
+    _watching_resize = False
     
     @staticmethod
     def get_terminal_size() -> tuple[int, int]:
-        """Get current terminal size with fallback values."""
+        """Get current terminal size with fallback values.
+
+        While resizes are being watched the size is only queried again after
+        the terminal reports a change; otherwise every call asks the terminal.
+        A network session's own window size, set with use_geometry(), wins.
+        """
+        geometry = _session_geometry.get()
+        if geometry is not None:
+            width = max(DisplayManager.MIN_TERMINAL_WIDTH,
+                        min(geometry.width, DisplayManager.MAX_TERMINAL_WIDTH))
+            return width, geometry.height
+        if DisplayManager._cached_size is not None:
+            return DisplayManager._cached_size
         try:
             width, height = shutil.get_terminal_size()
             width = max(DisplayManager.MIN_TERMINAL_WIDTH, 
                        min(width, DisplayManager.MAX_TERMINAL_WIDTH))
-            return width, height
+            size = (width, height)
         except Exception:
-            return DisplayManager.DEFAULT_TERMINAL_WIDTH, DisplayManager.DEFAULT_TERMINAL_HEIGHT
-    
+            size = (DisplayManager.DEFAULT_TERMINAL_WIDTH, DisplayManager.DEFAULT_TERMINAL_HEIGHT)
+        if DisplayManager._watching_resize:
+            DisplayManager._cached_size = size
+        return size
+
+    @staticmethod
+    def use_geometry(geometry: Optional[TerminalGeometry]) -> None:
+        """Wrap this session's text to geometry instead of the process's terminal."""
+        _session_geometry.set(geometry)
+
+    @staticmethod
+    def watch_terminal_resize() -> bool:
+        """Cache the terminal size until SIGWINCH says it changed.
+
+        Returns False where there is no SIGWINCH (Windows) or when not called
+        from the main thread; the size is then queried on every print as before.
+        """
+        if DisplayManager._watching_resize:
+            return True
+        if not hasattr(signal, "SIGWINCH"):
+            return False
+        try:
+            previous = signal.getsignal(signal.SIGWINCH)
+
+            def on_resize(signum, frame):
+                DisplayManager.invalidate_layout()
+                if callable(previous):
+                    previous(signum, frame)
+
+            signal.signal(signal.SIGWINCH, on_resize)
+        except (ValueError, OSError) as e:
+            logger.warning(f"Cannot watch terminal resizes: {e}")
+            return False
+        DisplayManager._watching_resize = True
+        return True
+
+    @staticmethod
+    def invalidate_layout() -> None:
+        """Forget the cached terminal size and every wrapped text."""
+        DisplayManager._cached_size = None
+        _wrap_paragraphs.cache_clear()
+
     @staticmethod
     def wrap_text(text: str, width: Optional[int] = None, indent: int = 0) -> str:
         """Wrap text to fit terminal width with proper indentation."""
         if width is None:
             width, _ = DisplayManager.get_terminal_size()
-        
-        # Adjust width for indent
-        effective_width = width - indent
-        
-        # Split into paragraphs
-        paragraphs = [p.strip() for p in text.strip().split('\n\n')]
-        wrapped_paragraphs = []
-        
-        for paragraph in paragraphs:
-            # Normalize spaces
-            paragraph = ' '.join(paragraph.split())
-            
-            # Wrap the paragraph
-            wrapped = textwrap.fill(
-                paragraph,
-                width=effective_width,
-                expand_tabs=True,
-                replace_whitespace=True,
-                break_long_words=False,
-                break_on_hyphens=True,
-                initial_indent=' ' * indent,
-                subsequent_indent=' ' * indent
-            )
-            
-            wrapped_paragraphs.append(wrapped)
-        
-        return '\n\n'.join(wrapped_paragraphs)
+        return _wrap_paragraphs(str(text), width, indent)
     
     @staticmethod
     def print_text(text: str, delay: Optional[float] = None, 
@@ -73,21 +197,19 @@ class DisplayManager:
         
         Args:
             text: Text to display
-            delay: Delay between characters for slow printing
+            delay: Delay between characters for slow printing; any key skips ahead
             indent: Number of spaces to indent text
             wrap: Whether to wrap text to terminal width
         """
         try:
+            events.narrate(text)
+
             # Prepare the text
             display_text = DisplayManager.wrap_text(text, indent=indent) if wrap else text
             
             # Print with or without delay
             if delay:
-                for char in display_text:
-                    sys.stdout.write(char)
-                    sys.stdout.flush()
-                    time.sleep(delay)
-                print()  # Add final newline
+                Typewriter(display_text + "\n", delay).play()
             else:
                 print(display_text)
                 
@@ -106,8 +228,8 @@ class DisplayManager:
                 print("\n" * 100)
                 return
             
-            # Use appropriate clear command based on OS
-            os.system('cls' if os.name == 'nt' else 'clear')
+            if not terminal.clear_screen():
+                print("\n" * 100)
         except Exception as e:
             logging.error(f"Error clearing screen: {e}")
             print("\n" * 100)  # Fallback
@@ -145,6 +267,55 @@ def print_text(text: str, delay: Optional[float] = None,
     """Print text using DisplayManager."""
     DisplayManager.print_text(text, delay, indent, wrap)
 
+class BatchedOutput(io.TextIOBase):
+    """Collect printed output and send it to the real stream in one write.
+
+    One buffer serves a whole session: ``collecting()`` redirects stdout into
+    it for a turn and writes the turn out once at the end. ``flush()`` - which
+    ``input()`` also calls right after showing its prompt - writes out
+    whatever has built up, so a prompt is never left sitting in the buffer.
+    """
+
+    def __init__(self, target: Optional[Any] = None):
+        self._target = target
+        self._chunks: List[str] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._chunks.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        target = self._target if self._target is not None else current_stdout()
+        if target is self:
+            return
+        if self._chunks:
+            target.write("".join(self._chunks))
+            self._chunks.clear()
+        target.flush()
+
+    @contextmanager
+    def collecting(self) -> Iterator["BatchedOutput"]:
+        """Redirect stdout into this buffer, writing it out once on exit.
+
+        Nested use - a command inside a batched line - keeps collecting into
+        the same buffer, and the outermost block does the write.
+        """
+        if current_stdout() is self:
+            yield self
+            return
+        target = self._target
+        if target is None:
+            self._target = current_stdout()
+        try:
+            with redirect_output(self):
+                yield self
+        finally:
+            self.flush()
+            self._target = target
+
 @dataclass
 class SaveGameData:
     """Data structure for saved game state"""
@@ -161,10 +332,20 @@ class SaveGameData:
 
 class SaveLoadManager:
     def __init__(self, save_dir: str):
-        self.save_dir = Path(save_dir)
-        self.save_dir.mkdir(exist_ok=True)
+        self.save_dir = Path(save_dir)  # created on the first save
         self.logger = logging.getLogger(__name__)
 
+    @staticmethod
+    def valid_name(save_name: str) -> bool:
+        """A save name is a plain file name: no path separators, no '..' and
+        no drive (a Windows 'C:' would leave the save directory too)."""
+        return bool(save_name) and not any(part in save_name for part in ("/", "\\", "..", ":", "\0"))
+
+    def _save_path(self, save_name: str) -> Path:
+        if not self.valid_name(save_name):
+            raise ValueError(f"Invalid save name: {save_name!r}")
+        return self.save_dir / f"{save_name}.json"
+
     def save_game(self, game_instance: Any, save_name: Optional[str] = None) -> bool:
         """Save the current game state to a file."""
         try:
@@ -182,8 +363,9 @@ class SaveLoadManager:
                 'puzzle_state': game_instance.puzzle_manager.get_state()
             }
             
-            file_path = self.save_dir / f"{save_name}.json"
-            
+            file_path = self._save_path(save_name)
+            self.save_dir.mkdir(parents=True, exist_ok=True)
+
             with open(file_path, 'w') as f:
                 json.dump(save_data, f, indent=2)
             
@@ -197,7 +379,7 @@ class SaveLoadManager:
     def load_game(self, game_instance: Any, save_name: str) -> bool:
         """Load a saved game state."""
         try:
-            file_path = self.save_dir / f"{save_name}.json"
+            file_path = self._save_path(save_name)
             if not file_path.exists():
                 print(f"\nSave file not found: {save_name}")
                 return False
@@ -251,7 +433,7 @@ class SaveLoadManager:
     def delete_save(self, save_name: str) -> bool:
         """Delete a save file."""
         try:
-            file_path = self.save_dir / f"{save_name}.json"
+            file_path = self._save_path(save_name)
             if file_path.exists():
                 file_path.unlink()
                 self.logger.info(f"Deleted save file: {file_path}")
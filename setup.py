@@ -25,6 +25,7 @@ setup(
     python_requires=">=3.8",
     install_requires=[],
     extras_require={
+        "radio": ["numpy>=1.21"],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
@@ -0,0 +1,83 @@
+"""Tests for the cipher-wheel and Morse codecs."""
+
+import random
+
+import pytest
+
+from emerald_shadows.puzzles.codec import (
+    CipherWheel, MorseDecoder, caesar, decode_morse, encode_morse, intercept, looks_like_morse, wheel,
+)
+from emerald_shadows.puzzles.morse_puzzle import MorsePuzzle
+from emerald_shadows.puzzles.radio_puzzle import RadioPuzzle
+
+
+def test_cipher_wheel_matches_textbook_vigenere():
+    assert CipherWheel("LEMON").encode("ATTACKATDAWN") == "LXFOPVEFRNHR"
+    assert CipherWheel("lemon").decode("LXFOPVEFRNHR") == "ATTACKATDAWN"
+
+
+def test_cipher_wheel_keeps_case_and_skips_non_letters():
+    cipher = wheel("ANGELS")
+    text = "Attack at dawn, pier 7! Ünload."
+    encoded = cipher.encode(text)
+    assert encoded[6:8] == " a"
+    assert encoded.count(",") == 1 and "7! Ü" in encoded
+    assert cipher.decode(encoded) == text
+
+
+def test_caesar_turns_both_ways():
+    assert caesar("Hal", 1) == "Ibm"
+    assert caesar(caesar("Diamond", 5), -5) == "Diamond"
+
+
+def test_cipher_wheel_needs_a_key():
+    with pytest.raises(ValueError):
+        CipherWheel("22")
+
+
+def test_morse_round_trip():
+    signal = encode_morse("Warehouse 22")
+    assert signal == ".-- .- .-. . .... --- ..- ... . / ..--- ..---"
+    assert decode_morse(signal) == "WAREHOUSE 22"
+    assert decode_morse("... ---   ...") == "SO S"
+
+
+def test_decoder_streams_letters_as_gaps_arrive():
+    decoder = MorseDecoder()
+    assert decoder.feed(".-") == ""
+    assert decoder.keying == "A"
+    assert decoder.feed("- ") == "W"
+    assert decoder.feed("..--") == ""
+    assert decoder.keying == ""  # part-way down a branch
+    assert decoder.feed("- /") == "2 "
+    assert decoder.feed(" -") == ""
+    assert decoder.finish() == "T"
+
+
+def test_unknown_codes_decode_as_question_marks():
+    assert decode_morse("........ .-") == "?A"
+
+
+def test_typed_morse_is_recognised():
+    assert looks_like_morse(".-- / ..--- ..---")
+    assert looks_like_morse("·−− •−")
+    assert not looks_like_morse("W-22")
+    assert not looks_like_morse("   ")
+
+
+def test_morse_puzzle_accepts_dots_and_dashes():
+    assert MorsePuzzle().attempt(encode_morse("W 22"))[0]
+    assert not MorsePuzzle().attempt(encode_morse("W 23"))[0]
+
+
+def test_intercepts_decipher_with_the_key():
+    transmission = intercept("LANTERN", 61, random.Random(4))
+    assert "WAREHOUSE SIX ONE" in transmission.plain
+    assert all(len(group) <= 5 for group in transmission.groups.split())
+    assert wheel("LANTERN").decode(transmission.groups).replace(" ", "") == transmission.plain.replace(" ", "")
+    assert decode_morse(transmission.morse) == transmission.groups
+
+
+def test_radio_puzzle_reads_out_a_fresh_intercept():
+    solved, message = RadioPuzzle().attempt("415.6")
+    assert solved and "letter groups" in message
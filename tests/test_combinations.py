@@ -0,0 +1,86 @@
+"""Tests for N-ary item combinations and combination discovery."""
+
+import pytest
+
+from emerald_shadows.config import INITIAL_GAME_STATE
+from emerald_shadows.config_items import ITEM_COMBINATIONS
+from emerald_shadows.game_manager import GameManager
+from emerald_shadows.item_manager import ItemManager
+from emerald_shadows.rules import combination_rules, compile_rules
+
+TRIPLE = {
+    frozenset(["manifest", "meeting_minutes", "photo"]): {
+        "description": "Three pieces of paper, one story.",
+        "result": "built_the_case",
+        "removes_items": False,
+    },
+    frozenset(["badge", "photo"]): {
+        "description": "That's Voss.",
+        "result": "identified_suspect",
+        "removes_items": False,
+    },
+}
+
+
+@pytest.fixture
+def game_state():
+    state = INITIAL_GAME_STATE.copy()
+    state["built_the_case"] = False
+    return state
+
+
+@pytest.fixture
+def manager():
+    return ItemManager(rules=compile_rules(combination_rules(TRIPLE)))
+
+
+def test_index_maps_each_component(manager):
+    index = manager.rules.combinations
+    assert len(index["photo"]) == 2
+    assert len(index["manifest"]) == 1
+
+
+def test_each_rulebook_indexes_its_own_combinations(manager):
+    default = ItemManager().rules.combinations
+    assert {combo for combos in default.values() for combo in combos} == set(ITEM_COMBINATIONS)
+    manager.inventory.extend(["cipher_wheel", "notebook"])
+    assert manager.find_combinations() == []
+
+
+def test_three_item_combination(manager, game_state):
+    manager.inventory.extend(["manifest", "meeting_minutes", "photo"])
+    assert manager.combine_set(["photo", "manifest", "meeting_minutes"], game_state) is True
+    assert game_state["built_the_case"] is True
+
+
+def test_partial_set_does_not_combine(manager, game_state, capsys):
+    manager.inventory.extend(["manifest", "meeting_minutes", "photo"])
+    assert manager.combine_set(["manifest", "photo"], game_state) is False
+    assert "can't be combined" in capsys.readouterr().out
+
+
+def test_find_combinations_only_lists_complete_sets(manager):
+    manager.inventory.extend(["badge", "photo", "manifest"])
+    assert manager.find_combinations() == [frozenset(["badge", "photo"])]
+
+
+def test_combine_all_discovers_everything_once(manager, game_state):
+    manager.inventory.extend(["badge", "photo", "manifest", "meeting_minutes"])
+    assert manager.combine_all(game_state) == 2
+    assert manager.combine_all(game_state) == 0
+    assert game_state["identified_suspect"] and game_state["built_the_case"]
+
+
+def test_parse_combine_args_many_items():
+    gm = GameManager()
+    assert gm._parse_combine_args("photo, manifest and meeting minutes") == (
+        "photo", "manifest", "meeting minutes"
+    )
+
+
+def test_what_goes_together_runs_combine_all(monkeypatch):
+    gm = GameManager()
+    called = {}
+    monkeypatch.setattr(gm.item_manager, "combine_all", lambda state: called.setdefault("all", True))
+    gm.process_command("what goes together?")
+    assert called == {"all": True}
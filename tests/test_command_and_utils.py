@@ -1,6 +1,6 @@
 import pytest
 
-from emerald_shadows.commands.natural_commands import NaturalCommandHandler
+from emerald_shadows.commands.natural_commands import NaturalCommandHandler, compile_grammar
 from emerald_shadows.input_validator import InputValidator
 from emerald_shadows.utils import DisplayManager
 
@@ -118,6 +118,50 @@ class TestNaturalCommandHandler:
         assert command == "drop"
         assert argument == "notebook"
 
+    # ------------------------------------------------------------------
+    # prepositions
+    # ------------------------------------------------------------------
+
+    def test_use_on_target(self):
+        parsed = self.handler.parse("use the badge on the bartender")
+        assert parsed == ("use", "badge", "on", "bartender")
+        assert self.handler.understand_command("use badge on bartender") == ("use", "badge")
+
+    def test_put_in_becomes_combine(self):
+        command, argument = self.handler.understand_command("put photo in notebook")
+        assert command == "combine"
+        assert argument == "photo with notebook"
+
+    def test_put_down(self):
+        assert self.handler.understand_command("put down the badge") == ("drop", "badge")
+
+    def test_trailing_preposition_is_part_of_the_object(self):
+        assert self.handler.understand_command("use flashlight on") == ("use", "flashlight on")
+
+    def test_conflicting_grammar_is_rejected(self):
+        with pytest.raises(ValueError):
+            compile_grammar({"take": {"verbs": ["get"]}, "go": {"verbs": ["get"]}})
+
+    # ------------------------------------------------------------------
+    # parse cache
+    # ------------------------------------------------------------------
+
+    def test_repeated_input_hits_the_parse_cache(self):
+        self.handler.clear_parse_cache()
+        for _ in range(4):
+            assert self.handler.understand_command("Take Badge ") == ("take", "badge")
+        stats = self.handler.parse_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 3
+        assert stats["hit_rate"] == 0.75
+
+    def test_handlers_share_one_parse_cache(self):
+        self.handler.clear_parse_cache()
+        assert self.handler.understand_command("read the manifest") == ("examine", "manifest")
+        assert NaturalCommandHandler().understand_command("read the manifest") == ("examine", "manifest")
+        stats = self.handler.parse_cache_stats()
+        assert (stats["misses"], stats["hits"]) == (1, 1)
+
 
 class TestInputValidator:
     def test_validate_puzzle_input_accepts_alpha(self):
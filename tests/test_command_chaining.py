@@ -0,0 +1,89 @@
+"""Tests for several commands chained on one line of input."""
+
+import logging
+
+import pytest
+
+from emerald_shadows.commands.natural_commands import NaturalCommandHandler
+from emerald_shadows.game_manager import GameManager
+from emerald_shadows.utils import BatchedOutput
+
+
+@pytest.fixture()
+def game_manager():
+    return GameManager()
+
+
+@pytest.fixture()
+def writes(monkeypatch):
+    """Chunks in each write of a turn's batched output."""
+    writes = []
+    real_flush = BatchedOutput.flush
+
+    def counting_flush(self):
+        if self._chunks:
+            writes.append(len(self._chunks))
+        real_flush(self)
+
+    monkeypatch.setattr(BatchedOutput, "flush", counting_flush)
+    # Live log output suspends pytest's capture, which would undo the redirect
+    monkeypatch.setattr(logging, "info", lambda *args, **kwargs: None)
+    return writes
+
+
+def test_split_commands():
+    handler = NaturalCommandHandler()
+    assert handler.split_commands("take all. go upstairs; take photo then examine photo") == [
+        "take all", "go upstairs", "take photo", "examine photo"
+    ]
+    assert handler.split_commands("look and then exits.") == ["look", "exits"]
+    assert handler.split_commands("combine badge and photo") == ["combine badge and photo"]
+    assert handler.split_commands("tune 415.6") == ["tune 415.6"]
+    assert handler.split_commands("scan 415.0-416.0. look;tune 415.6") == ["scan 415.0-416.0", "look", "tune 415.6"]
+
+
+def test_chain_runs_each_command_in_order(game_manager):
+    assert game_manager.play_line("go upstairs; go downstairs; go upstairs") is True
+    assert game_manager.location_manager.current_location == "evidence_room"
+
+
+def test_chain_stops_at_first_failure(game_manager):
+    game_manager.play_line("go sideways; go upstairs")
+    assert game_manager.location_manager.current_location == "police_station"
+
+
+def test_chain_stops_at_a_blocked_bare_exit(game_manager, capsys):
+    game_manager.location_manager.current_location = "docks"
+    game_manager.play_line("underground; exits")
+    assert game_manager.last_command_failed
+    assert game_manager.location_manager.current_location == "docks"
+    assert "skipped: exits" in capsys.readouterr().out
+
+
+def test_chain_output_is_written_once(game_manager, writes, capsys):
+    game_manager.play_line("look. exits. score")
+    out = capsys.readouterr().out
+    assert "Ways out" in out and "Case progress" in out
+    assert len(writes) == 1 and writes[0] > 1
+
+
+def test_single_command_output_is_written_once(game_manager, writes, capsys):
+    game_manager.process_command("take all")
+    out = capsys.readouterr().out
+    assert "badge" in out
+    assert len(writes) == 1 and writes[0] > 1
+
+
+def test_chain_runs_end_of_turn_checks(monkeypatch, game_manager):
+    checks = []
+    monkeypatch.setattr(game_manager, "_check_darkness", lambda: checks.append("dark") or False)
+    monkeypatch.setattr(game_manager, "check_game_progress", lambda: checks.append("win") or False)
+    game_manager.play_line("look; look")
+    assert checks == ["dark", "win", "dark", "win"]
+
+
+def test_chain_ends_when_game_ends(monkeypatch, game_manager):
+    monkeypatch.setattr(game_manager, "check_game_progress", lambda: True)
+    monkeypatch.setattr(game_manager, "show_victory", lambda: None)
+    assert game_manager.play_line("look; go upstairs") is False
+    assert game_manager.location_manager.current_location == "police_station"
@@ -0,0 +1,93 @@
+"""Tests for prompt tab completion."""
+
+import time
+
+import pytest
+
+from emerald_shadows.commands.completion import PrefixTrie, TabCompleter
+from emerald_shadows.game_manager import GameManager
+
+
+@pytest.fixture
+def completer():
+    return TabCompleter(GameManager())
+
+
+# --- trie ---
+
+def test_trie_add_complete_discard():
+    trie = PrefixTrie(["take", "talk", "tavern", "use"])
+    assert trie.complete("ta") == ["take", "talk", "tavern"]
+    trie.discard("talk")
+    trie.discard("missing")
+    assert trie.complete("ta") == ["take", "tavern"]
+    assert "talk" not in trie and len(trie) == 3
+    assert trie.complete("x") == []
+
+
+def test_trie_completion_is_fast_on_large_vocabularies():
+    trie = PrefixTrie(f"room_{i}_exit" for i in range(100_000))
+    start = time.perf_counter()
+    for _ in range(1000):
+        matches = trie.complete("room_4242")
+    elapsed = (time.perf_counter() - start) / 1000
+    assert len(matches) == 11
+    assert elapsed < 0.001
+
+
+# --- completer ---
+
+def test_completes_verbs_and_exits(completer):
+    assert "take" in completer.candidates("ta")
+    assert completer.candidates("upst") == ["upstairs"]
+
+
+def test_completes_items_in_scope(completer):
+    game = completer.game
+    game.location_manager.move_to_location("upstairs", game.game_state)
+    assert completer.candidates("take ci") == ["take cipher wheel", "take cipher_wheel"]
+    assert completer.candidates("take the ph") == ["take the photo"]
+
+
+def test_scope_follows_inventory_and_location(completer):
+    game = completer.game
+    game.location_manager.move_to_location("upstairs", game.game_state)
+    game.process_command("take photo")
+    assert completer.candidates("drop ph") == ["drop photo"]
+    game.process_command("downstairs")
+    assert completer.candidates("examine ph") == ["examine photo"]
+    assert completer.candidates("take ci") == []
+
+
+def test_scope_is_only_rebuilt_on_change(completer, monkeypatch):
+    completer.candidates("take ")
+    location_manager = completer.game.location_manager
+    calls = []
+    real_exits = location_manager.get_valid_exits
+    monkeypatch.setattr(location_manager, "get_valid_exits", lambda: calls.append(1) or real_exits())
+    for _ in range(5):
+        completer.candidates("take b")
+    assert calls == []
+    completer.game.process_command("upstairs")
+    completer.candidates("take b")
+    assert calls == [1]
+
+
+def test_completes_last_combined_and_chained_item(completer):
+    game = completer.game
+    game.location_manager.move_to_location("upstairs", game.game_state)
+    game.process_command("take all")
+    assert completer.candidates("combine photo with ra") == [
+        "combine photo with radio manual", "combine photo with radio_manual"
+    ]
+    assert completer.candidates("look; exam") == ["look; examine"]
+
+
+def test_a_decimal_point_does_not_start_a_new_command(completer):
+    assert completer.candidates("tune 415.6; exam") == ["tune 415.6; examine"]
+    assert completer.candidates("tune 415.exam") == []
+
+
+def test_readline_protocol(completer):
+    assert completer.complete("upst", 0) == "upstairs"
+    assert completer.complete("upst", 1) is None
@@ -0,0 +1,139 @@
+"""Tests for versioned world content and hot reload."""
+
+import gc
+from copy import deepcopy
+
+import pytest
+
+import emerald_shadows.game_manager as game_manager_module
+from emerald_shadows.config_items import ITEM_DESCRIPTIONS
+from emerald_shadows.config_locations import LOCATIONS
+from emerald_shadows.content import (
+    ContentError,
+    ContentStore,
+    ContentWatcher,
+    build_content,
+    read_source_literal,
+)
+from emerald_shadows.game_manager import GameManager
+from emerald_shadows.location_manager import LocationManager
+
+
+@pytest.fixture
+def store():
+    return ContentStore(build_content(LOCATIONS, ITEM_DESCRIPTIONS))
+
+
+def _edited_locations(description):
+    locations = deepcopy(LOCATIONS)
+    locations["police_station"]["description"] = description
+    return locations
+
+
+# --- building and validation ---
+
+def test_built_content_is_read_only():
+    content = build_content(LOCATIONS, ITEM_DESCRIPTIONS)
+    with pytest.raises(TypeError):
+        content.locations["police_station"]["description"] = "changed"
+    assert isinstance(content.locations["police_station"]["items"], tuple)
+
+
+def test_validation_rejects_dangling_exit():
+    locations = deepcopy(LOCATIONS)
+    locations["street"]["exits"]["north"] = "nowhere"
+    with pytest.raises(ContentError):
+        build_content(locations, ITEM_DESCRIPTIONS)
+
+
+def test_validation_rejects_item_without_text():
+    items = deepcopy(ITEM_DESCRIPTIONS)
+    del items["badge"]["detailed"]
+    with pytest.raises(ContentError):
+        build_content(LOCATIONS, items)
+
+
+def test_source_literal_matches_module_data():
+    from emerald_shadows.content import CONTENT_SOURCES
+    path, name = CONTENT_SOURCES[0]
+    assert read_source_literal(path, name) == LOCATIONS
+
+
+# --- publishing ---
+
+def test_publish_bumps_generation(store):
+    before = store.current.generation
+    content = store.publish(_edited_locations("A new bullpen."), ITEM_DESCRIPTIONS)
+    assert content.generation == before + 1
+    assert store.current is content
+
+
+def test_rejected_publish_keeps_current(store):
+    current = store.current
+    locations = deepcopy(LOCATIONS)
+    locations["police_station"]["description"] = ""
+    with pytest.raises(ContentError):
+        store.publish(locations, ITEM_DESCRIPTIONS)
+    assert store.current is current
+
+
+def test_location_manager_keeps_session_state_on_apply(store):
+    manager = LocationManager(store.current)
+    manager.remove_item("badge")
+    manager.current_location = "street"
+
+    manager.apply_content(store.publish(_edited_locations("A new bullpen."), ITEM_DESCRIPTIONS))
+
+    assert manager.locations["police_station"].description == "A new bullpen."
+    assert "badge" not in manager.locations["police_station"].items
+    assert manager.current_location == "street"
+
+
+def test_old_generation_freed_when_no_session_holds_it(store):
+    manager = LocationManager(store.current)
+    first = store.current.generation
+    store.publish(_edited_locations("A new bullpen."), ITEM_DESCRIPTIONS)
+    assert first in store.live_generations()
+
+    manager.apply_content(store.current)
+    gc.collect()
+    assert first not in store.live_generations()
+
+
+# --- sessions ---
+
+def test_session_picks_up_new_text_on_next_turn(monkeypatch, store):
+    monkeypatch.setattr(game_manager_module, "CONTENT_STORE", store)
+    game = GameManager()
+    store.publish(_edited_locations("The bullpen, freshly proofread."), ITEM_DESCRIPTIONS)
+
+    messages = []
+    monkeypatch.setattr(game_manager_module, "print_text", lambda text, **_: messages.append(text))
+    game.process_command("look")
+
+    assert game.content is store.current
+    assert any("freshly proofread" in message for message in messages)
+
+
+# --- watcher ---
+
+def test_watcher_reloads_changed_source(tmp_path, store):
+    source = tmp_path / "config_locations.py"
+    source.write_text(f"LOCATIONS = {LOCATIONS!r}\n", encoding="utf-8")
+    watcher = ContentWatcher(store, sources=[(source, "LOCATIONS")], interval=60)
+
+    assert watcher.check() is False
+    source.write_text(f"LOCATIONS = {_edited_locations('Reloaded.')!r}\n", encoding="utf-8")
+    watcher._mtimes = {}
+    assert watcher.check() is True
+    assert store.current.locations["police_station"]["description"] == "Reloaded."
+
+
+def test_watcher_ignores_broken_source(tmp_path, store):
+    source = tmp_path / "config_locations.py"
+    source.write_text("LOCATIONS = {'unterminated': \n", encoding="utf-8")
+    watcher = ContentWatcher(store, sources=[(source, "LOCATIONS")], interval=60)
+    watcher._mtimes = {}
+    current = store.current
+    assert watcher.check() is False
+    assert store.current is current
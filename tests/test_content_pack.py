@@ -0,0 +1,139 @@
+"""Tests for streaming JSON-lines content packs."""
+
+import json
+import tracemalloc
+
+import pytest
+
+from emerald_shadows.config_items import ITEM_DESCRIPTIONS
+from emerald_shadows.config_locations import LOCATIONS
+from emerald_shadows.content import ContentError, ContentStore, LazyText, build_content
+from emerald_shadows.content_pack import PackWatcher, _read_record, load_pack, write_pack
+from emerald_shadows.item_manager import ItemManager
+from emerald_shadows.location_manager import LocationManager
+from emerald_shadows.tools.worldgen import START_ROOM, generate_items, iter_world
+
+
+@pytest.fixture
+def game_pack(tmp_path):
+    path = tmp_path / "seattle.jsonl"
+    write_pack(path, LOCATIONS.items(), ITEM_DESCRIPTIONS.items(), start="police_station")
+    return path
+
+
+def _region(name, _data):
+    return "east" if int(name.split("_")[1]) % 20 >= 10 else "west"
+
+
+@pytest.fixture
+def regional_pack(tmp_path):
+    path = tmp_path / "city.jsonl"
+    write_pack(path, iter_world(400), generate_items(400).items(), start=START_ROOM, region_of=_region)
+    return path
+
+
+# --- loading ---
+
+def test_pack_round_trips_the_built_in_world(game_pack):
+    manager = LocationManager(pack=game_pack)
+    assert manager.current_location == "police_station"
+    assert set(manager.locations) == set(LOCATIONS)
+    assert manager.move_to_location("upstairs", {}) is True
+
+
+def test_long_text_is_lazy_and_resolves(game_pack):
+    manager = LocationManager(pack=game_pack)
+    description = manager.locations["police_station"].description
+    assert isinstance(description, LazyText)
+    assert str(description) == LOCATIONS["police_station"]["description"]
+    assert "bullpen" in manager.get_location_description()
+
+
+def test_lazy_item_text_prints(game_pack, capsys):
+    items = ItemManager(LocationManager(pack=game_pack).content)
+    items.inventory.append("manifest")
+    items.examine_item("manifest", [], {})
+    assert "3,200" in capsys.readouterr().out
+
+
+def test_invalid_line_reports_position(tmp_path):
+    path = tmp_path / "broken.jsonl"
+    path.write_text('{"type": "location", "name": "a"\n', encoding="utf-8")
+    with pytest.raises(ContentError, match="broken.jsonl:1"):
+        load_pack(path)
+
+
+def test_full_load_rejects_dangling_exit(tmp_path):
+    path = tmp_path / "dangling.jsonl"
+    record = {"type": "location", "name": "a", "description": "A room.", "exits": {"north": "b"}}
+    path.write_text(json.dumps(record) + "\n", encoding="utf-8")
+    with pytest.raises(ContentError):
+        load_pack(path)
+
+
+# --- regional subsets ---
+
+def test_regional_load_keeps_only_requested_rooms(regional_pack):
+    content = load_pack(regional_pack, regions=["west"])
+    assert content.locations
+    assert all(_region(name, None) == "west" for name in content.locations)
+    assert content.boundary
+    assert not content.boundary & set(content.locations)
+
+
+def test_exit_into_other_region_is_refused(regional_pack, capsys):
+    manager = LocationManager(pack=regional_pack, regions=["west"])
+    manager.current_location = "room_9"
+    assert manager.move_to_location("east", {}) is False
+    assert "out of reach" in capsys.readouterr().out
+    assert manager.current_location == "room_9"
+
+
+# --- memory ---
+
+def test_load_memory_is_bounded_by_references_not_prose(tmp_path):
+    path = tmp_path / "wordy.jsonl"
+    prose = "The rain keeps coming. " * 200
+
+    def rooms():
+        for name, data in iter_world(1000):
+            yield name, {**data, "description": prose}
+
+    write_pack(path, rooms(), start=START_ROOM)
+    tracemalloc.start()
+    content = load_pack(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(content.locations) == 1000
+    assert peak < path.stat().st_size / 2
+
+
+# --- hot reload ---
+
+def test_watcher_reloads_the_installed_pack(game_pack):
+    store = ContentStore(build_content(LOCATIONS, ITEM_DESCRIPTIONS))
+    store.install(load_pack(game_pack, snapshot=True))
+    watcher = PackWatcher(store, game_pack, interval=60)
+    assert str(store.current.locations["police_station"]["description"]) == LOCATIONS["police_station"]["description"]
+
+    edited = {name: dict(data) for name, data in LOCATIONS.items()}
+    edited["police_station"]["description"] = "The bullpen, repainted. " * 10
+    write_pack(game_pack, edited.items(), ITEM_DESCRIPTIONS.items(), start="police_station")
+    watcher._mtimes = {}
+    assert watcher.check() is True
+    assert str(store.current.locations["police_station"]["description"]).startswith("The bullpen, repainted.")
+    assert set(store.current.locations) == set(LOCATIONS)
+
+
+def test_rejected_rewrite_leaves_served_text_intact(game_pack):
+    store = ContentStore(build_content(LOCATIONS, ITEM_DESCRIPTIONS))
+    served = store.install(load_pack(game_pack, snapshot=True))
+    watcher = PackWatcher(store, game_pack, interval=60)
+    game_pack.write_text('{"type": "location", "name": "police_station"}\n' * 50, encoding="utf-8")
+    watcher._mtimes = {}
+    assert watcher.check() is False
+    assert store.current is served
+    _read_record.cache_clear()
+    description = served.locations["police_station"]["description"]
+    assert str(description) == LOCATIONS["police_station"]["description"]
@@ -0,0 +1,94 @@
+"""Tests for the structured JSON-lines event stream."""
+
+import asyncio
+import io
+import json
+
+import pytest
+
+from emerald_shadows import events, media
+from emerald_shadows.game_manager import GameManager
+
+
+@pytest.fixture()
+def stream():
+    buffer = io.StringIO()
+    token = events.set_stream(events.EventStream(buffer))
+    yield buffer
+    events.reset_stream(token)
+
+
+def read_events(buffer):
+    return [json.loads(line) for line in buffer.getvalue().splitlines()]
+
+
+def test_no_stream_is_a_no_op(capsys):
+    assert events.active() is None
+    events.emit("score", score=1, delta=1)
+    events.narrate("Nothing listens.")
+    assert capsys.readouterr().out == ""
+
+
+def test_spans_mark_items_and_exits():
+    stream = events.EventStream(io.StringIO())
+    stream.set_scope(items=["radio_manual", "radio"], exits=["upstairs"])
+    text = "The Radio Manual lies by the radio. Stairs lead upstairs."
+    spans = stream.spans(text)
+    assert [(text[s["start"]:s["end"]], s["kind"], s["name"]) for s in spans] == [
+        ("Radio Manual", "item", "radio_manual"),
+        ("radio", "item", "radio"),
+        ("upstairs", "exit", "upstairs"),
+    ]
+
+
+def test_printed_text_becomes_narration(stream):
+    game = GameManager()
+    game.play_turn("take badge")
+    narration = [e for e in read_events(stream) if e["type"] == "narration"]
+    assert narration[0]["text"].startswith("You clip the badge")
+    assert narration[0]["spans"][0]["name"] == "badge"
+
+
+def test_location_is_described_once(stream):
+    game = GameManager()
+    game.play_turn("go upstairs")
+    game.show_location_if_changed()
+    emitted = read_events(stream)
+    types = [e["type"] for e in emitted]
+    assert types.count("location") == 1
+    assert {"type": "exits", "exits": ["downstairs"]} in emitted
+    assert {"type": "items", "items": ["cipher_wheel", "radio_manual", "photo"]} in emitted
+    location = next(e for e in emitted if e["type"] == "location")
+    assert not any(
+        e["type"] == "narration" and location["text"] in e["text"] for e in emitted
+    )
+
+
+def test_score_change_is_reported(stream):
+    game = GameManager()
+    before = game.game_state["score"]
+    game.play_turn("take badge")
+    game.play_turn("look")
+    scores = [e for e in read_events(stream) if e["type"] == "score"]
+    assert scores == [{"type": "score", "score": before + 10, "delta": 10}]
+
+
+def test_media_moment_is_reported(stream):
+    media.present("grue_death", write=lambda frame: None)
+    assert {"type": "media", "moment": "grue_death"} in read_events(stream)
+
+
+def test_sessions_write_to_their_own_streams():
+    async def session(name):
+        buffer = io.StringIO()
+        events.set_stream(events.EventStream(buffer))
+        await asyncio.sleep(0)
+        events.narrate(f"{name} speaks.")
+        return read_events(buffer)
+
+    async def both():
+        return await asyncio.gather(session("Alice"), session("Bob"))
+
+    alice, bob = asyncio.run(both())
+    assert [e["text"] for e in alice] == ["Alice speaks."]
+    assert [e["text"] for e in bob] == ["Bob speaks."]
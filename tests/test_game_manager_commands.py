@@ -74,7 +74,7 @@ def test_examine_command_routes_to_item_manager(monkeypatch, game_manager):
     monkeypatch.setattr(game_manager.location_manager, "get_available_items", lambda: ["badge"])
     captured = {}
 
-    def fake_examine(item, location_items, state):
+    def fake_examine(item, location_items, state, location=None):
         captured.update(item=item, available=location_items)
 
     monkeypatch.setattr(game_manager.item_manager, "examine_item", fake_examine)
@@ -0,0 +1,75 @@
+"""Tests for the ordered-set Inventory."""
+
+import pytest
+
+from emerald_shadows.config import INITIAL_GAME_STATE
+from emerald_shadows.game_manager import GameManager
+from emerald_shadows.inventory import Inventory, InventoryFullError
+from emerald_shadows.item_manager import ItemManager
+
+
+def test_preserves_pickup_order():
+    inventory = Inventory(["badge", "photo"])
+    inventory.append("notebook")
+    assert list(inventory) == ["badge", "photo", "notebook"]
+
+
+def test_duplicate_append_is_ignored():
+    inventory = Inventory(["badge"])
+    inventory.append("badge")
+    assert len(inventory) == 1
+
+
+def test_remove_missing_item_raises_value_error():
+    with pytest.raises(ValueError):
+        Inventory().remove("badge")
+
+
+def test_discard_missing_item_is_safe():
+    inventory = Inventory(["badge"])
+    inventory.discard("photo")
+    assert inventory == ["badge"]
+
+
+def test_limit_is_enforced():
+    inventory = Inventory(["a", "b"], limit=2)
+    assert inventory.is_full()
+    with pytest.raises(InventoryFullError):
+        inventory.append("c")
+
+
+def test_version_tracks_changes():
+    inventory = Inventory()
+    inventory.append("badge")
+    inventory.append("badge")
+    inventory.remove("badge")
+    assert inventory.version == 2
+
+
+def test_view_is_live_and_read_only():
+    inventory = Inventory(["badge"])
+    view = inventory.view()
+    inventory.append("photo")
+    assert "photo" in view
+    assert view == ["badge", "photo"]
+    assert not hasattr(view, "append")
+
+
+def test_take_item_refuses_when_full(capsys):
+    manager = ItemManager()
+    manager.inventory = Inventory(["a", "b"], limit=2)
+    state = INITIAL_GAME_STATE.copy()
+    assert manager.take_item("badge", ["badge"], state) is False
+    assert "badge" not in manager.get_inventory()
+    assert "full" in capsys.readouterr().out
+
+
+def test_take_all_stops_when_full(monkeypatch):
+    import emerald_shadows.game_manager as game_manager_module
+    gm = GameManager()
+    gm.item_manager.inventory = Inventory(limit=1)
+    messages = []
+    monkeypatch.setattr(game_manager_module, "print_text", lambda t, **_: messages.append(t))
+    gm.process_command("take all")
+    assert list(gm.item_manager.get_inventory()) == ["badge"]
+    assert "case_file" in gm.location_manager.get_available_items()
@@ -140,3 +140,24 @@ def test_state_serializable_to_json(location_manager):
 def test_get_valid_exits(location_manager):
     exits = location_manager.get_valid_exits()
     assert "outside" in exits or "upstairs" in exits  # police_station has both
+
+
+# --- pathfinding ---
+
+def test_find_path_to_adjacent_location(location_manager):
+    assert location_manager.find_path("evidence_room") == ["upstairs"]
+
+
+def test_find_path_to_current_location_is_empty(location_manager):
+    assert location_manager.find_path(STARTING_LOCATION) == []
+
+
+def test_find_path_unknown_destination(location_manager):
+    assert location_manager.find_path("atlantis") is None
+
+
+def test_find_path_respects_requirements(location_manager, game_state):
+    game_state["found_warehouse"] = False
+    assert location_manager.find_path("underground_tunnels", game_state) is None
+    game_state["found_warehouse"] = True
+    assert location_manager.find_path("underground_tunnels", game_state)
@@ -0,0 +1,74 @@
+"""Tests for the command-log mining tool."""
+
+import gzip
+from collections import Counter
+
+import pytest
+
+from emerald_shadows.tools.logmine import (
+    CommandMiner,
+    extract_command,
+    format_report,
+    mine_logs,
+    prune,
+)
+
+LOG = [
+    "2026-01-01 10:00:00 - INFO - root - Command: take badge",
+    "2026-01-01 10:00:01 - INFO - root - Took badge",
+    "2026-01-01 10:00:02 - INFO - root - Command: kick the door",
+    "2026-01-01 10:00:03 - INFO - root - Command: exmaine badge",
+    "2026-01-01 10:00:04 - INFO - root - Command: take hat; kick the door",
+    "2026-01-01 10:00:05 - INFO - root - Command: upstairs",
+]
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "session.log"
+    path.write_text("\n".join(LOG) + "\n", encoding="utf-8")
+    return path
+
+
+def test_extract_command_formats():
+    assert extract_command(LOG[0]) == "take badge"
+    assert extract_command(LOG[1]) is None
+    assert extract_command("> look around") == "look around"
+    assert extract_command("look around", "plain") == "look around"
+    assert extract_command("> look around", "log") is None
+
+
+def test_classification():
+    tables = CommandMiner().mine(["kick the door", "exmaine badge", "take hat", "note_1", "take note"])
+    assert tables["unparsed"] == Counter({"kick the door": 1, "note_1": 1})
+    assert tables["near_miss_verbs"] == Counter({"exmaine -> examine": 1})
+    assert tables["unknown_nouns"] == Counter({"take hat": 1, "take note": 1})
+
+
+def test_ambiguous_noun():
+    tables = CommandMiner().mine(["take note 6"])
+    assert list(tables["ambiguous"]) == ["note 6 -> note_1 | note_2 | note_3 | note_4 | note_5"]
+
+
+def test_mine_logs_in_process(log_file):
+    tables = mine_logs([log_file], processes=1, chunk_lines=2)
+    assert tables["unparsed"]["kick the door"] == 2
+    assert tables["unknown_nouns"]["take hat"] == 1
+    assert "upstairs" not in tables["unparsed"]
+
+
+def test_mine_logs_across_processes_matches(log_file, tmp_path):
+    packed = tmp_path / "session.log.gz"
+    with gzip.open(packed, "wt", encoding="utf-8") as handle:
+        handle.write("\n".join(LOG * 50) + "\n")
+    tables = mine_logs([log_file, packed], processes=2, chunk_lines=7)
+    assert tables["unparsed"]["kick the door"] == 102
+    assert tables["near_miss_verbs"]["exmaine -> examine"] == 51
+    assert "Unparsed inputs (102 total, 1 distinct)" in format_report(tables, top=5)
+
+
+def test_prune_keeps_heaviest_entries():
+    table = Counter({f"cmd{i}": i for i in range(100)})
+    prune(table, limit=10)
+    assert len(table) == 5
+    assert set(table) == {"cmd99", "cmd98", "cmd97", "cmd96", "cmd95"}
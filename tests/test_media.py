@@ -0,0 +1,147 @@
+"""Tests for the media layer's art presentation and animation clocks."""
+
+import io
+import os
+import sys
+
+import pytest
+
+from emerald_shadows import game_art, media, terminal
+from emerald_shadows.game_manager import GameManager
+
+
+@pytest.fixture(autouse=True)
+def restore_clock():
+    previous = media._clock
+    yield
+    media.set_clock(previous)
+
+
+def test_present_is_silent_when_not_a_terminal(capsys):
+    assert media.present("grue_death") is False
+    assert capsys.readouterr().out == ""
+
+
+def test_unknown_moment_shows_nothing():
+    assert media.present("no_such_moment", write=lambda text: None) is False
+
+
+def test_blocking_clock_reveals_line_by_line():
+    pauses, frames = [], []
+    media.set_clock(media.BlockingClock(sleep=pauses.append))
+    assert media.present("grue_death", write=frames.append) is True
+    lines = game_art.GRUE_ART.strip("\n").splitlines()
+    assert len(frames) == len(lines)
+    assert frames[0].startswith(b"\n")
+    assert pauses == [media.ANIMATION_FRAME_SECONDS] * (len(lines) - 1)
+
+
+def test_failing_writer_never_raises():
+    def broken(text):
+        raise OSError("connection reset")
+
+    media.set_clock(media.BlockingClock(sleep=lambda s: None))
+    assert media.present("grue_death", write=broken) is False
+
+
+# --- pre-rendered art ---
+
+def test_art_is_rendered_once_per_profile(monkeypatch):
+    media._rendered.clear()
+    calls = []
+    real_render = media.render_art
+    monkeypatch.setattr(media, "render_art", lambda *a: calls.append(a) or real_render(*a))
+    media.set_clock(media.BlockingClock(sleep=lambda s: None))
+    for _ in range(3):
+        media.present("grue_death", write=lambda data: None)
+        media.present("grue_death", write=lambda data: None, capabilities=media.COLOR)
+    assert len(calls) == 2
+
+
+def test_color_profile_wraps_lines_in_ansi():
+    plain = media.rendered("grue_death", media.PLAIN)
+    color = media.rendered("grue_death", media.COLOR)
+    assert game_art.RESET.encode() not in plain.block
+    assert color.frames[1].startswith(game_art.BRIGHT_GREEN.encode())
+
+
+def test_unencodable_art_falls_back_to_utf8():
+    art = media.rendered("grue_death", media.Capabilities(art=True, color=False, encoding="cp1252"))
+    assert art.block.decode("utf-8").count("░") > 0
+
+
+def test_still_art_is_a_single_write():
+    media.MOMENTS["test_still"] = {"art": "one\ntwo\nthree", "animate": False}
+    try:
+        writes = []
+        assert media.present("test_still", write=writes.append) is True
+        assert writes == [b"\none\ntwo\nthree\n"]
+    finally:
+        del media.MOMENTS["test_still"]
+
+
+def test_capabilities_come_from_the_one_terminal_probe(monkeypatch):
+    calls = []
+    monkeypatch.setattr(terminal, "_info", None)
+    monkeypatch.setattr(terminal, "probe", lambda: calls.append(1) or terminal.TerminalInfo(False))
+    for _ in range(3):
+        media.present("grue_death")
+    assert calls == [1]
+
+
+def test_capabilities_are_kept_until_the_probe_is_reset(monkeypatch):
+    reads = []
+    monkeypatch.setattr(terminal, "_info", terminal.TerminalInfo(True, colors=256))
+    monkeypatch.setattr(terminal, "_derived", {})
+    monkeypatch.setattr(media, "_flag_on", lambda name: reads.append(name) or name in os.environ)
+    monkeypatch.delenv("EMERALD_NO_ART", raising=False)
+    monkeypatch.delenv("NO_COLOR", raising=False)
+    first = media.terminal_capabilities()
+    assert first.art and first.color
+    assert media.terminal_capabilities() is first
+    assert len(reads) == 3
+
+    monkeypatch.setenv("NO_COLOR", "1")
+    assert media.terminal_capabilities() is first
+    terminal.reset()
+    monkeypatch.setattr(terminal, "probe", lambda: terminal.TerminalInfo(True, colors=256))
+    assert media.terminal_capabilities() == media.Capabilities(art=True, color=False)
+
+
+def test_entering_the_dark_prefetches_the_grue(monkeypatch):
+    media._rendered.clear()
+    monkeypatch.setattr(media, "_override", media.PLAIN)
+    media.prefetch_for_location(dark=False)
+    assert not media._rendered
+    media.prefetch_for_location(dark=True)
+    assert ("grue_death", False, "utf-8", None) in media._rendered
+
+
+def test_session_art_is_cut_to_its_width():
+    writes = []
+    narrow = media.Capabilities(art=True, color=False, width=20)
+    assert media.present("grue_death", write=writes.append, capabilities=narrow) is True
+    lines = b"".join(writes).decode("utf-8").splitlines()
+    assert max(len(line) for line in lines) == 20
+
+
+def test_art_shows_inside_a_batched_turn(monkeypatch):
+    class Console(io.StringIO):
+        encoding = "utf-8"
+
+        def isatty(self):
+            return True
+
+        def fileno(self):
+            raise io.UnsupportedOperation("no descriptor")
+
+    monkeypatch.setenv("TERM", "xterm")
+    monkeypatch.delenv("EMERALD_NO_ART", raising=False)
+    monkeypatch.setattr(terminal, "curses", None)
+    monkeypatch.setattr(terminal, "_info", None)
+    monkeypatch.setattr(sys, "__stdout__", Console())
+    media.set_clock(media.BlockingClock(sleep=lambda seconds: None))
+    game = GameManager()
+    with game.output.collecting():
+        assert media.present("grue_death") is True
+    assert media.present("grue_death") is True
@@ -0,0 +1,92 @@
+"""Tests for per-session puzzle variants and their batch verifier."""
+
+import emerald_shadows.item_manager as item_module
+from emerald_shadows.config import INITIAL_GAME_STATE, PUZZLE_SEED_ENV, PUZZLE_VARIANTS_ENV
+from emerald_shadows.game_manager import GameManager
+from emerald_shadows.puzzles import PuzzleManager, PuzzleVariant, generate_variant
+from emerald_shadows.puzzles.variants import CLASSIC, session_variant
+from emerald_shadows.tools.puzzlegen import verify_batch, verify_variant
+
+VARIANT = PuzzleVariant("407.3", "LANTERN", 61, seed=5)
+
+
+def test_generation_is_deterministic_and_never_classic():
+    assert generate_variant(42) == generate_variant(42)
+    variants = {generate_variant(seed) for seed in range(200)}
+    assert len(variants) > 190
+    classic = (CLASSIC.frequency, CLASSIC.cipher_key, CLASSIC.warehouse)
+    assert all((v.frequency, v.cipher_key, v.warehouse) != classic for v in variants)
+
+
+def test_rewrite_swaps_answers_and_keeps_case():
+    text = "Tune 415.6. ANGELS, Angels, angels. Go to Warehouse 22 or WAREHOUSE 22."
+    assert VARIANT.rewrite(text) == (
+        "Tune 407.3. LANTERN, Lantern, lantern. Go to Warehouse 61 or WAREHOUSE 61."
+    )
+    assert CLASSIC.rewrite(text) == text
+
+
+def test_manifest_gains_a_clue_only_for_variants():
+    assert "Warehouse 61" in VARIANT.clue_text("manifest", "Cargo.")
+    assert "lantern" in VARIANT.clue_text("manifest", "Cargo.")
+    assert CLASSIC.clue_text("manifest", "Cargo.") == "Cargo."
+
+
+def test_puzzles_answer_to_the_variant():
+    manager = PuzzleManager(solution_provider=lambda location: answers[location], variant=VARIANT)
+    answers = {"warehouse_office": "415.6", "evidence_room": "angels", "underground_tunnels": "W-61"}
+    state = INITIAL_GAME_STATE.copy()
+    assert manager.handle_puzzle("warehouse_office", {"radio_manual"}, state) is False
+    answers["warehouse_office"] = "407.3"
+    assert manager.handle_puzzle("warehouse_office", {"radio_manual"}, state) is True
+    assert manager.handle_puzzle("evidence_room", {"cipher_wheel", "notebook"}, state) is False
+    assert manager.handle_puzzle("underground_tunnels", {"flashlight"}, state) is True
+
+
+def test_variant_survives_save_and_load():
+    manager = PuzzleManager(variant=VARIANT)
+    manager.solved_puzzles.add("warehouse_office")
+    restored = PuzzleManager()
+    restored.restore_state(manager.get_state())
+    assert restored.variant == VARIANT
+    assert restored.solved_puzzles == {"warehouse_office"}
+    assert restored.puzzles["warehouse_office"].attempt("407.3")[0]
+
+    # Saves from before variants were played with the classic answers
+    restored.restore_state({"solved_puzzles": []})
+    assert restored.variant == CLASSIC
+    assert "variant" not in restored.get_state()
+
+
+def test_environment_picks_the_session_variant(monkeypatch):
+    monkeypatch.delenv(PUZZLE_SEED_ENV, raising=False)
+    monkeypatch.delenv(PUZZLE_VARIANTS_ENV, raising=False)
+    assert session_variant() == CLASSIC
+    monkeypatch.setenv(PUZZLE_VARIANTS_ENV, "1")
+    assert not session_variant().is_classic
+    monkeypatch.setenv(PUZZLE_SEED_ENV, "99")
+    assert session_variant() == generate_variant(99)
+
+
+def test_examined_clues_match_the_game_variant(monkeypatch):
+    monkeypatch.setenv(PUZZLE_SEED_ENV, "3")
+    shown = []
+    monkeypatch.setattr(item_module, "print_text", lambda text, **_: shown.append(text))
+    game = GameManager()
+    variant = generate_variant(3)
+    game.item_manager.inventory.append("informant_note")
+    game.item_manager.examine_item("informant_note", [], game.game_state)
+    assert variant.frequency in shown[0]
+    assert "415.6" not in shown[0]
+
+
+def test_batch_verifier_passes_generated_variants():
+    report = verify_batch(300, seed=1000)
+    assert report.checked == 300
+    assert report.failures == {}
+    assert verify_variant(CLASSIC) == []
+
+
+def test_verifier_catches_a_variant_with_no_clue():
+    # The classic clues say Warehouse 22; nothing rewrites them for a classic seedless variant
+    assert "no clue gives warehouse 61" in verify_variant(PuzzleVariant("415.6", "ANGELS", 61))
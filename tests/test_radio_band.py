@@ -0,0 +1,120 @@
+"""Tests for tuning and scanning the radio band."""
+
+import wave
+
+import pytest
+
+import emerald_shadows.puzzles.radio_band as radio_band
+import emerald_shadows.puzzles.radio_puzzle as radio_module
+from emerald_shadows.config import PUZZLE_SOLUTIONS
+from emerald_shadows.game_manager import GameManager
+from emerald_shadows.puzzles import RadioPuzzle
+from emerald_shadows.puzzles.variants import CLASSIC, PuzzleVariant
+
+VARIANT = PuzzleVariant("407.3", "LANTERN", 61, seed=5)
+
+
+@pytest.fixture
+def shown(monkeypatch):
+    messages = []
+    monkeypatch.setattr(radio_module, "print_text", lambda text, **_: messages.append(text))
+    return messages
+
+
+def test_tune_and_scan_parse():
+    handler = GameManager().command_handler
+    assert handler.understand_command("tune radio to 415.6") == ("tune", "radio to 415.6")
+    assert handler.understand_command("tune to 415.6") == ("tune", "415.6")
+    assert handler.understand_command("scan") == ("scan", "")
+
+
+def test_tuning_needs_a_radio_and_a_frequency(shown):
+    game = GameManager()
+    game.process_command("tune 415.6")
+    assert game.last_command_failed
+    assert RadioPuzzle().tune("the big one") is False
+    assert RadioPuzzle().tune("512.0") is False
+    assert shown == [PUZZLE_SOLUTIONS["radio_puzzle"]["tune_what"]] * 2
+
+
+def test_without_numpy_the_band_explains_itself(monkeypatch, shown):
+    monkeypatch.setattr(radio_band, "np", None)
+    assert RadioPuzzle().scan("") is False
+    assert shown == [PUZZLE_SOLUTIONS["radio_puzzle"]["no_band"]]
+
+
+def test_a_scan_is_one_batched_render_that_peaks_on_the_station(monkeypatch):
+    pytest.importorskip("numpy")
+    band = radio_band.simulator(VARIANT)
+    calls = []
+    render = band.render
+    monkeypatch.setattr(band, "render", lambda *args, **kwargs: calls.append(args) or render(*args, **kwargs))
+    settings = radio_band.scan_frequencies(407.3, 1.0)
+    readings = band.scan(settings, at=10.0, seed=1)
+    assert len(calls) == 1 and len(readings) == 21
+    loudest = max(readings, key=lambda reading: reading.level)
+    assert loudest.frequency == 407.3 and loudest.keyed
+    assert readings[0].bars <= 1 and readings[0].description == "static"
+
+
+def test_meter_is_read_from_the_buffer():
+    numpy = pytest.importorskip("numpy")
+    band = radio_band.simulator(CLASSIC)
+    static = numpy.random.default_rng(3).standard_normal((1, 8000)).astype(numpy.float32) * radio_band.STATIC_LEVEL
+    reading = band.read([410.0], static)[0]
+    assert reading.bars == 0 and not reading.keyed
+    assert band.read([415.6], band.render([415.6], 2.0, at=3.0, seed=2))[0].bars >= 6
+
+
+def test_the_dance_band_is_not_taken_for_morse():
+    pytest.importorskip("numpy")
+    band = radio_band.simulator(CLASSIC)
+    music = next(station.frequency for station in band.stations if station.kind == "music")
+    for at in (0.0, 0.6, 1.3, 2.9, 41.7):
+        reading = band.tune(music, at=at, seed=4)
+        assert not reading.keyed
+        assert reading.description == "a dance band, of all things"
+    readings = band.scan(radio_band.scan_frequencies(music, 0.1), at=7.0, seed=5)
+    assert [reading.keyed for reading in readings] == [False, False, False]
+
+
+def test_tuning_in_copies_the_transmission_and_saves_audio(tmp_path, monkeypatch, shown):
+    pytest.importorskip("numpy")
+    path = tmp_path / "radio.wav"
+    monkeypatch.setenv("EMERALD_RADIO_WAV", str(path))
+    radio = RadioPuzzle(VARIANT)
+    assert radio.tune("tune the set to 407.3") is True
+    assert radio.dial == 407.3
+    assert "Morse" in shown[1]
+    assert shown[2].endswith(radio_band.simulator(VARIANT).stations[0].copy)
+    with wave.open(str(path)) as audio:
+        assert (audio.getnchannels(), audio.getsampwidth(), audio.getframerate()) == (1, 2, 8000)
+        assert audio.getnframes() == 8000 * 3
+
+
+@pytest.fixture
+def office(monkeypatch):
+    game = GameManager()
+    game.location_manager.current_location = "warehouse_office"
+    settings = []
+    tune, scan = RadioPuzzle.tune, RadioPuzzle.scan
+    monkeypatch.setattr(RadioPuzzle, "tune", lambda self, setting: settings.append(setting) or tune(self, setting))
+    monkeypatch.setattr(RadioPuzzle, "scan", lambda self, setting="": settings.append(setting) or scan(self, setting))
+    return game, settings
+
+
+def test_typed_frequencies_reach_the_radio_whole(monkeypatch, shown, office):
+    game, settings = office
+    monkeypatch.setattr(radio_band, "np", None)
+    game.handle_line("tune 415.6")
+    game.handle_line("scan 415.0-416.0")
+    assert settings == ["415.6", "415.0-416.0"]
+    assert shown == [PUZZLE_SOLUTIONS["radio_puzzle"]["no_band"]] * 2
+
+
+def test_tuning_a_typed_line(shown, office):
+    pytest.importorskip("numpy")
+    game, settings = office
+    assert game.handle_line("tune 415.6") is True
+    assert not game.last_command_failed
+    assert game.puzzle_manager.radio_at("warehouse_office").dial == 415.6
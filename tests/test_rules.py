@@ -0,0 +1,98 @@
+"""Tests for the compiled item rule engine."""
+
+import pytest
+
+from emerald_shadows.config import INITIAL_GAME_STATE
+from emerald_shadows.item_manager import ItemManager
+from emerald_shadows.rules import (
+    ITEM_RULEBOOK,
+    RuleError,
+    combination_key,
+    compile_rules,
+)
+
+
+@pytest.fixture
+def game_state():
+    return INITIAL_GAME_STATE.copy()
+
+
+# --- compilation ---
+
+def test_unknown_effect_is_rejected():
+    with pytest.raises(RuleError):
+        compile_rules([{"verb": "take", "item": "hat", "effects": [{"explode": True}]}])
+
+
+def test_unknown_hook_is_rejected():
+    with pytest.raises(RuleError):
+        compile_rules([{"verb": "take", "item": "hat", "effects": [{"call": "nope"}]}])
+
+
+def test_duplicate_rule_is_rejected():
+    rule = {"verb": "take", "item": "hat", "effects": []}
+    with pytest.raises(RuleError):
+        compile_rules([rule, rule])
+
+
+def test_list_entries_expand_to_one_key_each():
+    book = compile_rules([{"verb": "use", "item": ["a", "b"], "location": ["x", "y"], "effects": []}])
+    assert len(book) == 4
+
+
+# --- lookup ---
+
+def test_most_specific_rule_wins():
+    book = compile_rules([
+        {"verb": "use", "item": "*", "effects": [{"set_flag": "any"}]},
+        {"verb": "use", "item": "lamp", "effects": [{"set_flag": "lamp"}]},
+        {"verb": "use", "item": "lamp", "location": "cellar", "effects": [{"set_flag": "cellar"}]},
+    ])
+    state = {}
+    book.apply("use", "lamp", "cellar", None, state)
+    book.apply("use", "lamp", "attic", None, state)
+    book.apply("use", "rope", "attic", None, state)
+    assert state == {"cellar": True, "lamp": True, "any": True}
+
+
+def test_unless_guard_fires_once(game_state):
+    manager = ItemManager()
+    manager.inventory.append("informant_note")
+    manager.examine_item("informant_note", [], game_state)
+    manager.examine_item("informant_note", [], game_state)
+    assert game_state["score"] == 10
+
+
+# --- designer-authored content ---
+
+def test_new_rule_needs_no_code(game_state, capsys):
+    book = compile_rules([
+        {
+            "verb": "take",
+            "item": "matchbook",
+            "effects": [
+                {"set_flag": "found_matchbook"},
+                {"add_score": 3},
+                {"print": "A matchbook from the {item} drawer."},
+            ],
+        }
+    ])
+    manager = ItemManager(rules=book)
+    assert manager.take_item("matchbook", ["matchbook"], game_state) is True
+    assert game_state["found_matchbook"] is True
+    assert game_state["score"] == 3
+    assert "matchbook drawer" in capsys.readouterr().out
+
+
+def test_location_specific_use_rule(game_state):
+    manager = ItemManager()
+    manager.inventory.append("badge")
+    manager.use_item("badge", "police_station", game_state)
+    assert not game_state["ches_tip"]
+    manager.use_item("badge", "anchor_tavern", game_state)
+    assert game_state["ches_tip"] is True
+
+
+def test_combinations_compile_to_combine_rules():
+    assert ITEM_RULEBOOK.lookup("combine", combination_key(["notebook", "cipher_wheel"]))
+    assert ITEM_RULEBOOK.lookup("combine", combination_key(["badge", "binoculars"])) is None
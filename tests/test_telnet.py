@@ -0,0 +1,191 @@
+"""Tests for the telnet front end's negotiation and per-session geometry."""
+
+import logging
+import socket
+import sys
+import threading
+import zlib
+
+import pytest
+
+from emerald_shadows import media, telnet
+from emerald_shadows.game_manager import GameManager
+from emerald_shadows.telnet import (
+    COMPRESS2, DO, IAC, NAWS, SB, SE, TTYPE, TTYPE_IS, TTYPE_SEND, WILL, TelnetParser, TelnetSession,
+    play_session,
+)
+from emerald_shadows.utils import DisplayManager, SessionStdout, TerminalGeometry
+
+
+def naws(width, height):
+    return bytes([IAC, SB, NAWS, width >> 8, width & 0xFF, height >> 8, height & 0xFF, IAC, SE])
+
+
+def test_parser_passes_plain_data_through():
+    parser = TelnetParser(lambda reply: None)
+    assert parser.feed(b"look\r\n") == b"look\r\n"
+    assert parser.feed(b"a\xff\xffb") == b"a\xffb"
+
+
+def test_parser_records_window_size_split_across_packets():
+    parser = TelnetParser(lambda reply: None)
+    message = b"go" + naws(132, 50) + b" north"
+    assert parser.feed(message[:5]) + parser.feed(message[5:]) == b"go north"
+    assert (parser.geometry.width, parser.geometry.height) == (132, 50)
+
+
+def test_parser_asks_for_and_records_terminal_type():
+    replies = []
+    parser = TelnetParser(replies.append)
+    parser.feed(bytes([IAC, WILL, TTYPE]))
+    assert replies == [bytes([IAC, SB, TTYPE, TTYPE_SEND, IAC, SE])]
+    parser.feed(bytes([IAC, SB, TTYPE, TTYPE_IS]) + b"XTERM-256COLOR" + bytes([IAC, SE]))
+    assert parser.terminal_type == "xterm-256color"
+
+
+def test_session_reads_lines_and_capabilities():
+    server, client = socket.socketpair()
+    try:
+        session = TelnetSession(server)
+        client.sendall(b"take badge\r\x00look\r")
+        client.sendall(b"\n" + bytes([IAC, SB, TTYPE, TTYPE_IS]) + b"vt100" + bytes([IAC, SE]) + naws(70, 20) + b"x\n")
+        assert session.read_line() == "take badge"
+        assert session.read_line() == "look"
+        assert session.read_line() == "x"
+        capabilities = session.capabilities()
+        assert capabilities.color is False and capabilities.width == 70
+    finally:
+        media.use_session_capabilities(None)
+        server.close()
+        client.close()
+
+
+def test_wrapping_follows_the_session_geometry():
+    results = {}
+
+    def session(width):
+        DisplayManager.use_geometry(TerminalGeometry(width, 24))
+        results[width] = DisplayManager.wrap_text("word " * 40)
+
+    threads = [threading.Thread(target=session, args=(width,)) for width in (60, 100)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(len(line) for line in results[60].splitlines()) <= 60
+    assert max(len(line) for line in results[100].splitlines()) > 60
+
+
+def test_session_plays_a_game_at_the_clients_width(monkeypatch):
+    # Live log output suspends pytest's capture, which would swap stdout back
+    monkeypatch.setattr(logging, "info", lambda *args, **kwargs: None)
+    monkeypatch.setattr(sys, "stdout", SessionStdout(sys.stdout))
+    server, client = socket.socketpair()
+    player = threading.Thread(target=play_session, args=(server,))
+    player.start()
+    client.sendall(naws(60, 24) + b"look\r\nquit\r\nn\r\n")
+    received = bytearray()
+    while True:
+        data = client.recv(65536)
+        if not data:
+            break
+        received += data
+    player.join(timeout=5)
+    client.close()
+
+    assert received.startswith(bytes([IAC, WILL]))
+    text = received.decode("utf-8", errors="replace")
+    assert "Thanks for playing" in text
+    assert "bullpen" in text
+    # The client echoes typed commands itself, so output follows the prompt
+    lines = [line[2:] if line.startswith("> ") else line for line in text.split("\r\n")[1:]]
+    assert max(len(line) for line in lines) <= 60
+    assert media._session.get() is None
+
+
+def test_compressed_session_is_readable_at_every_turn(monkeypatch):
+    monkeypatch.setattr(logging, "info", lambda *args, **kwargs: None)
+    monkeypatch.setattr(sys, "stdout", SessionStdout(sys.stdout))
+    server, client = socket.socketpair()
+    client.settimeout(5)
+    player = threading.Thread(target=play_session, args=(server,))
+    player.start()
+    client.sendall(naws(80, 24) + bytes([IAC, DO, COMPRESS2]))
+
+    marker = bytes([IAC, SB, COMPRESS2, IAC, SE])
+    received = bytearray()
+    while marker not in received:
+        received += client.recv(65536)
+    decompressor = zlib.decompressobj()
+    text = decompressor.decompress(bytes(received[received.index(marker) + len(marker):])).decode()
+
+    # Each turn's output is flushed, so it decodes before the session ends
+    while not text.endswith("> "):
+        text += decompressor.decompress(client.recv(65536)).decode()
+    assert "bullpen" in text
+    client.sendall(b"look\r\n")
+    turn = ""
+    while not turn.endswith("> "):
+        turn += decompressor.decompress(client.recv(65536)).decode()
+    assert "bullpen" in turn
+
+    client.sendall(b"quit\r\nn\r\n")
+    while not decompressor.eof:
+        data = client.recv(65536)
+        if not data:
+            break
+        turn += decompressor.decompress(data).decode()
+    player.join(timeout=5)
+    client.close()
+    assert decompressor.eof
+    assert "Thanks for playing" in turn
+
+
+def play(sends):
+    """Play one session to the end, returning everything it sent as text."""
+    server, client = socket.socketpair()
+    player = threading.Thread(target=play_session, args=(server,))
+    player.start()
+    client.sendall(naws(80, 24) + sends)
+    received = bytearray()
+    while True:
+        data = client.recv(65536)
+        if not data:
+            break
+        received += data
+    player.join(timeout=5)
+    client.close()
+    return received.decode("utf-8", errors="replace")
+
+
+@pytest.fixture
+def sessions(monkeypatch, tmp_path):
+    monkeypatch.setattr(logging, "info", lambda *args, **kwargs: None)
+    monkeypatch.setattr(logging.getLogger("emerald_shadows.utils"), "disabled", True)  # logs each save
+    monkeypatch.setattr(sys, "stdout", SessionStdout(sys.stdout))
+    monkeypatch.setattr(telnet, "TELNET_SAVE_DIR", tmp_path)
+    return tmp_path
+
+
+def test_puzzle_solutions_are_read_from_the_session(monkeypatch, sessions):
+    monkeypatch.setattr("builtins.input", lambda *args: pytest.fail("read the server's stdin"))
+    init_managers = GameManager.init_managers
+
+    def at_pioneer_square(game):
+        init_managers(game)
+        game.location_manager.current_location = "pioneer_square"
+        game.item_manager.inventory.append("notebook")
+
+    monkeypatch.setattr(GameManager, "init_managers", at_pioneer_square)
+    text = play(b"solve\r\nwa 4471\r\nquit\r\nn\r\n")
+    assert "Enter solution for the puzzle at pioneer_square" in text
+    assert "registered to a shell company" in text
+
+
+def test_sessions_keep_their_saves_apart(sessions):
+    for _ in range(2):
+        assert "Game saved successfully" in play(b"save\r\n\r\nquit\r\nn\r\n")
+    saves = sorted(sessions.glob("*/manual_save.json"))
+    assert len(saves) == 2 and saves[0].parent != saves[1].parent
+    assert "can't contain" in play(b"save\r\n../../escaped\r\nquit\r\nn\r\n")
+    assert not list(sessions.parent.rglob("escaped.json"))
@@ -0,0 +1,69 @@
+"""Tests for terminal capability probing and control sequences."""
+
+import io
+
+import pytest
+
+from emerald_shadows import terminal
+from emerald_shadows.utils import DisplayManager
+
+
+class FakeTerminal(io.StringIO):
+    encoding = "UTF-8"
+
+    def isatty(self):
+        return True
+
+    def fileno(self):
+        raise io.UnsupportedOperation("no descriptor")
+
+
+@pytest.fixture(autouse=True)
+def fresh_probe():
+    terminal.reset()
+    yield
+    terminal.reset()
+
+
+def test_redirected_output_has_no_control_sequences():
+    info = terminal.probe(io.StringIO())
+    assert info.interactive is False
+    assert info.clear == "" and not info.cursor_control
+    assert info.cursor_to(3, 4) == ""
+
+
+def test_dumb_terminal_gets_no_sequences(monkeypatch):
+    monkeypatch.setenv("TERM", "dumb")
+    info = terminal.probe(FakeTerminal())
+    assert info.interactive and info.colors == 0 and info.clear == ""
+
+
+def test_ansi_fallback_without_terminfo(monkeypatch):
+    monkeypatch.setenv("TERM", "xterm")
+    monkeypatch.setattr(terminal, "curses", None)
+    info = terminal.probe(FakeTerminal())
+    assert info.utf8 and info.colors == 8
+    assert info.clear == terminal.ANSI_CLEAR
+    assert info.cursor_to(0, 9) == "\x1b[1;10H"
+
+
+def test_probe_runs_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(terminal, "probe", lambda: calls.append(1) or terminal.TerminalInfo(False))
+    for _ in range(3):
+        terminal.info()
+    assert calls == [1]
+
+
+def test_clear_screen_writes_one_sequence_without_a_shell(monkeypatch):
+    monkeypatch.setattr(terminal, "_info", terminal.TerminalInfo(True, clear="<clear>"))
+    monkeypatch.setattr("os.system", lambda command: pytest.fail("forked a shell"))
+    out = io.StringIO()
+    assert terminal.clear_screen(out) is True
+    assert out.getvalue() == "<clear>"
+
+
+def test_display_manager_falls_back_to_blank_lines(monkeypatch, capsys):
+    monkeypatch.setattr(terminal, "_info", terminal.TerminalInfo(False))
+    DisplayManager.clear_screen()
+    assert capsys.readouterr().out == "\n" * 101
@@ -0,0 +1,125 @@
+"""Tests for the full-screen mode's layout, input and output."""
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+import emerald_shadows.tui as tui_module
+from emerald_shadows import media
+from emerald_shadows.game_manager import GameManager
+from emerald_shadows.tui import Scrollback, TerminalUI, status_line
+
+
+class FakeScreen:
+    """Records drawing calls and plays back typed keys."""
+
+    def __init__(self, height=10, width=40, keys=()):
+        self.size = (height, width)
+        self.keys = list(keys)
+        self.drawn = []
+
+    def getmaxyx(self):
+        return self.size
+
+    def addstr(self, y, x, text, attr=0):
+        self.drawn.append((y, text))
+
+    def clrtoeol(self):
+        pass
+
+    def move(self, y, x):
+        pass
+
+    def refresh(self):
+        pass
+
+    def clear(self):
+        pass
+
+    def idlok(self, flag):
+        pass
+
+    def keypad(self, flag):
+        pass
+
+    def get_wch(self):
+        return self.keys.pop(0)
+
+
+@pytest.fixture()
+def ui(monkeypatch):
+    monkeypatch.setattr(tui_module, "shutil", SimpleNamespace(get_terminal_size=lambda fallback: (40, 10)))
+    ui = TerminalUI(GameManager())
+    ui.screen = FakeScreen()
+    ui.height, ui.width = ui.screen.getmaxyx()
+    return ui
+
+
+@pytest.fixture()
+def quiet(monkeypatch):
+    # Live log output suspends pytest's capture, which would undo the redirect
+    monkeypatch.setattr(logging, "info", lambda *args, **kwargs: None)
+
+
+def test_status_line_shows_location_score_and_stop():
+    game = GameManager()
+    assert status_line(game) == "Police Station  |  Score: 0"
+    game.location_manager.trolley.on_trolley = True
+    assert "Stop 1" in status_line(game)
+
+
+def test_scrollback_fills_from_top_and_pages():
+    scrollback = Scrollback()
+    scrollback.write("one\ntwo\n", width=20)
+    assert scrollback.view(3) == ["one", "two", ""]
+    scrollback.write("a line too long to fit\n", width=10)
+    assert scrollback.view(3) == ["a line too", " long to f", "it"]
+    scrollback.page(3, 3)
+    assert scrollback.view(3) == ["one", "two", "a line too"]
+
+
+def test_redraw_draws_status_pane_and_input_line(ui):
+    ui.scrollback.write("First line.\nSecond line.\n", ui.width - 1)
+    ui.typed = "l"
+    ui.redraw()
+    assert len(ui.screen.drawn) == ui.height
+    assert ui.screen.drawn[0][1].startswith("Police Station")
+    assert ui.screen.drawn[1:3] == [(1, "First line."), (2, "Second line.")]
+    assert ui.screen.drawn[-1] == (ui.height - 1, "> l")
+
+
+def test_read_line_edits_and_echoes(ui):
+    ui.screen.keys = list("lok") + ["\x7f", "o", "k", "\n"]
+    assert ui.read_line("> ") == "look"
+    assert ui.scrollback.view(2)[0] == "> look"
+
+
+def test_a_turn_lands_in_the_scrollback_and_status_bar(quiet, ui):
+    ui.screen.keys = list("take badge\n") + list("quit\n") + ["n", "\n"] + ["\n"]
+    ui.run(ui.screen)
+    shown = list(ui.scrollback.lines)
+    assert any("badge" in line for line in shown)
+    assert any("Thanks for playing" in line for line in shown)
+    assert "Score: 10" in ui.rows()[0]
+    assert ui.game.read_line is None
+
+
+def test_puzzle_solutions_are_typed_on_the_input_line(monkeypatch, quiet, ui):
+    monkeypatch.setattr("builtins.input", lambda *args: pytest.fail("read stdin behind the screen"))
+    ui.game.location_manager.current_location = "pioneer_square"
+    ui.game.item_manager.inventory.append("notebook")
+    ui.screen.keys = list("solve\n") + list("wa 4471\n") + list("quit\n") + ["n", "\n"] + ["\n"]
+    ui.run(ui.screen)
+    shown = "".join(ui.scrollback.lines)
+    assert "Enter solution for the puzzle at pioneer_square: wa 4471" in shown
+    assert "registered to a shell company" in shown
+
+
+def test_art_is_drawn_in_the_pane_as_one_still(monkeypatch, quiet, ui):
+    monkeypatch.setattr(media, "_clock", SimpleNamespace(animate=lambda *args: pytest.fail("animated")))
+    monkeypatch.setattr(ui.game, "handle_line", lambda line: media.present("grue_death") and False)
+    ui.screen.keys = ["\n", "\n"]
+    ui.run(ui.screen)
+    top = media.game_art.GRUE_ART.strip("\n").splitlines()[0]
+    assert top[:ui.width - 1] in ui.scrollback.lines
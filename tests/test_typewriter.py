@@ -0,0 +1,49 @@
+"""Tests for the frame-based typewriter effect."""
+
+import io
+
+from emerald_shadows.typewriter import Typewriter, plan_frames
+from emerald_shadows.utils import DisplayManager
+
+TEXT = "Rain hammered the windows of the precinct house. " * 20
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def test_frames_cover_the_text():
+    frames = plan_frames(TEXT, delay=0.03, frame_rate=12)
+    assert "".join(frames) == TEXT
+    assert len(frames[0]) == 3
+
+
+def test_writes_scale_with_frames_not_characters():
+    stream = CountingStream()
+    pauses = []
+    Typewriter(TEXT, delay=0.01, frame_rate=10).play(stream, lambda t: pauses.append(t) or False)
+    assert stream.getvalue() == TEXT
+    assert stream.writes == len(TEXT) // 10
+    assert abs(pauses[0] - 0.1) < 1e-9
+
+
+def test_keypress_dumps_the_rest_in_one_write():
+    stream = CountingStream()
+    waits = iter([False, True])
+    writer = Typewriter(TEXT, delay=0.03)
+    writer.play(stream, lambda t: next(waits))
+    assert stream.getvalue() == TEXT
+    assert stream.writes == 3
+    assert writer.skipped
+
+
+def test_print_text_with_delay_uses_frames(monkeypatch, capsys):
+    monkeypatch.setattr("emerald_shadows.typewriter.time.sleep", lambda t: None)
+    DisplayManager.print_text("Hello, Seattle.", delay=0.03, wrap=False)
+    assert capsys.readouterr().out == "Hello, Seattle.\n"
@@ -1,11 +1,13 @@
 """Tests for utils module: SaveLoadManager and DisplayManager."""
 
 import json
+import signal
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
-from emerald_shadows.utils import SaveLoadManager, DisplayManager
+from emerald_shadows.utils import BatchedOutput, SaveLoadManager, DisplayManager
 from emerald_shadows.config import INITIAL_GAME_STATE
 
 
@@ -105,6 +107,13 @@ def test_delete_nonexistent_save(save_manager):
     assert save_manager.delete_save("ghost") is False
 
 
+@pytest.mark.parametrize("name", ["../escaped", "sub/escaped", "..\\escaped", "C:escaped"])
+def test_save_names_stay_inside_the_save_dir(save_manager, save_dir, name):
+    assert save_manager.save_game(_make_game_instance(), name) is False
+    assert not list(save_dir.parent.rglob("escaped.json"))
+    assert save_manager.load_game(_make_game_instance(), name) is False
+
+
 # --- DisplayManager ---
 
 def test_get_terminal_size_returns_ints():
@@ -127,12 +136,70 @@ def test_wrap_text_handles_empty_string():
     assert isinstance(result, str)
 
 
+def test_wrap_text_reuses_wrapped_output(monkeypatch):
+    import emerald_shadows.utils as utils_module
+
+    calls = []
+    real_fill = utils_module.textwrap.fill
+    monkeypatch.setattr(utils_module.textwrap, "fill", lambda *a, **k: calls.append(1) or real_fill(*a, **k))
+    DisplayManager.invalidate_layout()
+    text = "A description long enough to be worth keeping around between turns."
+    first = DisplayManager.wrap_text(text, width=60)
+    assert DisplayManager.wrap_text(text, width=60) == first
+    assert len(calls) == 1
+    DisplayManager.wrap_text(text, width=70)
+    assert len(calls) == 2
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="no SIGWINCH on this platform")
+def test_terminal_size_is_cached_until_resize(monkeypatch):
+    import emerald_shadows.utils as utils_module
+
+    sizes = iter([(100, 40), (70, 30)])
+    handlers = []
+    monkeypatch.setattr(utils_module, "shutil", SimpleNamespace(get_terminal_size=lambda: next(sizes)))
+    monkeypatch.setattr(utils_module, "signal", SimpleNamespace(
+        SIGWINCH=signal.SIGWINCH,
+        getsignal=lambda signum: signal.SIG_DFL,
+        signal=lambda signum, handler: handlers.append(handler),
+    ))
+    monkeypatch.setattr(DisplayManager, "_watching_resize", False)
+    monkeypatch.setattr(DisplayManager, "_cached_size", None)
+
+    assert DisplayManager.watch_terminal_resize() is True
+    assert DisplayManager.get_terminal_size() == (100, 40)
+    assert DisplayManager.get_terminal_size() == (100, 40)
+    handlers[0](signal.SIGWINCH, None)
+    assert DisplayManager.get_terminal_size() == (70, 30)
+
+
 def test_print_text_outputs_to_stdout(capsys):
     DisplayManager.print_text("Hello, Seattle.", wrap=False)
     out = capsys.readouterr().out
     assert "Hello, Seattle." in out
 
 
+def test_batched_output_writes_once_per_outermost_block():
+    target = MagicMock()
+    output = BatchedOutput(target)
+    with output.collecting():
+        print("first")
+        with output.collecting():
+            print("second")
+        target.write.assert_not_called()
+    target.write.assert_called_once_with("first\nsecond\n")
+
+
+def test_batched_output_flushes_before_prompt():
+    target = MagicMock()
+    output = BatchedOutput(target)
+    with output.collecting():
+        print("The bartender waits.")
+        output.flush()
+        target.write.assert_called_once_with("The bartender waits.\n")
+    target.write.assert_called_once()
+
+
 def test_format_location_description_includes_exits():
     desc = DisplayManager.format_location_description(
         "A dark alley.", ["north", "south"], []
@@ -0,0 +1,116 @@
+"""Tests for the vehicle registry and tracing plates from Pioneer Square."""
+
+import pytest
+
+import emerald_shadows.puzzles.car_puzzle as car_module
+import emerald_shadows.puzzles.vehicle_registry as vehicle_registry
+from emerald_shadows.game_manager import GameManager
+from emerald_shadows.puzzles.vehicle_registry import QueryError, VehicleRegistry, normalize_pattern, parse_query
+
+
+@pytest.fixture(scope="module")
+def registry():
+    return VehicleRegistry(20_000, seed=7)
+
+
+@pytest.fixture
+def shown(monkeypatch, registry):
+    monkeypatch.setattr(vehicle_registry, "_shared", registry)
+    messages = []
+    monkeypatch.setattr(car_module, "print_text", lambda text, **_: messages.append(text))
+    return messages
+
+
+@pytest.mark.parametrize("plate, make, owner", [
+    ("7?3-K*", None, None),
+    ("WA-44??", None, None),
+    ("*71", None, None),
+    ("?B-*9", "ford", None),
+    ("*", "Hudson", "sullivan"),
+    ("*K*", None, "Yesler"),
+    ("A*Z", None, None),
+    ("??Z-?9?", None, None),
+    ("??3-?9?", None, None),
+    ("*-K*", None, None),
+    ("*4?7*", None, None),
+    ("?*", None, None),
+])
+def test_indexed_traces_agree_with_reading_every_registration(registry, plate, make, owner):
+    expected = registry.scan(plate, make, owner, limit=len(registry))
+    assert registry.search(plate, make, owner, limit=len(registry)) == expected
+
+
+def test_traces_only_check_the_smallest_index(registry):
+    candidates = list(registry._candidates("7?3-K*", None, None))
+    assert 0 < len(candidates) < len(registry) // 100
+    assert list(registry._candidates("WA-44*", None, None)) == [
+        record for record in registry._by_plate if registry.plate(record).startswith("WA-44")
+    ]
+
+
+@pytest.mark.parametrize("plate", ["??3-?9?", "*9?", "*-K*", "*4?7*", "?4*-*"])
+def test_patterns_without_a_long_literal_stay_indexed(registry, plate):
+    # No literal run of three characters to look up, and wildcards at both ends
+    assert len(list(registry._candidates(plate, None, None))) < len(registry) // 4
+
+
+@pytest.mark.parametrize("plate", ["*-*-*", "*--*", "??Z-?9?", "A*Z"])
+def test_patterns_no_plate_fits_read_no_index(registry, monkeypatch, plate):
+    monkeypatch.setattr(registry, "_candidates", lambda *args: pytest.fail("read an index"))
+    assert registry.search(plate, limit=len(registry)) == []
+
+
+def test_a_trace_checking_too_many_registrations_asks_for_more(registry, shown):
+    checked = len(list(registry._candidates("*0*0*0*0*", None, None)))
+    assert checked > 1000
+    with pytest.raises(QueryError, match="more of the plate"):
+        registry.search("*0*0*0*0*", limit=len(registry), max_checks=1000)
+    assert registry.search("*0*0*0*0*", limit=len(registry), max_checks=checked) == registry.scan(
+        "*0*0*0*0*", limit=len(registry))
+    assert car_module.CarPuzzle().trace("*-*-*") is True
+    assert "Nothing on file" in shown[-1]
+
+
+def test_the_smugglers_truck_is_always_on_file(registry):
+    truck = registry.lookup("wa 4471")
+    assert truck.make == "Ford" and truck.color == "blue" and truck.body == "sedan delivery"
+    assert registry.search(owner=vehicle_registry.SHELL_COMPANY) == [truck]
+    assert registry.lookup("WA-44*") is None
+
+
+def test_registrations_are_distinct_and_repeatable(registry):
+    plates = [registry.plate(record) for record in range(len(registry))]
+    assert len(set(plates)) == len(plates)
+    assert VehicleRegistry(1_000, seed=7).plate(0) == VehicleRegistry(1_000, seed=7).plate(0)
+    with pytest.raises(ValueError):
+        VehicleRegistry(10)
+
+
+def test_patterns_and_queries_are_normalized():
+    assert normalize_pattern(" wa 44** ") == "WA-44*"
+    assert normalize_pattern("") == "*"
+    with pytest.raises(QueryError):
+        normalize_pattern("wa-44%")
+    assert parse_query("plate 7?3-k* make ford owner mary o'brien") == ("7?3-k*", "ford", "mary o'brien")
+    assert parse_query("by sullivan") == ("*", None, "sullivan")
+
+
+def test_trace_needs_the_call_box(shown):
+    game = GameManager()
+    assert game.command_handler.understand_command("trace 7?3-k* make ford") == ("trace", "7?3-k* make ford")
+    game.process_command("trace wa-44??")
+    assert game.last_command_failed
+    game.location_manager.current_location = "pioneer_square"
+    game.process_command("trace wa 44??")
+    assert not game.last_command_failed
+    assert shown[0].endswith("'WA-44??' down the line to the Department of Licenses.")
+    assert any(line.strip().startswith("WA-4471  1941 Ford sedan delivery, blue") for line in shown)
+    assert "underline" in shown[-1]
+
+
+def test_trace_asks_for_something_to_trace(shown):
+    puzzle = car_module.CarPuzzle()
+    assert puzzle.trace("") is False
+    assert puzzle.trace("wa-44%") is False
+    assert puzzle.trace("make packard owner nobody") is True
+    assert "Nothing on file" in shown[-1]
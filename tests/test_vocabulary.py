@@ -0,0 +1,86 @@
+"""Tests for typo-tolerant vocabulary matching."""
+
+import pytest
+
+import emerald_shadows.game_manager as game_manager_module
+from emerald_shadows.commands.natural_commands import NaturalCommandHandler
+from emerald_shadows.commands.vocabulary import BKTree, Vocabulary, edit_distance
+from emerald_shadows.game_manager import GameManager
+
+
+@pytest.fixture
+def game_manager(monkeypatch):
+    monkeypatch.setattr(game_manager_module, "print_text", lambda text, **_: None)
+    return GameManager()
+
+
+# --- BK-tree ---
+
+def test_edit_distance():
+    assert edit_distance("examine", "exmaine") == 2
+    assert edit_distance("wheel", "wheel") == 0
+    assert edit_distance("", "abc") == 3
+
+
+def test_bk_tree_search_matches_brute_force():
+    words = ["examine", "exits", "take", "drop", "combine", "cipher wheel", "cipher", "notebook"]
+    tree = BKTree(words)
+    assert len(tree) == len(words)
+    for query in ["exmaine", "cypher wheel", "notbook", "xyz"]:
+        expected = sorted((edit_distance(query, w), w) for w in words if edit_distance(query, w) <= 2)
+        assert tree.search(query, 2) == expected
+
+
+# --- vocabulary ---
+
+def test_spaced_and_misspelt_item_names_resolve():
+    vocabulary = Vocabulary()
+    scope = ["cipher_wheel", "notebook"]
+    assert vocabulary.resolve("cipher wheel", scope) == "cipher_wheel"
+    assert vocabulary.resolve("cypher wheel", scope) == "cipher_wheel"
+    assert vocabulary.resolve("Notebok", scope) == "notebook"
+
+
+def test_resolution_is_scoped_to_what_is_visible():
+    vocabulary = Vocabulary()
+    vocabulary.resolve("cipher wheel", ["cipher_wheel"])
+    assert vocabulary.resolve("cypher wheel", ["notebook"]) is None
+
+
+def test_correct_word_is_not_corrected_into_another():
+    vocabulary = Vocabulary(nouns=["east", "west"])
+    assert vocabulary.resolve("east", ["west"]) is None
+
+
+def test_ties_are_not_guessed():
+    vocabulary = Vocabulary()
+    assert vocabulary.resolve("note_3", ["note_1", "note_2"]) is None
+
+
+def test_misspelt_verb_is_corrected():
+    handler = NaturalCommandHandler()
+    assert handler.understand_command("exmaine cypher wheel") == ("", "")
+    assert handler.understand_with_corrections("exmaine cypher wheel") == ("examine", "cypher wheel")
+    assert handler.understand_with_corrections("kick the door") == ("", "")
+
+
+# --- in play ---
+
+def test_take_and_examine_with_typos(game_manager, monkeypatch):
+    lm = game_manager.location_manager
+    location = lm.locations[lm.current_location]
+    location.items.append("cipher_wheel")
+    examined = []
+    monkeypatch.setattr(game_manager.item_manager, "examine_item", lambda item, *a, **k: examined.append(item))
+
+    game_manager.process_command("take cipher wheel")
+    assert "cipher_wheel" in game_manager.item_manager.inventory
+    game_manager.process_command("exmaine cypher wheel")
+    assert examined == ["cipher_wheel"]
+
+
+def test_misspelt_exit_moves(game_manager):
+    lm = game_manager.location_manager
+    assert "upstairs" in lm.get_valid_exits()
+    game_manager.process_command("upstars")
+    assert lm.current_location != "police_station"
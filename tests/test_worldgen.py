@@ -0,0 +1,62 @@
+"""Tests for the synthetic world generator."""
+
+import pytest
+
+from emerald_shadows.content import build_content
+from emerald_shadows.location_manager import LocationManager
+from emerald_shadows.tools.worldgen import (
+    START_ROOM,
+    generate_items,
+    generate_world,
+    iter_world,
+    room_name,
+)
+
+
+@pytest.fixture
+def world():
+    return generate_world(500)
+
+
+def test_world_has_requested_size(world):
+    assert len(world) == 500
+
+
+def test_world_is_deterministic():
+    assert generate_world(100, seed=3) == generate_world(100, seed=3)
+
+
+def test_world_passes_content_validation(world):
+    content = build_content(world, generate_items(500), start=START_ROOM)
+    assert len(content.locations) == 500
+
+
+def test_world_contains_every_feature(world):
+    rooms = world.values()
+    assert any(room["items"] for room in rooms)
+    assert any(room.get("dark") for room in rooms)
+    assert any(room.get("requires") for room in rooms)
+    assert sum("next" in room["exits"] for room in rooms) >= 2
+
+
+def test_every_item_has_a_description(world):
+    items = generate_items(500)
+    for room in world.values():
+        for item in room["items"]:
+            assert item in items
+
+
+def test_iter_world_rejects_empty_world():
+    with pytest.raises(ValueError):
+        next(iter_world(0))
+
+
+def test_location_manager_runs_on_generated_world(world):
+    manager = LocationManager(build_content(world, generate_items(500), start=START_ROOM))
+    assert manager.current_location == START_ROOM
+    path = manager.find_path(room_name(499))
+    assert path
+
+    for direction in path:
+        manager.current_location = manager.locations[manager.current_location].exits[direction]
+    assert manager.current_location == room_name(499)